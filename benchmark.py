@@ -0,0 +1,35 @@
+import argparse
+import sys
+from benchmarks.hot_paths import (SCALES, DEFAULT_LATENCY_THRESHOLD, run_benchmarks, compare,
+                                  format_results, save_results, load_results)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the service hot paths against the local PostgreSQL database.")
+    parser.add_argument("--scales", nargs="+", choices=list(SCALES), default=["small"],
+                        help="Data sets to generate and benchmark (each one drops and reloads the database)")
+    parser.add_argument("--reuse", action="store_true", help="Benchmark the data already loaded instead")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed calls per benchmark")
+    parser.add_argument("--warmup", type=int, default=20, help="Untimed calls before measuring")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="benchmark_results.json", help="Where to write the JSON results")
+    parser.add_argument("--compare", help="Baseline JSON; exit with status 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_LATENCY_THRESHOLD,
+                        help="Allowed p95 slowdown before it counts as a regression (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.scales, args.iterations, args.warmup, args.seed, args.reuse)
+    save_results(results, args.output)
+    print(format_results(results))
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        regressions = compare(results, load_results(args.compare), args.threshold)
+        if regressions:
+            print("\n--- REGRESSIONS ---")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions against the baseline.")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
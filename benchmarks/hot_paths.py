@@ -0,0 +1,307 @@
+import json
+import platform
+import random
+import subprocess
+import time as clock
+from datetime import date, time, timedelta, datetime
+from typing import Dict, Any, List, Callable
+
+from sqlalchemy import select, func, text
+from database.connection import SessionLocal, engine, Base
+from database import instrumentation
+from database.schema_extras import create_schema_extras, drop_schema_extras
+from database.synthetic_data import SyntheticDataGenerator, FIRST_NAMES, LAST_NAMES
+from models.member import Member
+from models.trainer import Trainer
+from models.room import Room
+from models.group_class import GroupClass
+from services.admin_service import AdminService
+from services.member_service import MemberService
+from services.trainer_service import TrainerService
+from services.availability import AvailabilityEngine
+from services.dashboard import dashboard_cache
+from services.reference_data import reference_data
+
+# Data scales (SyntheticDataGenerator arguments)
+SCALES = {
+    "small": {"members": 10_000, "trainers": 50, "rooms": 30, "days": 90},
+    "medium": {"members": 100_000, "trainers": 300, "rooms": 150, "days": 365},
+    "large": {"members": 500_000, "trainers": 600, "rooms": 300, "days": 365},
+}
+
+PERCENTILES = (50, 90, 95, 99)
+
+# A benchmark regresses when p95 latency grows by more than this fraction...
+DEFAULT_LATENCY_THRESHOLD = 0.20
+# ...or when it issues more queries per call than the baseline
+QUERY_COUNT_TOLERANCE = 0.01
+
+def percentile(sorted_samples: List[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, int(round(p / 100 * len(sorted_samples))))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+def summarize(samples: List[float], queries: int) -> Dict[str, Any]:
+    ordered = sorted(samples)
+    total = sum(ordered)
+    result = {
+        "calls": len(ordered),
+        "mean_ms": round(total / len(ordered) * 1000, 3) if ordered else 0,
+        "max_ms": round(ordered[-1] * 1000, 3) if ordered else 0,
+        "queries_per_call": round(queries / len(ordered), 2) if ordered else 0,
+        "throughput_per_s": round(len(ordered) / total, 1) if total else 0,
+    }
+    for p in PERCENTILES:
+        result[f"p{p}_ms"] = round(percentile(ordered, p) * 1000, 3)
+    return result
+
+# Latency benchmarks for the service hot paths
+class HotPathBenchmark:
+    """
+    Times the hot service methods against whatever data is in the database.
+    Each call runs on a clean session (like one menu action); queries per
+    call come from database.instrumentation. Read paths run cold: the
+    dashboard and member search caches are cleared before every call, and a
+    cached dashboard variant is reported separately.
+
+    Write benchmarks book slots after the last scheduled day, so they never
+    collide with the generated schedule, and leave their rows behind.
+    """
+
+    def __init__(self, iterations: int = 200, warmup: int = 20, seed: int = 42):
+        self.iterations = iterations
+        self.warmup = warmup
+        self.rng = random.Random(seed)
+        self.db = SessionLocal()
+        availability = AvailabilityEngine(self.db)
+        self.admin = AdminService(self.db, availability)
+        self.members = MemberService(self.db, availability)
+        self.trainers = TrainerService(self.db, availability)
+
+        self.member_ids = self.db.execute(select(Member.member_id)).scalars().all()
+        self.trainer_ids = self.db.execute(select(Trainer.trainer_id).order_by(Trainer.trainer_id)).scalars().all()
+        self.rooms = self.db.execute(select(Room.room_id, Room.capacity).order_by(Room.room_id)).all()
+        first_day, last_day = self.db.execute(
+            select(func.min(GroupClass.scheduled_date), func.max(GroupClass.scheduled_date))
+        ).one()
+        self.first_day = first_day or date.today()
+        self.last_day = last_day or date.today()
+        self.next_free_day = self.last_day + timedelta(days=30)
+        self.db.close()
+
+        if not (self.member_ids and self.trainer_ids and self.rooms):
+            raise ValueError("Benchmarks need members, trainers and rooms; generate data first.")
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        was_enabled = instrumentation.is_enabled()
+        instrumentation.enable()
+        try:
+            return {
+                "create_group_class": self._bench_create_group_class(),
+                "reschedule_class": self._bench_reschedule_class(),
+                "register_for_group_class": self._bench_register_for_group_class(),
+                "schedule_pt_session": self._bench_schedule_pt_session(),
+                "get_member_dashboard_data": self._bench_dashboard(cached=False),
+                "get_member_dashboard_data[cached]": self._bench_dashboard(cached=True),
+                "get_trainer_schedule": self._bench_trainer_schedule(),
+                "search_members": self._bench_search_members(),
+            }
+        finally:
+            if not was_enabled:
+                instrumentation.disable()
+            self.db.close()
+
+    def _measure(self, method: str, calls: List[Callable], before_each: Callable = None) -> Dict[str, Any]:
+        """Run warmup calls, then time the rest; `method` is the instrumented name."""
+        for call in calls[:self.warmup]:
+            if before_each:
+                before_each()
+            call()
+            self.db.close()
+
+        instrumentation.reset()
+        samples = []
+        for call in calls[self.warmup:]:
+            if before_each:
+                before_each()
+            started = clock.perf_counter()
+            call()
+            samples.append(clock.perf_counter() - started)
+            self.db.close()
+
+        queries = instrumentation.snapshot().get(method, {}).get("queries", 0)
+        return summarize(samples, queries)
+
+    def _total(self) -> int:
+        return self.warmup + self.iterations
+
+    def _fresh_slots(self, n: int):
+        """n (trainer_id, room_id, date) triples no booking uses yet (all at 09:00-10:00)."""
+        per_day = min(len(self.trainer_ids), len(self.rooms))
+        slots = []
+        for i in range(n):
+            day = self.next_free_day + timedelta(days=i // per_day)
+            slots.append((self.trainer_ids[i % per_day], self.rooms[i % per_day], day))
+        self.next_free_day += timedelta(days=n // per_day + 1)
+        return slots
+
+    # --- Writes ---
+    def _bench_create_group_class(self):
+        calls = [
+            (lambda t=t, r=r, d=d: self.admin.create_group_class(
+                "Benchmark Class", t, r.room_id, d, time(9), time(10), r.capacity))
+            for t, r, d in self._fresh_slots(self._total())
+        ]
+        return self._measure("AdminService.create_group_class", calls)
+
+    def _bench_reschedule_class(self):
+        classes = [
+            (self.admin.create_group_class("Benchmark Class", t, r.room_id, d, time(9), time(10), r.capacity).class_id, d)
+            for t, r, d in self._fresh_slots(self._total())
+        ]
+        self.db.close()
+        # Move each class an hour later on the same day; its own slot is excluded from the check
+        calls = [(lambda c=c, d=d: self.admin.reschedule_class(c, d, time(10), time(11))) for c, d in classes]
+        return self._measure("AdminService.reschedule_class", calls)
+
+    def _bench_register_for_group_class(self):
+        total = self._total()
+        members = self.rng.sample(self.member_ids, min(total, len(self.member_ids)))
+        class_ids = []
+        seats = 0
+        for t, r, d in self._fresh_slots(len(self.trainer_ids)):
+            if seats >= len(members):
+                break
+            class_ids.extend([self.admin.create_group_class(
+                "Benchmark Class", t, r.room_id, d, time(9), time(10), r.capacity
+            ).class_id] * r.capacity)
+            seats += r.capacity
+        self.db.close()
+        calls = [(lambda m=m, c=c: self.members.register_for_group_class(m, c)) for m, c in zip(members, class_ids)]
+        return self._measure("MemberService.register_for_group_class", calls)
+
+    def _bench_schedule_pt_session(self):
+        calls = [
+            (lambda t=t, r=r, d=d: self.members.schedule_pt_session(
+                self.rng.choice(self.member_ids), t, r.room_id, d, time(9), time(10), "Benchmark"))
+            for t, r, d in self._fresh_slots(self._total())
+        ]
+        return self._measure("MemberService.schedule_pt_session", calls)
+
+    # --- Reads ---
+    def _bench_dashboard(self, cached: bool):
+        member_ids = [self.rng.choice(self.member_ids) for _ in range(self._total())]
+        if cached:
+            for member_id in set(member_ids):
+                self.members.get_member_dashboard_data(member_id)
+            self.db.close()
+        calls = [(lambda m=m: self.members.get_member_dashboard_data(m)) for m in member_ids]
+        return self._measure("MemberService.get_member_dashboard_data", calls,
+                             None if cached else dashboard_cache.clear)
+
+    def _bench_trainer_schedule(self):
+        span = max((self.last_day - self.first_day).days - 7, 0)
+        calls = []
+        for _ in range(self._total()):
+            start = self.first_day + timedelta(days=self.rng.randint(0, span))
+            trainer_id = self.rng.choice(self.trainer_ids)
+            calls.append(lambda t=trainer_id, s=start: self.trainers.get_trainer_schedule(t, s, s + timedelta(days=7)))
+        return self._measure("TrainerService.get_trainer_schedule", calls)
+
+    def _bench_search_members(self):
+        terms = []
+        for _ in range(self._total()):
+            name = self.rng.choice(FIRST_NAMES + LAST_NAMES)
+            # Mix of full words and prefixes, as typed at the front desk
+            terms.append(name if self.rng.random() < 0.5 else name[:max(3, len(name) - 2)])
+        calls = [(lambda q=q: self.trainers.search_members(q)) for q in terms]
+        return self._measure("TrainerService.search_members", calls, self.trainers.member_search.invalidate)
+
+# Running and comparing
+def load_scale(scale: str, seed: int = 42):
+    """Drop everything, generate the given data scale and apply the schema extras."""
+    print(f"--- Loading '{scale}' data set ---")
+    # The extras depend on the model tables, so they go first
+    drop_schema_extras()
+    Base.metadata.drop_all(bind=engine)
+    SyntheticDataGenerator(seed=seed, **SCALES[scale]).run()
+    create_schema_extras()
+    dashboard_cache.clear()
+    reference_data.invalidate()
+
+def run_benchmarks(scales: List[str], iterations: int = 200, warmup: int = 20,
+                   seed: int = 42, reuse: bool = False) -> Dict[str, Any]:
+    """
+    Benchmark each scale in turn. With reuse=True the data already in the
+    database is benchmarked once, reported under the scale name "current".
+    """
+    results = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "postgres": _server_version(),
+            "iterations": iterations,
+            "warmup": warmup,
+            "seed": seed,
+            "scales": {s: SCALES[s] for s in scales} if not reuse else {},
+        },
+        "results": {},
+    }
+    for scale in (["current"] if reuse else scales):
+        if not reuse:
+            load_scale(scale, seed)
+        print(f"--- Benchmarking '{scale}' ---")
+        results["results"][scale] = HotPathBenchmark(iterations, warmup, seed).run()
+    return results
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any],
+            threshold: float = DEFAULT_LATENCY_THRESHOLD) -> List[str]:
+    """Regressions of `current` against `baseline` (same scale and benchmark only)."""
+    regressions = []
+    for scale, benchmarks in current["results"].items():
+        for name, now in benchmarks.items():
+            before = baseline.get("results", {}).get(scale, {}).get(name)
+            if not before:
+                continue
+            if before["p95_ms"] and now["p95_ms"] > before["p95_ms"] * (1 + threshold):
+                regressions.append(f"{scale}/{name}: p95 {before['p95_ms']}ms -> {now['p95_ms']}ms")
+            if now["queries_per_call"] > before["queries_per_call"] + QUERY_COUNT_TOLERANCE:
+                regressions.append(
+                    f"{scale}/{name}: queries/call {before['queries_per_call']} -> {now['queries_per_call']}"
+                )
+    return regressions
+
+def format_results(results: Dict[str, Any]) -> str:
+    lines = []
+    for scale, benchmarks in results["results"].items():
+        lines.append(f"\n[{scale}]")
+        lines.append(f"{'Benchmark':<36} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'Q/call':>7} {'ops/s':>8}")
+        for name, r in benchmarks.items():
+            lines.append(f"{name:<36} {r['p50_ms']:>9} {r['p95_ms']:>9} {r['p99_ms']:>9} "
+                         f"{r['queries_per_call']:>7} {r['throughput_per_s']:>8}")
+    return "\n".join(lines)
+
+def save_results(results: Dict[str, Any], path: str):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+def _git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _server_version():
+    try:
+        with engine.connect() as conn:
+            return conn.execute(text("SHOW server_version")).scalar()
+    except Exception:
+        return None
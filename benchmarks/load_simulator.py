@@ -0,0 +1,269 @@
+import multiprocessing
+import random
+import time as clock
+from datetime import date, time, timedelta, datetime
+from typing import Dict, Any, List
+
+from sqlalchemy import select, func, text
+from sqlalchemy.orm import sessionmaker
+from database.connection import DATABASE_URL, SessionLocal, create_db_engine
+from models.member import Member
+from models.trainer import Trainer
+from models.room import Room
+from models.group_class import GroupClass
+from services.admin_service import AdminService
+from services.member_service import MemberService
+from benchmarks.hot_paths import percentile
+
+# SQLSTATEs worth counting separately
+DEADLOCK = "40P01"
+SERIALIZATION_FAILURE = "40001"
+# Exclusion constraint or the room availability trigger (RAISE EXCEPTION)
+BOOKING_REJECTED = ("23P01", "P0001")
+
+OUTCOMES = ("ok", "rejected", "conflict", "deadlock", "serialization_failure", "error")
+
+def _sqlstate(exc: BaseException):
+    while exc is not None:
+        state = getattr(getattr(exc, "orig", None), "sqlstate", None)
+        if state:
+            return state
+        exc = exc.__cause__
+    return None
+
+def classify(exc: BaseException) -> str:
+    """Map an exception from a service call to one of OUTCOMES."""
+    state = _sqlstate(exc)
+    if state == DEADLOCK:
+        return "deadlock"
+    if state == SERIALIZATION_FAILURE:
+        return "serialization_failure"
+    if state in BOOKING_REJECTED:
+        return "conflict"
+    if isinstance(exc, ValueError):
+        return "rejected"
+    return "error"
+
+def _worker(config: Dict[str, Any], worker_id: int) -> List[tuple]:
+    """
+    One simulated member client: its own engine (one connection) and session.
+    Returns (operation, outcome, latency seconds) per call.
+    """
+    engine = create_db_engine(config["url"], pool_size=1, max_overflow=0)
+    db = sessionmaker(bind=engine, autoflush=False)()
+    service = MemberService(db)
+    rng = random.Random(f"{config['seed']}:{worker_id}")
+    results = []
+
+    # Start together so the peak is real
+    clock.sleep(max(0.0, config["start_at"] - clock.time()))
+    deadline = clock.time() + config["duration"]
+    try:
+        while clock.time() < deadline and len(results) < config["max_ops"]:
+            member_id = rng.choice(config["member_ids"])
+            if rng.random() < config["pt_ratio"]:
+                operation = "schedule_pt_session"
+                trainer_id, room_id, sched_date, start, end = rng.choice(config["pt_slots"])
+                call = lambda: service.schedule_pt_session(member_id, trainer_id, room_id, sched_date, start, end)
+            else:
+                operation = "register_for_group_class"
+                class_id = rng.choice(config["class_ids"])
+                call = lambda: service.register_for_group_class(member_id, class_id)
+
+            started = clock.perf_counter()
+            try:
+                call()
+                outcome = "ok"
+            except Exception as e:
+                db.rollback()
+                outcome = classify(e)
+            results.append((operation, outcome, clock.perf_counter() - started))
+            db.close()
+
+            if config["think_ms"]:
+                clock.sleep(rng.uniform(0, config["think_ms"]) / 1000)
+    finally:
+        db.close()
+        engine.dispose()
+    return results
+
+# Invariants
+def check_invariants(db, dates: List[date] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Rows that break booking invariants: classes over capacity, drifted
+    enrolled_count, duplicate active enrollments, and overlapping room or
+    trainer bookings. `dates` limits the overlap checks to those days.
+    """
+    active = "('REGISTERED', 'ATTENDED')"
+    params = {"dates": list(dates)} if dates else {}
+    date_filter = "AND scheduled_date = ANY(:dates)" if dates else ""
+    class_date_filter = "AND gc.scheduled_date = ANY(:dates)" if dates else ""
+
+    def rows(sql):
+        return [dict(r._mapping) for r in db.execute(text(sql), params)]
+
+    enrollment_counts = f"""
+        SELECT gc.class_id, gc.capacity, gc.enrolled_count, COUNT(ce.enrollment_id) AS active
+        FROM group_classes gc
+        LEFT JOIN class_enrollments ce
+            ON ce.class_id = gc.class_id AND ce.attendance_status IN {active}
+        WHERE TRUE {class_date_filter}
+        GROUP BY gc.class_id, gc.capacity, gc.enrolled_count
+    """
+    bookings = f"""
+        SELECT 'class' AS kind, class_id AS id, room_id, trainer_id, scheduled_date, start_time, end_time
+        FROM group_classes WHERE status <> 'CANCELLED' {date_filter}
+        UNION ALL
+        SELECT 'session', session_id, room_id, trainer_id, scheduled_date, start_time, end_time
+        FROM personal_training_sessions WHERE status <> 'CANCELLED' {date_filter}
+    """
+
+    def overlaps(resource):
+        return rows(f"""
+            WITH b AS ({bookings})
+            SELECT a.{resource} AS {resource}, a.scheduled_date,
+                   a.kind AS first_kind, a.id AS first_id, c.kind AS second_kind, c.id AS second_id
+            FROM b a JOIN b c
+              ON a.{resource} = c.{resource} AND a.scheduled_date = c.scheduled_date
+             AND (a.kind, a.id) < (c.kind, c.id)
+             AND a.start_time < c.end_time AND c.start_time < a.end_time
+        """)
+
+    try:
+        return {
+            "over_capacity": rows(f"SELECT * FROM ({enrollment_counts}) s WHERE active > capacity"),
+            "enrolled_count_drift": rows(f"SELECT * FROM ({enrollment_counts}) s WHERE active <> enrolled_count"),
+            "duplicate_enrollments": rows(f"""
+                SELECT member_id, class_id, COUNT(*) AS enrollments FROM class_enrollments
+                WHERE attendance_status IN {active}
+                GROUP BY member_id, class_id HAVING COUNT(*) > 1
+            """),
+            "room_overlaps": overlaps("room_id"),
+            "trainer_overlaps": overlaps("trainer_id"),
+        }
+    finally:
+        db.rollback()
+
+# Multi-process booking load test
+class BookingLoadSimulator:
+    """
+    Drives register_for_group_class and schedule_pt_session from `workers`
+    processes at once, each a simulated member with its own connection.
+    Contention is deliberate: a handful of small classes and a few trainers
+    and rooms whose PT slots overlap every half hour, all on one fresh day.
+
+    Afterwards it reports throughput, p50/p99 latency per operation, counts
+    of deadlocks, serialization failures and other errors, and any invariant
+    violations left in the database.
+    """
+
+    def __init__(self, workers: int = 8, duration: float = 30.0, max_ops_per_worker: int = 10_000,
+                 hot_classes: int = 5, class_capacity: int = 20, hot_trainers: int = 3,
+                 pt_ratio: float = 0.3, think_ms: float = 0.0, seed: int = 42, url: str = DATABASE_URL):
+        self.workers = workers
+        self.duration = duration
+        self.max_ops_per_worker = max_ops_per_worker
+        self.hot_classes = hot_classes
+        self.class_capacity = class_capacity
+        self.hot_trainers = hot_trainers
+        self.pt_ratio = pt_ratio
+        self.think_ms = think_ms
+        self.seed = seed
+        self.url = url
+
+    def run(self) -> Dict[str, Any]:
+        config = self._prepare()
+        context = multiprocessing.get_context("spawn")
+
+        with context.Pool(self.workers) as pool:
+            # Leave time for every process to import and connect
+            config["start_at"] = clock.time() + 3.0
+            per_worker = pool.starmap(_worker, [(config, i) for i in range(self.workers)])
+            elapsed = clock.time() - config["start_at"]
+
+        db = SessionLocal()
+        try:
+            violations = check_invariants(db, [config["day"]])
+        finally:
+            db.close()
+
+        report = self._report([r for results in per_worker for r in results], elapsed)
+        report["invariant_violations"] = violations
+        report["ok"] = not any(violations.values())
+        report["config"] = {
+            "workers": self.workers, "duration": self.duration, "hot_classes": self.hot_classes,
+            "class_capacity": self.class_capacity, "hot_trainers": self.hot_trainers,
+            "pt_ratio": self.pt_ratio, "think_ms": self.think_ms, "seed": self.seed,
+            "day": config["day"].isoformat(),
+        }
+        return report
+
+    def _prepare(self) -> Dict[str, Any]:
+        """Create the contended classes and PT slots on a day nobody has booked yet."""
+        rng = random.Random(self.seed)
+        db = SessionLocal()
+        try:
+            trainer_ids = db.execute(select(Trainer.trainer_id).order_by(Trainer.trainer_id)).scalars().all()
+            rooms = db.execute(select(Room.room_id, Room.capacity).order_by(Room.capacity.desc())).all()
+            member_ids = db.execute(select(Member.member_id).limit(self.workers * 500)).scalars().all()
+            needed = self.hot_classes + self.hot_trainers
+            if len(trainer_ids) < needed or len(rooms) < needed or not member_ids:
+                raise ValueError(f"Load test needs at least {needed} trainers and rooms, and some members.")
+
+            last_day = db.execute(select(func.max(GroupClass.scheduled_date))).scalar() or date.today()
+            day = last_day + timedelta(days=rng.randint(60, 365))
+
+            admin = AdminService(db)
+            class_ids = []
+            for trainer_id, room in zip(trainer_ids[:self.hot_classes], rooms[:self.hot_classes]):
+                capacity = min(self.class_capacity, room.capacity)
+                class_ids.append(admin.create_group_class(
+                    "Peak Hour Class", trainer_id, room.room_id, day, time(18), time(19), capacity
+                ).class_id)
+
+            # Hour-long PT slots starting every 30 minutes, so neighbours overlap
+            pt_slots = []
+            for trainer_id, room in zip(trainer_ids[self.hot_classes:needed], rooms[self.hot_classes:needed]):
+                for half_hours in range(12, 40):
+                    start = datetime.combine(day, time(0)) + timedelta(minutes=30 * half_hours)
+                    end = start + timedelta(hours=1)
+                    pt_slots.append((trainer_id, room.room_id, day, start.time(), end.time()))
+
+            return {
+                "url": self.url,
+                "seed": self.seed,
+                "duration": self.duration,
+                "max_ops": self.max_ops_per_worker,
+                "pt_ratio": self.pt_ratio,
+                "think_ms": self.think_ms,
+                "member_ids": member_ids,
+                "class_ids": class_ids,
+                "pt_slots": pt_slots,
+                "day": day,
+            }
+        finally:
+            db.close()
+
+    def _report(self, results: List[tuple], elapsed: float) -> Dict[str, Any]:
+        operations = {}
+        for operation in ("register_for_group_class", "schedule_pt_session"):
+            calls = [r for r in results if r[0] == operation]
+            latencies = sorted(r[2] for r in calls)
+            outcomes = {o: sum(1 for r in calls if r[1] == o) for o in OUTCOMES}
+            operations[operation] = {
+                "calls": len(calls),
+                **outcomes,
+                "throughput_per_s": round(len(calls) / elapsed, 1) if elapsed else 0,
+                "ok_per_s": round(outcomes["ok"] / elapsed, 1) if elapsed else 0,
+                "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+                "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+            }
+        return {
+            "elapsed_s": round(elapsed, 2),
+            "total_calls": len(results),
+            "throughput_per_s": round(len(results) / elapsed, 1) if elapsed else 0,
+            "deadlocks": sum(1 for r in results if r[1] == "deadlock"),
+            "serialization_failures": sum(1 for r in results if r[1] == "serialization_failure"),
+            "errors": sum(1 for r in results if r[1] == "error"),
+            "operations": operations,
+        }
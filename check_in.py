@@ -0,0 +1,37 @@
+import argparse
+import sys
+from database.connection import SessionLocal
+from services.attendance import AttendanceService
+
+def _scans(lines):
+    for line in lines:
+        line = line.strip()
+        if line.isdigit():
+            yield int(line)
+        elif line:
+            print(f"  Ignored scan '{line}'", file=sys.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description="Check members in to their current classes from a stream of scanned member IDs.")
+    parser.add_argument("path", nargs="?", help="File with one member ID per line (default: stdin, e.g. piped from the scanner)")
+    parser.add_argument("--batch-size", type=int, default=200, help="Scans per UPDATE")
+    args = parser.parse_args()
+
+    source = open(args.path) if args.path else sys.stdin
+    db = SessionLocal()
+    try:
+        report = AttendanceService(db).check_in_stream(_scans(source), batch_size=args.batch_size)
+    finally:
+        db.close()
+        if args.path:
+            source.close()
+
+    print("--- CHECK-IN COMPLETE ---")
+    print(f"Scanned: {report['scanned']}")
+    print(f"Checked in: {report['checked_in']}")
+    print(f"Already checked in: {report['already_checked_in']}")
+    if report["unmatched"]:
+        print(f"No current class for member IDs: {', '.join(map(str, report['unmatched']))}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,5 +1,8 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from database.connection import end_request
+from client.listing import print_list
 from services.admin_service import AdminService
+from services.class_series import parse_weekdays
 
 def run(service: AdminService):
     while True:
@@ -11,73 +14,87 @@ def run(service: AdminService):
         print("5. Cancel Group Class")
         print("6. List All Members")
         print("7. List All Trainers")
-        print("8. Back to Main Menu")
+        print("8. Create Recurring Class Series")
+        print("9. Cancel Class Series")
+        print("10. Change Class Capacity")
+        print("11. Cancel Classes by Date Range")
+        print("12. Back to Main Menu")
         
         choice = input("Select an option: ")
         
-        if choice == '1':
-            name = input("Room Name: ")
-            try:
-                cap_input = input("Capacity: ")
-                if not cap_input: raise ValueError("Empty")
-                cap = int(cap_input)
+        try:
+            if choice == '1':
+                name = input("Room Name: ")
+                try:
+                    cap_input = input("Capacity: ")
+                    if not cap_input: raise ValueError("Empty")
+                    cap = int(cap_input)
                 
-                rtype = input("Type (Cardio/Weights/Studio): ")
-                service.add_room(name, cap, rtype)
-                print("Room added.")
-            except ValueError:
-                print("Error: Capacity must be a valid number.")
-            except Exception as e:
-                print(f"Error: {e}")
-
-        elif choice == '2':
-            first = input("First Name: ")
-            last = input("Last Name: ")
-            email = input("Email: ")
-            spec = input("Specialization: ")
-            try:
-                t = service.add_trainer(first, last, email, spec)
-                print(f"Trainer added. ID: {t.trainer_id}")
-            except Exception as e:
-                print(f"Error: {e}")
-
-        elif choice == '3':
-            _create_class(service)
-
-        elif choice == '4':
-            _reschedule_class(service)
-
-        elif choice == '5':
-            _cancel_class(service)
-
-        elif choice == '6':
-            _list_members(service)
-
-        elif choice == '7':
-            _list_trainers(service)
-
-        elif choice == '8':
-            break
-
-def _print_list(title, items, formatter):
-    print(f"\n--- {title} ---")
-    if not items: print("None found.")
-    for item in items:
-        print(formatter(item))
-    print("-------------------")
+                    rtype = input("Type (Cardio/Weights/Studio): ")
+                    service.add_room(name, cap, rtype)
+                    print("Room added.")
+                except ValueError:
+                    print("Error: Capacity must be a valid number.")
+                except Exception as e:
+                    print(f"Error: {e}")
+
+            elif choice == '2':
+                first = input("First Name: ")
+                last = input("Last Name: ")
+                email = input("Email: ")
+                spec = input("Specialization: ")
+                try:
+                    t = service.add_trainer(first, last, email, spec)
+                    print(f"Trainer added. ID: {t.trainer_id}")
+                except Exception as e:
+                    print(f"Error: {e}")
+
+            elif choice == '3':
+                _create_class(service)
+
+            elif choice == '4':
+                _reschedule_class(service)
+
+            elif choice == '5':
+                _cancel_class(service)
+
+            elif choice == '6':
+                _list_members(service)
+
+            elif choice == '7':
+                _list_trainers(service)
+
+            elif choice == '8':
+                _create_series(service)
+
+            elif choice == '9':
+                _cancel_series(service)
+
+            elif choice == '10':
+                _change_capacity(service)
+
+            elif choice == '11':
+                _cancel_date_range(service)
+
+            elif choice == '12':
+                break
+        finally:
+            # Release this action's session before the next prompt
+            end_request()
 
 def _list_members(service):
-    members = service.get_all_members()
-    _print_list("All Registered Members", members, lambda m: f"ID: {m.member_id} | {m.first_name} {m.last_name} | {m.email}")
+    print_list("All Registered Members", service.get_members_page, lambda m: f"ID: {m.member_id} | {m.first_name} {m.last_name} | {m.email}",
+               key=lambda m: m.member_id)
 
 def _list_trainers(service):
-    trainers = service.get_all_trainers()
-    _print_list("All Trainers", trainers, lambda t: f"ID: {t.trainer_id} | {t.first_name} {t.last_name} | Spec: {t.specialization}")
+    print_list("All Trainers", service.get_trainers_page, lambda t: f"ID: {t.trainer_id} | {t.first_name} {t.last_name} | Spec: {t.specialization}",
+               key=lambda t: t.trainer_id)
 
 def _create_class(service):
     print("\n--- Create New Class ---")
-    _print_list("Trainers", service.get_all_trainers(), lambda t: f"ID: {t.trainer_id} | {t.first_name} {t.last_name}")
-    _print_list("Rooms", service.get_all_rooms(), lambda r: f"ID: {r.room_id} | {r.room_name} (Cap: {r.capacity})")
+    print_list("Trainers", service.get_trainers_page, lambda t: f"ID: {t.trainer_id} | {t.first_name} {t.last_name}",
+               key=lambda t: t.trainer_id)
+    print_list("Rooms", service.get_all_rooms(), lambda r: f"ID: {r.room_id} | {r.room_name} (Cap: {r.capacity})")
 
     name = input("Class Name: ")
     if not name.strip():
@@ -118,28 +135,126 @@ def _create_class(service):
     except Exception as e:
         print(f"Creation Failed: {e}")
 
+def _create_series(service):
+    print("\n--- Create Recurring Class Series ---")
+    print_list("Trainers", service.get_trainers_page, lambda t: f"ID: {t.trainer_id} | {t.first_name} {t.last_name}",
+               key=lambda t: t.trainer_id)
+    print_list("Rooms", service.get_all_rooms(), lambda r: f"ID: {r.room_id} | {r.room_name} (Cap: {r.capacity})")
+
+    name = input("Class Name: ")
+    if not name.strip():
+        print("Error: Class Name cannot be empty.")
+        return
+
+    try:
+        tid = int(input("Trainer ID: "))
+        rid = int(input("Room ID: "))
+        cap = int(input("Capacity: "))
+        weekdays = parse_weekdays(input("Weekdays (e.g. Mon,Wed,Fri): "))
+        start_date = datetime.strptime(input("First Date (YYYY-MM-DD): "), "%Y-%m-%d").date()
+        weeks = int(input("Number of Weeks: "))
+        start = datetime.strptime(input("Start Time (HH:MM:SS): "), "%H:%M:%S").time()
+        end = datetime.strptime(input("End Time (HH:MM:SS): "), "%H:%M:%S").time()
+
+        end_date = start_date + timedelta(weeks=weeks) - timedelta(days=1)
+        result = service.create_class_series(name, tid, rid, start, end, cap, start_date, end_date, weekdays)
+        if result["series"]:
+            print(f"Series Created! ID: {result['series'].series_id} ({len(result['created'])} classes)")
+        for conflict in result["conflicts"]:
+            print(f"  Skipped {conflict['date']}: {'; '.join(conflict['reasons'])}")
+        if not result["series"]:
+            print("No classes created: every date conflicts.")
+    except ValueError as ve:
+        print(f"Input Error: {ve}")
+    except Exception as e:
+        print(f"Creation Failed: {e}")
+
+def _cancel_series(service):
+    sid_input = input("Series ID to cancel (upcoming classes only): ")
+    try:
+        if not sid_input.strip(): return
+        count = service.cancel_series(int(sid_input))
+        print(f"Series cancelled: {count} upcoming classes cancelled.")
+    except ValueError as ve:
+        print(f"Error: {ve}")
+    except Exception as e:
+        print(f"Error: {e}")
+
 def _cancel_class(service):
-    _print_list("Active Classes", service.get_all_classes(), lambda c: f"ID: {c.class_id} | {c.class_name} | {c.scheduled_date}")
+    print_list("Classes", service.get_classes_page,
+               lambda c: f"ID: {c.class_id} | {c.class_name} | {c.scheduled_date}" + (" [Cancelled]" if c.is_cancelled else ""),
+               key=lambda c: c.class_id)
 
     cid_input = input("Class ID to cancel: ")
+    if not cid_input.strip(): return
     try:
-        if not cid_input.strip(): return
-        service.cancel_class(int(cid_input))
-        print("Class cancelled.")
+        class_id = int(cid_input)
     except ValueError:
         print("Error: Class ID must be a number.")
+        return
+
+    try:
+        service.cancel_class(class_id)
+        print("Class cancelled.")
+    except Exception as e:
+        print(f"Error: {e}")
+
+def _cancel_date_range(service):
+    print("\n--- Cancel Classes by Date Range ---")
+    try:
+        start = datetime.strptime(input("From Date (YYYY-MM-DD): ").strip(), "%Y-%m-%d").date()
+        end_str = input("To Date (YYYY-MM-DD, blank for the same day): ").strip()
+        end = datetime.strptime(end_str, "%Y-%m-%d").date() if end_str else start
+        room_in = input("Room ID (blank for all rooms): ").strip()
+        room_id = int(room_in) if room_in else None
+    except ValueError as ve:
+        print(f"Input Error: {ve}")
+        return
+
+    if input(f"Cancel every class from {start} to {end}? (y/n): ").strip().lower() != 'y':
+        return
+    try:
+        count = service.cancel_classes(start, end, room_id=room_id)
+        print(f"{count} classes cancelled.")
+    except Exception as e:
+        print(f"Error: {e}")
+
+def _change_capacity(service):
+    print_list("Active Classes", service.get_active_classes_page,
+               lambda c: f"ID: {c.class_id} | {c.class_name} | {c.scheduled_date} | {c.enrolled_count}/{c.capacity}",
+               key=lambda c: c.class_id)
+
+    try:
+        cid_input = input("Class ID: ")
+        if not cid_input.strip(): return
+        class_id = int(cid_input)
+        capacity = int(input("New Capacity: "))
+    except ValueError:
+        print("Error: Class ID and capacity must be numbers.")
+        return
+
+    try:
+        promoted = service.update_class_capacity(class_id, capacity)
+        print(f"Capacity updated. {len(promoted)} member(s) moved from the waitlist.")
     except Exception as e:
         print(f"Error: {e}")
 
 def _reschedule_class(service):
     print("\n--- Reschedule Group Class ---")
-    _print_list("Active Classes", service.get_all_classes(), 
-                lambda c: f"ID: {c.class_id} | {c.class_name} | {c.scheduled_date} {c.start_time}-{c.end_time}")
+    print_list("Active Classes", service.get_active_classes_page, 
+               lambda c: f"ID: {c.class_id} | {c.class_name} | {c.scheduled_date} {c.start_time}-{c.end_time}",
+               key=lambda c: c.class_id)
 
     try:
         cid_input = input("Enter Class ID to reschedule: ")
         if not cid_input.strip(): return
         class_id = int(cid_input)
+
+        # Remember the version shown, then release the session while the admin types
+        current = service.get_class(class_id)
+        print(f"Current: {current.scheduled_date} {current.start_time}-{current.end_time}")
+        version = current.version_id
+        end_request()
         
         print("\n--- Enter New Schedule ---")
         date_str = input("New Date (YYYY-MM-DD): ")
@@ -150,7 +265,7 @@ def _reschedule_class(service):
         new_start = datetime.strptime(start_str, "%H:%M:%S").time()
         new_end = datetime.strptime(end_str, "%H:%M:%S").time()
         
-        service.reschedule_class(class_id, new_date, new_start, new_end)
+        service.reschedule_class(class_id, new_date, new_start, new_end, expected_version=version)
         print("Success! Class rescheduled.")
         
     except ValueError as ve:
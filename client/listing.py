@@ -0,0 +1,37 @@
+# Shared console listing for the menus
+from database.connection import end_request
+
+PAGE_SIZE = 20
+
+def print_list(title, items, formatter, key=None):
+    """
+    `items` is a list, or a page function items(after_id, limit) paged by `key`.
+    The request's session is released before waiting for input and once the list
+    is printed, since a prompt always follows it.
+    """
+    print(f"\n--- {title} ---")
+    if not callable(items):
+        if not items:
+            print("No records found.")
+        for item in items:
+            print(formatter(item))
+        print("-----------------------")
+        end_request()
+        return
+
+    after, shown = None, 0
+    while True:
+        page = items(after, PAGE_SIZE)
+        for item in page:
+            print(formatter(item))
+        shown += len(page)
+        if len(page) < PAGE_SIZE:
+            break
+        end_request()
+        if input("-- Enter for more, 'q' to stop: ").strip().lower() == 'q':
+            break
+        after = key(page[-1])
+    if not shown:
+        print("No records found.")
+    print("-----------------------")
+    end_request()
\ No newline at end of file
@@ -1,18 +1,21 @@
 import sys
-from database.connection import SessionLocal
+from database.connection import ScopedSession, end_request
+from database import instrumentation
 from services.member_service import MemberService
 from services.trainer_service import TrainerService
 from services.admin_service import AdminService
+from services.availability import AvailabilityEngine
 from client import member_menu, trainer_menu, admin_menu
 
 def main():
-    # Initialize Database Session
-    db = SessionLocal()
+    # Thread-local session registry; each menu action gets a fresh session
+    db = ScopedSession
     
-    # Initialize Services
-    member_service = MemberService(db)
-    trainer_service = TrainerService(db)
-    admin_service = AdminService(db)
+    # Initialize Services (sharing one availability index)
+    availability = AvailabilityEngine(db)
+    member_service = MemberService(db, availability)
+    trainer_service = TrainerService(db, availability)
+    admin_service = AdminService(db, availability)
 
     while True:
         print("\n=== Health & Fitness Club Management System ===")
@@ -23,18 +26,24 @@ def main():
         
         choice = input("Select an option: ")
 
-        if choice == '1':
-            member_menu.run(member_service)
-        elif choice == '2':
-            trainer_menu.run(trainer_service)
-        elif choice == '3':
-            admin_menu.run(admin_service)
-        elif choice == '4':
-            print("Exiting system. Goodbye!")
-            db.close()
-            sys.exit()
-        else:
-            print("Invalid selection. Please try again.")
+        try:
+            if choice == '1':
+                member_menu.run(member_service)
+            elif choice == '2':
+                trainer_menu.run(trainer_service)
+            elif choice == '3':
+                admin_menu.run(admin_service)
+            elif choice == '4':
+                print("Exiting system. Goodbye!")
+                end_request()
+                if instrumentation.is_enabled():
+                    print(instrumentation.report())
+                sys.exit()
+            else:
+                print("Invalid selection. Please try again.")
+        finally:
+            # Release this action's session before the next prompt
+            end_request()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,4 +1,6 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from database.connection import end_request
+from client.listing import print_list
 from services.member_service import MemberService
 
 def run(service: MemberService):
@@ -8,30 +10,32 @@ def run(service: MemberService):
         print("2. Login (View Dashboard)")
         print("3. Book Personal Training Session")
         print("4. Register for Group Class")
-        print("5. Back to Main Menu")
+        print("5. Find Free PT Slots")
+        print("6. Cancel Class Registration")
+        print("7. Back to Main Menu")
         
         choice = input("\nEnter choice: ").strip()
         
-        if choice == '1':
-            _register_member(service)
-        elif choice == '2':
-            _view_dashboard(service)
-        elif choice == '3':
-            _book_pt(service)
-        elif choice == '4':
-            _book_class(service)
-        elif choice == '5':
-            break
-        else:
-            print("Invalid choice.")
-
-def _print_list(title, items, formatter):
-    print(f"\n--- {title} ---")
-    if not items:
-        print("No records found.")
-    for item in items:
-        print(formatter(item))
-    print("-----------------------")
+        try:
+            if choice == '1':
+                _register_member(service)
+            elif choice == '2':
+                _view_dashboard(service)
+            elif choice == '3':
+                _book_pt(service)
+            elif choice == '4':
+                _book_class(service)
+            elif choice == '5':
+                _find_pt_slots(service)
+            elif choice == '6':
+                _cancel_class(service)
+            elif choice == '7':
+                break
+            else:
+                print("Invalid choice.")
+        finally:
+            # Release this action's session before the next prompt
+            end_request()
 
 def _register_member(service):
     print("\n--- REGISTER NEW MEMBER ---")
@@ -51,8 +55,8 @@ def _register_member(service):
 
 def _view_dashboard(service):
     # Display members so user can pick their ID
-    _print_list("Available Members", service.get_all_members(), 
-                lambda m: f"ID: {m.member_id} | {m.first_name} {m.last_name}")
+    print_list("Available Members", service.get_members_page, 
+               lambda m: f"ID: {m.member_id} | {m.first_name} {m.last_name}", key=lambda m: m.member_id)
 
     mid = input("Enter Your Member ID: ")
     try:
@@ -74,17 +78,17 @@ def _view_dashboard(service):
         if not data['upcoming_classes']:
             print("No upcoming classes.")
         for c in data['upcoming_classes']:
-            cls = c.group_class 
-            print(f"- {cls.class_name}: {cls.scheduled_date} @ {cls.start_time}")
+            print(f"- {c.class_name}: {c.scheduled_date} @ {c.start_time}")
             
     except Exception as e:
         print(f"Error loading dashboard: {e}")
 
 def _book_pt(service):
     # Show everything needed to make a booking
-    _print_list("Your Member ID", service.get_all_members(), lambda m: f"ID: {m.member_id} | {m.first_name}")
-    _print_list("Trainers", service.get_all_trainers(), lambda t: f"ID: {t.trainer_id} | {t.first_name} {t.last_name} ({t.specialization})")
-    _print_list("Rooms", service.get_all_rooms(), lambda r: f"ID: {r.room_id} | {r.room_name}")
+    print_list("Your Member ID", service.get_members_page, lambda m: f"ID: {m.member_id} | {m.first_name}", key=lambda m: m.member_id)
+    print_list("Trainers", service.get_trainers_page, lambda t: f"ID: {t.trainer_id} | {t.first_name} {t.last_name} ({t.specialization})",
+               key=lambda t: t.trainer_id)
+    print_list("Rooms", service.get_all_rooms(), lambda r: f"ID: {r.room_id} | {r.room_name}")
 
     try:
         mid_in = input("Member ID: ")
@@ -120,9 +124,43 @@ def _book_pt(service):
     except Exception as e:
         print(f"Booking Failed: {e}")
 
+def _find_pt_slots(service):
+    print_list("Trainers", service.get_trainers_page, lambda t: f"ID: {t.trainer_id} | {t.first_name} {t.last_name} ({t.specialization})",
+               key=lambda t: t.trainer_id)
+
+    try:
+        tid_in = input("Trainer ID: ")
+        if not tid_in.strip(): return
+        tid = int(tid_in)
+
+        room_in = input("Room ID or room type (blank for any room): ").strip()
+        room_id = int(room_in) if room_in.isdigit() else None
+        room_type = room_in if room_in and room_id is None else None
+
+        from_str = input("From date (YYYY-MM-DD, blank for today): ").strip()
+        days_in = input("Days to search (default 7): ").strip()
+        minutes_in = input("Session length in minutes (default 60): ").strip()
+
+        start = datetime.strptime(from_str, "%Y-%m-%d").date() if from_str else datetime.now().date()
+        end = start + timedelta(days=(int(days_in) if days_in else 7) - 1)
+        duration = int(minutes_in) if minutes_in else 60
+
+        slots = service.find_available_slots(tid, start, end, duration, room_id=room_id, room_type=room_type)
+        if not slots:
+            print("No free slots in that range.")
+            return
+        print(f"\n--- Free Slots ({len(slots)}) ---")
+        for s in slots:
+            print(f"- {s['date']} {s['start_time']}-{s['end_time']} | Room ID: {s['room_id']}")
+    except ValueError as ve:
+        print(f"Input Error: {ve}")
+    except Exception as e:
+        print(f"Search Failed: {e}")
+
 def _book_class(service):
-    _print_list("Your Member ID", service.get_all_members(), lambda m: f"ID: {m.member_id} | {m.first_name}")
-    _print_list("Available Classes", service.get_all_classes(), lambda c: f"ID: {c.class_id} | {c.class_name} | {c.scheduled_date} @ {c.start_time}")
+    print_list("Your Member ID", service.get_members_page, lambda m: f"ID: {m.member_id} | {m.first_name}", key=lambda m: m.member_id)
+    print_list("Available Classes", service.get_classes_page, lambda c: f"ID: {c.class_id} | {c.class_name} | {c.scheduled_date} @ {c.start_time}",
+               key=lambda c: c.class_id)
 
     try:
         mid_in = input("Member ID: ")
@@ -133,9 +171,38 @@ def _book_class(service):
         if not cid_in.strip(): return
         cid = int(cid_in)
 
+    except ValueError:
+        print("Error: IDs must be numbers.")
+        return
+
+    try:
         enrollment = service.register_for_group_class(mid, cid)
         print(f"Successfully enrolled in Class ID {cid}. Enrollment ID: {enrollment.enrollment_id}")
+    except Exception as e:
+        print(f"Enrollment Failed: {e}")
+        end_request()
+        if str(e) == "Class is fully booked." and input("Join the waitlist? (y/n): ").strip().lower() == 'y':
+            try:
+                position = service.join_waitlist(mid, cid)
+                if position is None:
+                    print(f"A seat opened up. Successfully enrolled in Class ID {cid}.")
+                else:
+                    print(f"Added to the waitlist at position {position}.")
+            except Exception as e:
+                print(f"Waitlist Failed: {e}")
+
+def _cancel_class(service):
+    try:
+        mid = int(input("Member ID: "))
+        cid = int(input("Class ID: "))
     except ValueError:
         print("Error: IDs must be numbers.")
+        return
+
+    try:
+        promoted = service.cancel_class_registration(mid, cid)
+        print("Registration cancelled.")
+        if promoted:
+            print("Your seat went to the next member on the waitlist.")
     except Exception as e:
-        print(f"Enrollment Failed: {e}")
\ No newline at end of file
+        print(f"Cancellation Failed: {e}")
\ No newline at end of file
@@ -1,4 +1,6 @@
 from datetime import datetime
+from database.connection import end_request
+from client.listing import print_list
 from services.trainer_service import TrainerService
 
 def run(service: TrainerService):
@@ -7,33 +9,32 @@ def run(service: TrainerService):
         print("1. View My Schedule")
         print("2. Search/View Member Profile")
         print("3. Update Session Status (Mark Complete/No-Show)")
-        print("4. Back to Main Menu")
+        print("4. Mark Class Attendance")
+        print("5. Back to Main Menu")
 
         choice = input("Select an option: ")
 
-        if choice == '1':
-            _view_schedule(service)
-        elif choice == '2':
-            _search_member(service)
-        elif choice == '3':
-            _update_status(service)
-        elif choice == '4':
-            break
-        else:
-            print("Invalid choice.")
-
-def _print_list(title, items, formatter):
-    print(f"\n--- {title} ---")
-    if not items:
-        print("No records found.")
-    for item in items:
-        print(formatter(item))
-    print("-----------------------")
+        try:
+            if choice == '1':
+                _view_schedule(service)
+            elif choice == '2':
+                _search_member(service)
+            elif choice == '3':
+                _update_status(service)
+            elif choice == '4':
+                _mark_attendance(service)
+            elif choice == '5':
+                break
+            else:
+                print("Invalid choice.")
+        finally:
+            # Release this action's session before the next prompt
+            end_request()
 
 def _view_schedule(service):
     # Display Trainers so the user knows their own ID
-    _print_list("Trainers List", service.get_all_trainers(), 
-                lambda t: f"ID: {t.trainer_id} | Name: {t.first_name} {t.last_name}")
+    print_list("Trainers List", service.get_trainers_page, 
+               lambda t: f"ID: {t.trainer_id} | Name: {t.first_name} {t.last_name}", key=lambda t: t.trainer_id)
 
     tid = input("Enter YOUR Trainer ID: ")
     start_str = input("Start Date (YYYY-MM-DD): ")
@@ -51,15 +52,15 @@ def _view_schedule(service):
         
         for item in schedule:
             # Show Status in the output so they can see if it's already Completed
-            status_str = f"[{item.get('status', 'N/A')}]" if 'status' in item else ""
-            print(f"[{item['date']} {item['start_time']}-{item['end_time']}] {status_str} {item['type']}: {item['name']} (Room: {item['room']}) - ID: {item['id']}")
+            status_str = f"[{item.status}]" if item.status else ""
+            print(f"[{item.date} {item.start_time}-{item.end_time}] {status_str} {item.type}: {item.name} (Room: {item.room}) - ID: {item.id}")
             
     except Exception as e:
         print(f"Error: {e}")
 
 def _search_member(service):
-    _print_list("All Members", service.get_all_members(), 
-                lambda m: f"ID: {m.member_id} | {m.first_name} {m.last_name} | {m.email}")
+    print_list("All Members", service.get_members_page, 
+               lambda m: f"ID: {m.member_id} | {m.first_name} {m.last_name} | {m.email}", key=lambda m: m.member_id)
 
     print("Options:")
     print("1. Select Member by ID (from list above)")
@@ -74,7 +75,7 @@ def _search_member(service):
         if not results:
             print("No members found.")
             return
-        _print_list("Search Results", results, lambda m: f"ID: {m.member_id} | {m.first_name} {m.last_name}")
+        print_list("Search Results", results, lambda m: f"ID: {m.member_id} | {m.first_name} {m.last_name}")
         view_id = input("\nEnter ID to view full profile: ")
     else:
         view_id = input("Enter Member ID: ")
@@ -93,6 +94,35 @@ def _search_member(service):
         except Exception as e:
             print(f"Error: {e}")
 
+def _mark_attendance(service):
+    print("\n--- Mark Class Attendance ---")
+    print("Tip: Use 'View My Schedule' to find the Class ID.")
+
+    try:
+        cid_in = input("Enter Class ID: ")
+        if not cid_in.strip(): return
+        class_id = int(cid_in)
+
+        print("\nSelect Status:")
+        print("1. Attended")
+        print("2. Absent")
+        new_status = {'1': 'Attended', '2': 'Absent'}.get(input("Choice: ").strip())
+        if not new_status:
+            print("Invalid selection.")
+            return
+
+        ids_in = input("Member IDs, comma separated (blank for the whole class): ").strip()
+        member_ids = [int(i) for i in ids_in.split(",") if i.strip()] if ids_in else None
+    except ValueError:
+        print("Error: IDs must be numbers.")
+        return
+
+    try:
+        changed = service.mark_class_attendance(class_id, new_status, member_ids)
+        print(f"{changed} enrollment(s) marked {new_status}.")
+    except Exception as e:
+        print(f"Error: {e}")
+
 def _update_status(service):
     print("\n--- Update Session Status ---")
     print("Tip: Use 'View My Schedule' to find the Session ID.")
@@ -0,0 +1,25 @@
+import argparse
+from datetime import datetime
+from database.connection import SessionLocal
+from services.attendance import AttendanceService
+from database.schema_extras import roll_enrollment_summary
+
+def main():
+    parser = argparse.ArgumentParser(description="Nightly job: mark no-shows for classes and PT sessions that have ended and roll the enrollment summary.")
+    parser.add_argument("--cutoff", help="Treat bookings ending by this time as over (YYYY-MM-DD HH:MM); defaults to now")
+    args = parser.parse_args()
+
+    cutoff = datetime.strptime(args.cutoff, "%Y-%m-%d %H:%M") if args.cutoff else None
+    db = SessionLocal()
+    try:
+        result = AttendanceService(db).close_day(cutoff)
+    finally:
+        db.close()
+    # Fallback for servers without pg_cron; a no-op once the summary is current
+    roll_enrollment_summary()
+
+    print(f"Enrollments marked Absent: {result['absent']}")
+    print(f"PT sessions marked No Show: {result['no_show']}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
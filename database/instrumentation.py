@@ -0,0 +1,267 @@
+import functools
+import inspect
+import logging
+import random
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+# The same statement this many times within one call is reported as N+1
+N_PLUS_ONE_THRESHOLD = 10
+
+UNATTRIBUTED = "<unattributed>"
+
+class Histogram:
+    """Fixed-bucket histogram; the last bucket counts values above every bound."""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+
+    def percentile(self, p: float) -> float:
+        """Upper bound of the bucket holding the p-th percentile (0.0 if empty, inf if above all bounds)."""
+        total = sum(self.counts)
+        if not total:
+            return 0.0
+        rank = p / 100 * total
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return float(self.bounds[i]) if i < len(self.bounds) else float("inf")
+        return float("inf")
+
+    def as_dict(self) -> Dict[str, int]:
+        labels = [f"<={b}" for b in self.bounds] + [f">{self.bounds[-1]}"]
+        return dict(zip(labels, self.counts))
+
+class MethodStats:
+    def __init__(self):
+        self.calls = 0
+        self.queries = 0
+        self.rows = 0
+        self.db_time = 0.0
+        self.wall_time = 0.0
+        self.n_plus_one = 0
+        self.n_plus_one_statement = None
+        self.latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.queries_per_call = Histogram(QUERY_COUNT_BUCKETS)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "queries": self.queries,
+            "rows": self.rows,
+            "db_time_ms": round(self.db_time * 1000, 3),
+            "wall_time_ms": round(self.wall_time * 1000, 3),
+            "queries_per_call": round(self.queries / self.calls, 2) if self.calls else 0,
+            "p50_ms": self.latency_ms.percentile(50),
+            "p99_ms": self.latency_ms.percentile(99),
+            "n_plus_one": self.n_plus_one,
+            "n_plus_one_statement": self.n_plus_one_statement,
+            "latency_ms": self.latency_ms.as_dict(),
+            "queries_per_call_histogram": self.queries_per_call.as_dict(),
+        }
+
+class _Span:
+    """Counters for one service-method call; queries from nested calls land here too."""
+    __slots__ = ("name", "queries", "rows", "db_time", "statements")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.queries = 0
+        self.rows = 0
+        self.db_time = 0.0
+        self.statements = {}
+
+_enabled = False
+_sample_rate = 1.0
+_lock = threading.Lock()
+_stats: Dict[str, MethodStats] = {}
+
+# The span of the outermost instrumented call running in this thread / task.
+# False marks a call that was not sampled, so its nested calls are skipped too.
+_current: ContextVar = ContextVar("db_instrumentation_span", default=None)
+
+def enable(sample_rate: float = 1.0):
+    """
+    Start recording. Listens on every Engine (sync and the async engine's
+    sync_engine). `sample_rate` < 1 records only that fraction of calls.
+    """
+    global _enabled, _sample_rate
+    _sample_rate = sample_rate
+    if not _enabled:
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        _enabled = True
+
+def disable():
+    global _enabled
+    if _enabled:
+        event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.remove(Engine, "after_cursor_execute", _after_cursor_execute)
+        _enabled = False
+
+def is_enabled() -> bool:
+    return _enabled
+
+def reset():
+    with _lock:
+        _stats.clear()
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """Per-method statistics, busiest (by database time) first."""
+    with _lock:
+        items = sorted(_stats.items(), key=lambda kv: kv[1].db_time, reverse=True)
+        return {name: stats.as_dict() for name, stats in items}
+
+def report() -> str:
+    lines = [f"{'Method':<48} {'Calls':>7} {'Queries':>8} {'Q/call':>7} {'Rows':>9} "
+             f"{'DB ms':>10} {'p50':>6} {'p99':>6} {'N+1':>5}"]
+    for name, s in snapshot().items():
+        lines.append(
+            f"{name:<48} {s['calls']:>7} {s['queries']:>8} {s['queries_per_call']:>7} {s['rows']:>9} "
+            f"{s['db_time_ms']:>10} {s['p50_ms']:>6g} {s['p99_ms']:>6g} {s['n_plus_one']:>5}"
+        )
+    return "\n".join(lines)
+
+# Decorators
+def instrumented(name: str):
+    """Attribute the queries issued during the decorated call (sync or async) to `name`."""
+    def decorator(fn):
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if not _enabled or _current.get() is not None:
+                    return await fn(*args, **kwargs)
+                span, token, started = _start(name)
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    _finish(span, token, started)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled or _current.get() is not None:
+                return fn(*args, **kwargs)
+            span, token, started = _start(name)
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException:
+                _finish(span, token, started)
+                raise
+            if span is not None and isinstance(result, Iterator):
+                # Lazy results (iter_*, fetch_stream) query while consumed; keep the span open until then
+                _current.reset(token)
+                return _consume_in_span(result, span, started)
+            _finish(span, token, started)
+            return result
+        return wrapper
+    return decorator
+
+def instrument_service(cls):
+    """
+    Class decorator: instrument every public method as "<Class>.<method>".
+    Generators are left alone (their queries run after the call returns);
+    they are attributed to whichever instrumented method consumes them.
+    Methods that return an iterator keep their span until it is exhausted
+    or closed, so its wall time includes the time the caller spends between items.
+    """
+    for attr, fn in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.isfunction(fn):
+            continue
+        if inspect.isgeneratorfunction(fn) or inspect.isasyncgenfunction(fn):
+            continue
+        setattr(cls, attr, instrumented(f"{cls.__name__}.{attr}")(fn))
+    return cls
+
+def _consume_in_span(iterator, span: _Span, started: float):
+    """Yield from `iterator`, attributing the queries each step runs to `span`; record it at the end."""
+    try:
+        while True:
+            token = _current.set(span)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                _current.reset(token)
+            yield item
+    finally:
+        _record(span, time.perf_counter() - started)
+
+def _start(name: str):
+    if _sample_rate < 1.0 and random.random() >= _sample_rate:
+        return None, _current.set(False), None
+    span = _Span(name)
+    return span, _current.set(span), time.perf_counter()
+
+def _finish(span, token, started):
+    _current.reset(token)
+    if span is not None:
+        _record(span, time.perf_counter() - started)
+
+def _record(span: _Span, wall_time: float):
+    repeated, statement = max(((n, s) for s, n in span.statements.items()), default=(0, None))
+    with _lock:
+        stats = _stats.get(span.name)
+        if stats is None:
+            stats = _stats[span.name] = MethodStats()
+        stats.calls += 1
+        stats.queries += span.queries
+        stats.rows += span.rows
+        stats.db_time += span.db_time
+        stats.wall_time += wall_time
+        stats.latency_ms.observe(wall_time * 1000)
+        stats.queries_per_call.observe(span.queries)
+        if repeated >= N_PLUS_ONE_THRESHOLD:
+            stats.n_plus_one += 1
+            stats.n_plus_one_statement = statement[:200]
+
+    if repeated >= N_PLUS_ONE_THRESHOLD:
+        logger.warning("Possible N+1 in %s: statement ran %d times in one call: %s",
+                       span.name, repeated, statement[:200])
+
+# Engine event handlers
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("instrumentation_start", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("instrumentation_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+
+    span = _current.get()
+    if span is False:
+        return
+    if span is None:
+        # Query outside any instrumented method (scripts, schema setup)
+        if _sample_rate < 1.0 and random.random() >= _sample_rate:
+            return
+        span = _Span(UNATTRIBUTED)
+        _apply(span, statement, cursor, elapsed)
+        _record(span, elapsed)
+        return
+    _apply(span, statement, cursor, elapsed)
+
+def _apply(span: _Span, statement: str, cursor, elapsed: float):
+    span.queries += 1
+    span.rows += max(cursor.rowcount or 0, 0)
+    span.db_time += elapsed
+    span.statements[statement] = span.statements.get(statement, 0) + 1
@@ -4,11 +4,19 @@ from database.connection import engine
 from models.member import Member
 from models.group_class import GroupClass
 from models.personal_training_session import PersonalTrainingSession
-from models.class_enrollment import ClassEnrollment
+from models.class_enrollment import ClassEnrollment, AttendanceStatus
+from models.class_series import ClassSeries
+from models.class_waitlist import WaitlistEntry
+import logging
 
-def create_schema_extras():
+logger = logging.getLogger(__name__)
+
+def create_schema_extras(use_exclusion_constraints: bool = False):
     """
     Create views, triggers, and indexes using SQLAlchemy ORM constructs.
+
+    With use_exclusion_constraints=True the room availability trigger is replaced
+    by GiST exclusion constraints (see create_booking_exclusion_constraints).
     """
     print("Applying schema extras (Views, Triggers, Indexes)...")
 
@@ -19,7 +27,12 @@ def create_schema_extras():
             Index('idx_class_date', GroupClass.scheduled_date),
             Index('idx_pt_sessions_date', PersonalTrainingSession.scheduled_date),
             Index('idx_enrollment_member_class', ClassEnrollment.member_id, ClassEnrollment.class_id),
-            Index('idx_enrollment_status', ClassEnrollment.attendance_status)
+            Index('idx_enrollment_status', ClassEnrollment.attendance_status),
+            # Set-based updates by class and ON DELETE CASCADE from group_classes
+            Index('idx_enrollment_class', ClassEnrollment.class_id, ClassEnrollment.attendance_status),
+            # One active registration per member and class, even under concurrent requests
+            Index('uq_enrollment_active_member_class', ClassEnrollment.member_id, ClassEnrollment.class_id, unique=True,
+                  postgresql_where=ClassEnrollment.attendance_status.in_([AttendanceStatus.REGISTERED, AttendanceStatus.ATTENDED]))
         ]
 
         for idx in indexes:
@@ -30,36 +43,50 @@ def create_schema_extras():
             except Exception as e:
                 print(f"Skipping index '{idx.name}': {e}")
 
-        # Views
-        view_sql = DDL("""
-        CREATE OR REPLACE VIEW member_enrollment_summary AS
-        SELECT 
-            m.member_id,
-            m.first_name || ' ' || m.last_name AS member_name,
-            COUNT(ce.enrollment_id) AS total_classes_enrolled,
-            COUNT(CASE WHEN gc.scheduled_date > CURRENT_DATE THEN 1 END) AS upcoming_classes
-        FROM members m
-        LEFT JOIN class_enrollments ce ON m.member_id = ce.member_id 
-            AND ce.attendance_status IN ('Registered', 'Attended')
-        LEFT JOIN group_classes gc ON ce.class_id = gc.class_id
-        GROUP BY m.member_id, m.first_name, m.last_name;
-        """)
-        
-        conn.execute(view_sql)
-        print("View 'member_enrollment_summary' created/updated.")
+        # Trigram indexes for MemberSearch
+        create_member_search_indexes(conn)
+
+        # Seat counter (tables created before the column existed)
+        sync_enrolled_counts(conn)
+
+        # Recurring class series (tables created before series existed)
+        add_class_series(conn)
+
+        # Class waitlists
+        WaitlistEntry.__table__.create(bind=conn, checkfirst=True)
+        print("Table 'class_waitlist' verified.")
+
+        # Soft cancel (tables created before class status existed)
+        add_class_status(conn)
+
+        # Optimistic concurrency counters
+        for table in ("group_classes", "personal_training_sessions"):
+            conn.execute(DDL(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS version_id INTEGER NOT NULL DEFAULT 1;"))
+        print("Column 'version_id' verified.")
+
+        # Change tracking for incremental exports
+        add_change_tracking(conn)
+
+        # Views (backed by an incrementally maintained summary table)
+        create_enrollment_summary(conn)
 
         # Trigger
         func_sql = DDL("""
         CREATE OR REPLACE FUNCTION check_room_availability()
         RETURNS TRIGGER AS $$
         BEGIN
+            -- Cancelled bookings do not hold the room
+            IF NEW.status = 'CANCELLED' THEN
+                RETURN NEW;
+            END IF;
+
             -- Check for overlapping PT sessions
             IF EXISTS (
                 SELECT 1 FROM personal_training_sessions 
                 WHERE room_id = NEW.room_id 
                 AND scheduled_date = NEW.scheduled_date 
                 AND session_id != COALESCE(NEW.session_id, -1)
-                AND status != 'Cancelled'
+                AND status != 'CANCELLED'
                 AND start_time < NEW.end_time 
                 AND end_time > NEW.start_time
             ) THEN
@@ -72,6 +99,7 @@ def create_schema_extras():
                 WHERE room_id = NEW.room_id 
                 AND scheduled_date = NEW.scheduled_date 
                 AND class_id != COALESCE(NEW.class_id, -1)
+                AND status != 'CANCELLED'
                 AND start_time < NEW.end_time 
                 AND end_time > NEW.start_time
             ) THEN
@@ -95,9 +123,419 @@ def create_schema_extras():
             FOR EACH ROW EXECUTE FUNCTION check_room_availability();
         """)
 
-        conn.execute(func_sql)
-        conn.execute(trigger_pt_sql)
-        conn.execute(trigger_class_sql)
-        print("Trigger 'check_room_availability' created/updated.")
+        if use_exclusion_constraints:
+            create_booking_exclusion_constraints(conn)
+        else:
+            conn.execute(func_sql)
+            conn.execute(trigger_pt_sql)
+            conn.execute(trigger_class_sql)
+            print("Trigger 'check_room_availability' created/updated.")
         
-        conn.commit()
\ No newline at end of file
+        conn.commit()
+
+def drop_schema_extras():
+    """
+    Drop the view and tables create_schema_extras() adds outside the ORM models.
+    They depend on members and group_classes, so call this before Base.metadata.drop_all().
+    """
+    with engine.begin() as conn:
+        conn.execute(DDL("DROP VIEW IF EXISTS member_enrollment_summary;"))
+        conn.execute(DDL(
+            "DROP TABLE IF EXISTS member_enrollment_stats, enrollment_summary_state, booking_occupancy CASCADE;"
+        ))
+    print("Schema extras dropped.")
+
+def create_member_search_indexes(conn):
+    """
+    Enable pg_trgm and add GIN trigram indexes on members' full name and email.
+    The full name expression must match services.member_search.FULL_NAME.
+    """
+    conn.execute(DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm;"))
+    conn.execute(DDL("""
+    CREATE INDEX IF NOT EXISTS idx_member_full_name_trgm
+        ON members USING gin ((first_name || ' ' || last_name) gin_trgm_ops);
+    """))
+    conn.execute(DDL("""
+    CREATE INDEX IF NOT EXISTS idx_member_email_trgm
+        ON members USING gin (email gin_trgm_ops);
+    """))
+    print("Trigram indexes for member search verified.")
+
+def sync_enrolled_counts(conn):
+    """
+    Add group_classes.enrolled_count if missing and backfill it from class_enrollments.
+    An existing column is kept current by the services and left alone.
+    """
+    exists = conn.execute(text(
+        "SELECT EXISTS (SELECT 1 FROM information_schema.columns "
+        "WHERE table_schema = current_schema() AND table_name = 'group_classes' AND column_name = 'enrolled_count')"
+    )).scalar()
+    if exists:
+        print("Column 'group_classes.enrolled_count' verified.")
+        return
+
+    conn.execute(DDL("ALTER TABLE group_classes ADD COLUMN enrolled_count INTEGER NOT NULL DEFAULT 0;"))
+    conn.execute(DDL("""
+    UPDATE group_classes gc
+    SET enrolled_count = (
+        SELECT COUNT(*) FROM class_enrollments ce
+        WHERE ce.class_id = gc.class_id
+        AND ce.attendance_status IN ('REGISTERED', 'ATTENDED')
+    );
+    """))
+    print("Column 'group_classes.enrolled_count' added and backfilled.")
+
+def add_class_series(conn):
+    """
+    Create class_series and add group_classes.series_id if missing.
+    """
+    ClassSeries.__table__.create(bind=conn, checkfirst=True)
+    conn.execute(DDL(
+        "ALTER TABLE group_classes ADD COLUMN IF NOT EXISTS series_id INTEGER REFERENCES class_series(series_id);"
+    ))
+    conn.execute(DDL("CREATE INDEX IF NOT EXISTS ix_group_classes_series_id ON group_classes (series_id);"))
+    print("Table 'class_series' and column 'group_classes.series_id' verified.")
+
+def add_class_status(conn):
+    """
+    Add group_classes.status / cancelled_at if missing, and make enrollments and
+    waitlist entries follow their class with ON DELETE CASCADE.
+    """
+    GroupClass.__table__.c.status.type.create(bind=conn, checkfirst=True)
+    conn.execute(DDL(
+        "ALTER TABLE group_classes ADD COLUMN IF NOT EXISTS status classstatus NOT NULL DEFAULT 'SCHEDULED';"
+    ))
+    conn.execute(DDL("ALTER TABLE group_classes ADD COLUMN IF NOT EXISTS cancelled_at TIMESTAMP;"))
+
+    for table in ("class_enrollments", "class_waitlist"):
+        # Re-adding a foreign key re-validates every row, so leave one that already cascades
+        delete_rule = conn.execute(text(
+            "SELECT confdeltype FROM pg_constraint WHERE conname = :name AND conrelid = CAST(:table AS regclass)"
+        ), {"name": f"{table}_class_id_fkey", "table": table}).scalar()
+        if delete_rule == "c":
+            continue
+        conn.execute(DDL(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {table}_class_id_fkey;"))
+        conn.execute(DDL(
+            f"ALTER TABLE {table} ADD CONSTRAINT {table}_class_id_fkey FOREIGN KEY (class_id) "
+            "REFERENCES group_classes(class_id) ON DELETE CASCADE;"
+        ))
+    print("Column 'group_classes.status' and cascading class foreign keys verified.")
+
+def add_change_tracking(conn):
+    """
+    Add updated_at to enrollments and PT sessions, kept current by a BEFORE UPDATE
+    trigger so set-based and raw SQL updates move it too.
+    """
+    conn.execute(DDL("""
+    CREATE OR REPLACE FUNCTION touch_updated_at()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        NEW.updated_at := now();
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+    """))
+    for table in ("class_enrollments", "personal_training_sessions"):
+        conn.execute(DDL(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP NOT NULL DEFAULT now();"))
+        conn.execute(DDL(f"CREATE INDEX IF NOT EXISTS idx_{table}_updated_at ON {table} (updated_at);"))
+        conn.execute(DDL(f"""
+        CREATE OR REPLACE TRIGGER {table}_touch_updated_at
+            BEFORE UPDATE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+        """))
+    print("Column 'updated_at' and its trigger verified.")
+
+def create_enrollment_summary(conn):
+    """
+    Maintain per-member enrollment counts in `member_enrollment_stats` with triggers,
+    so `member_enrollment_summary` is a primary-key lookup instead of an aggregate.
+
+    "Upcoming" means scheduled after `enrollment_summary_state.as_of`. The
+    roll_enrollment_summary() function moves as_of to CURRENT_DATE and subtracts
+    classes that are no longer upcoming; it is scheduled nightly with pg_cron
+    when available, otherwise call roll_enrollment_summary() from Python daily
+    (close_day.py does).
+
+    The counts are only rebuilt from scratch when the summary is new or empty;
+    call rebuild_enrollment_summary() to repair drift.
+    """
+    conn.execute(DDL("""
+    CREATE TABLE IF NOT EXISTS member_enrollment_stats (
+        member_id INTEGER PRIMARY KEY REFERENCES members(member_id) ON DELETE CASCADE,
+        total_classes_enrolled BIGINT NOT NULL DEFAULT 0,
+        upcoming_classes BIGINT NOT NULL DEFAULT 0
+    );
+    CREATE TABLE IF NOT EXISTS enrollment_summary_state (
+        id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+        as_of DATE NOT NULL
+    );
+    """))
+
+    # Enrollment inserted, deleted, or moved in/out of an active status
+    conn.execute(DDL("""
+    CREATE OR REPLACE FUNCTION enrollment_summary_on_enrollment()
+    RETURNS TRIGGER AS $$
+    DECLARE
+        cutoff DATE := (SELECT as_of FROM enrollment_summary_state);
+        upcoming INTEGER;
+    BEGIN
+        IF TG_OP <> 'INSERT' AND OLD.attendance_status IN ('REGISTERED', 'ATTENDED') THEN
+            -- The class is already gone when the delete cascades from group_classes;
+            -- its BEFORE DELETE trigger has subtracted the upcoming count then
+            SELECT COUNT(*) INTO upcoming FROM group_classes
+            WHERE class_id = OLD.class_id AND scheduled_date > cutoff;
+
+            UPDATE member_enrollment_stats
+            SET total_classes_enrolled = total_classes_enrolled - 1,
+                upcoming_classes = upcoming_classes - upcoming
+            WHERE member_id = OLD.member_id;
+        END IF;
+
+        IF TG_OP <> 'DELETE' AND NEW.attendance_status IN ('REGISTERED', 'ATTENDED') THEN
+            SELECT COUNT(*) INTO upcoming FROM group_classes
+            WHERE class_id = NEW.class_id AND scheduled_date > cutoff;
+
+            INSERT INTO member_enrollment_stats (member_id, total_classes_enrolled, upcoming_classes)
+            VALUES (NEW.member_id, 1, upcoming)
+            ON CONFLICT (member_id) DO UPDATE
+            SET total_classes_enrolled = member_enrollment_stats.total_classes_enrolled + 1,
+                upcoming_classes = member_enrollment_stats.upcoming_classes + EXCLUDED.upcoming_classes;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """))
+
+    # Class rescheduled across the cutoff, or deleted
+    conn.execute(DDL("""
+    CREATE OR REPLACE FUNCTION enrollment_summary_on_class()
+    RETURNS TRIGGER AS $$
+    DECLARE
+        cutoff DATE := (SELECT as_of FROM enrollment_summary_state);
+        delta INTEGER := 0;
+    BEGIN
+        IF OLD.scheduled_date > cutoff THEN
+            delta := delta - 1;
+        END IF;
+        IF TG_OP = 'UPDATE' AND NEW.scheduled_date > cutoff THEN
+            delta := delta + 1;
+        END IF;
+
+        IF delta <> 0 THEN
+            UPDATE member_enrollment_stats s
+            SET upcoming_classes = s.upcoming_classes + delta * e.n
+            FROM (
+                SELECT member_id, COUNT(*) AS n FROM class_enrollments
+                WHERE class_id = OLD.class_id AND attendance_status IN ('REGISTERED', 'ATTENDED')
+                GROUP BY member_id
+            ) e
+            WHERE s.member_id = e.member_id;
+        END IF;
+        IF TG_OP = 'DELETE' THEN
+            RETURN OLD;
+        END IF;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+    """))
+
+    conn.execute(DDL("""
+    CREATE OR REPLACE TRIGGER enrollment_summary_enrollment
+        AFTER INSERT OR UPDATE OF attendance_status, class_id, member_id OR DELETE ON class_enrollments
+        FOR EACH ROW EXECUTE FUNCTION enrollment_summary_on_enrollment();
+    CREATE OR REPLACE TRIGGER enrollment_summary_class_update
+        AFTER UPDATE OF scheduled_date ON group_classes
+        FOR EACH ROW EXECUTE FUNCTION enrollment_summary_on_class();
+    CREATE OR REPLACE TRIGGER enrollment_summary_class_delete
+        BEFORE DELETE ON group_classes
+        FOR EACH ROW EXECUTE FUNCTION enrollment_summary_on_class();
+    """))
+
+    # Daily rollover: classes dated (as_of, today] stop counting as upcoming
+    conn.execute(DDL("""
+    CREATE OR REPLACE FUNCTION roll_enrollment_summary()
+    RETURNS VOID AS $$
+    DECLARE
+        previous DATE;
+    BEGIN
+        SELECT as_of INTO previous FROM enrollment_summary_state FOR UPDATE;
+        IF previous >= CURRENT_DATE THEN
+            RETURN;
+        END IF;
+
+        UPDATE member_enrollment_stats s
+        SET upcoming_classes = s.upcoming_classes - e.n
+        FROM (
+            SELECT ce.member_id, COUNT(*) AS n
+            FROM class_enrollments ce
+            JOIN group_classes gc ON gc.class_id = ce.class_id
+            WHERE ce.attendance_status IN ('REGISTERED', 'ATTENDED')
+            AND gc.scheduled_date > previous AND gc.scheduled_date <= CURRENT_DATE
+            GROUP BY ce.member_id
+        ) e
+        WHERE s.member_id = e.member_id;
+
+        UPDATE enrollment_summary_state SET as_of = CURRENT_DATE;
+    END;
+    $$ LANGUAGE plpgsql;
+    """))
+
+    # The triggers keep an existing summary current; only a new or empty one needs a recount
+    empty = conn.execute(text(
+        "SELECT NOT EXISTS (SELECT 1 FROM enrollment_summary_state) "
+        "OR NOT EXISTS (SELECT 1 FROM member_enrollment_stats)"
+    )).scalar()
+    if empty:
+        rebuild_enrollment_summary(conn)
+    elif conn.execute(text("SELECT as_of < CURRENT_DATE FROM enrollment_summary_state")).scalar():
+        logger.warning("member_enrollment_summary was behind today; rolling it forward now.")
+        conn.execute(text("SELECT roll_enrollment_summary()"))
+
+    # Same columns as the original aggregate view, now a primary-key lookup
+    conn.execute(DDL("""
+    CREATE OR REPLACE VIEW member_enrollment_summary AS
+    SELECT
+        m.member_id,
+        m.first_name || ' ' || m.last_name AS member_name,
+        COALESCE(s.total_classes_enrolled, 0) AS total_classes_enrolled,
+        COALESCE(s.upcoming_classes, 0) AS upcoming_classes
+    FROM members m
+    LEFT JOIN member_enrollment_stats s ON s.member_id = m.member_id;
+    """))
+    print("View 'member_enrollment_summary' and its summary table created/updated.")
+
+    # Nightly rollover via pg_cron, if the server has it
+    try:
+        with conn.begin_nested():
+            conn.execute(DDL("CREATE EXTENSION IF NOT EXISTS pg_cron;"))
+            conn.execute(DDL(
+                "SELECT cron.schedule('roll-enrollment-summary', '1 0 * * *', 'SELECT roll_enrollment_summary()');"
+            ))
+        print("Nightly 'roll_enrollment_summary' scheduled with pg_cron.")
+    except Exception:
+        logger.warning("pg_cron is not available: member_enrollment_summary's upcoming counts go stale "
+                       "unless roll_enrollment_summary() runs daily (close_day.py does).")
+        print("pg_cron not available; call roll_enrollment_summary() once a day.")
+
+def rebuild_enrollment_summary(conn):
+    """
+    Recount member_enrollment_stats from class_enrollments. Blocks enrollment
+    writes (SHARE lock) until the caller commits, so only run it to repair drift.
+    """
+    conn.execute(DDL("""
+    LOCK TABLE class_enrollments IN SHARE MODE;
+    INSERT INTO enrollment_summary_state (id, as_of) VALUES (TRUE, CURRENT_DATE)
+        ON CONFLICT (id) DO UPDATE SET as_of = CURRENT_DATE;
+    TRUNCATE member_enrollment_stats;
+    INSERT INTO member_enrollment_stats (member_id, total_classes_enrolled, upcoming_classes)
+        SELECT ce.member_id, COUNT(*), COUNT(*) FILTER (WHERE gc.scheduled_date > CURRENT_DATE)
+        FROM class_enrollments ce
+        JOIN group_classes gc ON gc.class_id = ce.class_id
+        WHERE ce.attendance_status IN ('REGISTERED', 'ATTENDED')
+        GROUP BY ce.member_id;
+    """))
+    print("Table 'member_enrollment_stats' rebuilt.")
+
+def roll_enrollment_summary():
+    """Advance member_enrollment_summary's upcoming counts to today (no-op if already current)."""
+    with engine.begin() as conn:
+        conn.execute(text("SELECT roll_enrollment_summary()"))
+
+def create_booking_exclusion_constraints(conn):
+    """
+    Enforce non-overlapping room and trainer bookings in the database itself.
+
+    Each booking table gets a generated `slot` tsrange column and EXCLUDE USING gist
+    constraints per room and per trainer. Bookings from both tables are also mirrored
+    into `booking_occupancy`, whose exclusion constraint catches a class overlapping
+    a PT session. Unlike the trigger, these hold across concurrent transactions.
+    """
+    conn.execute(DDL("CREATE EXTENSION IF NOT EXISTS btree_gist;"))
+
+    # The old trigger only checks rows visible in its own snapshot
+    conn.execute(DDL("DROP TRIGGER IF EXISTS room_booking_check_pt ON personal_training_sessions;"))
+    conn.execute(DDL("DROP TRIGGER IF EXISTS room_booking_check_class ON group_classes;"))
+
+    for table in ("group_classes", "personal_training_sessions"):
+        conn.execute(DDL(f"""
+        ALTER TABLE {table} ADD COLUMN IF NOT EXISTS slot tsrange
+            GENERATED ALWAYS AS (tsrange(scheduled_date + start_time, scheduled_date + end_time)) STORED;
+        """))
+
+    # Per-table constraints (cancelled classes and PT sessions free their slot)
+    constraints = [
+        ("group_classes", "excl_class_room_slot", "room_id WITH =, slot WITH &&", "WHERE (status <> 'CANCELLED')"),
+        ("group_classes", "excl_class_trainer_slot", "trainer_id WITH =, slot WITH &&", "WHERE (status <> 'CANCELLED')"),
+        ("personal_training_sessions", "excl_pt_room_slot", "room_id WITH =, slot WITH &&", "WHERE (status <> 'CANCELLED')"),
+        ("personal_training_sessions", "excl_pt_trainer_slot", "trainer_id WITH =, slot WITH &&", "WHERE (status <> 'CANCELLED')"),
+    ]
+    for table, name, elements, predicate in constraints:
+        conn.execute(DDL(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {name};"))
+        conn.execute(DDL(f"ALTER TABLE {table} ADD CONSTRAINT {name} EXCLUDE USING gist ({elements}) {predicate};"))
+        print(f"Exclusion constraint '{name}' created/updated.")
+
+    # Shared occupancy table for conflicts between classes and PT sessions
+    conn.execute(DDL("""
+    CREATE TABLE IF NOT EXISTS booking_occupancy (
+        resource_type VARCHAR(10) NOT NULL,
+        resource_id INTEGER NOT NULL,
+        slot TSRANGE NOT NULL,
+        class_id INTEGER REFERENCES group_classes(class_id) ON DELETE CASCADE,
+        session_id INTEGER REFERENCES personal_training_sessions(session_id) ON DELETE CASCADE,
+        CONSTRAINT excl_occupancy_slot EXCLUDE USING gist (resource_type WITH =, resource_id WITH =, slot WITH &&)
+    );
+    """))
+
+    conn.execute(DDL("""
+    CREATE OR REPLACE FUNCTION sync_booking_occupancy()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_TABLE_NAME = 'group_classes' THEN
+            IF TG_OP <> 'INSERT' THEN
+                DELETE FROM booking_occupancy WHERE class_id = OLD.class_id;
+            END IF;
+            IF TG_OP <> 'DELETE' AND NEW.status <> 'CANCELLED' THEN
+                INSERT INTO booking_occupancy (resource_type, resource_id, slot, class_id)
+                VALUES ('room', NEW.room_id, NEW.slot, NEW.class_id),
+                       ('trainer', NEW.trainer_id, NEW.slot, NEW.class_id);
+            END IF;
+        ELSE
+            IF TG_OP <> 'INSERT' THEN
+                DELETE FROM booking_occupancy WHERE session_id = OLD.session_id;
+            END IF;
+            IF TG_OP <> 'DELETE' AND NEW.status <> 'CANCELLED' THEN
+                INSERT INTO booking_occupancy (resource_type, resource_id, slot, session_id)
+                VALUES ('room', NEW.room_id, NEW.slot, NEW.session_id),
+                       ('trainer', NEW.trainer_id, NEW.slot, NEW.session_id);
+            END IF;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """))
+
+    # Only slot-relevant columns, so seat counter updates do not touch the index
+    slot_columns = {
+        "group_classes": "room_id, trainer_id, scheduled_date, start_time, end_time, status",
+        "personal_training_sessions": "room_id, trainer_id, scheduled_date, start_time, end_time, status",
+    }
+    for table, columns in slot_columns.items():
+        conn.execute(DDL(f"""
+        CREATE OR REPLACE TRIGGER booking_occupancy_sync
+            AFTER INSERT OR UPDATE OF {columns} OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION sync_booking_occupancy();
+        """))
+
+    # Backfill from existing bookings
+    conn.execute(DDL("""
+    TRUNCATE booking_occupancy;
+    INSERT INTO booking_occupancy (resource_type, resource_id, slot, class_id)
+        SELECT 'room', room_id, slot, class_id FROM group_classes WHERE status <> 'CANCELLED'
+        UNION ALL
+        SELECT 'trainer', trainer_id, slot, class_id FROM group_classes WHERE status <> 'CANCELLED';
+    INSERT INTO booking_occupancy (resource_type, resource_id, slot, session_id)
+        SELECT 'room', room_id, slot, session_id FROM personal_training_sessions WHERE status <> 'CANCELLED'
+        UNION ALL
+        SELECT 'trainer', trainer_id, slot, session_id FROM personal_training_sessions WHERE status <> 'CANCELLED';
+    """))
+    print("Table 'booking_occupancy' and its sync trigger created/updated.")
\ No newline at end of file
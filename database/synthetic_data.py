@@ -0,0 +1,322 @@
+import random
+import time as clock
+from bisect import bisect_left
+from datetime import date, time, timedelta
+from itertools import accumulate
+
+from sqlalchemy import text
+from database.connection import SessionLocal, engine, Base
+
+# Import all models so create_all knows every table
+from models.member import Member
+from models.trainer import Trainer
+from models.room import Room
+from models.admin_staff import AdminStaff
+from models.group_class import GroupClass
+from models.personal_training_session import PersonalTrainingSession
+from models.class_enrollment import ClassEnrollment
+from models.class_series import ClassSeries
+from models.class_waitlist import WaitlistEntry
+
+FIRST_NAMES = [
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda", "David", "Elizabeth",
+    "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Chris", "Karen",
+    "Daniel", "Lisa", "Matthew", "Nancy", "Anthony", "Sandra", "Mark", "Ashley", "Steven", "Emily",
+    "Andrew", "Michelle", "Joshua", "Amanda", "Kevin", "Melissa", "Brian", "Stephanie", "Priya", "Wei",
+    "Aarav", "Fatima", "Omar", "Sofia", "Mateo", "Yuki", "Hiro", "Amara", "Kwame", "Ingrid"
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+    "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin",
+    "Lee", "Perez", "Thompson", "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson",
+    "Walker", "Young", "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill", "Flores",
+    "Patel", "Chen", "Kim", "Singh", "Das", "Khan", "Okafor", "Novak", "Rossi", "Larsen"
+]
+SPECIALIZATIONS = ["HIIT", "Strength", "Yoga", "Pilates", "Cardio", "Spin", "Boxing", "Mobility", "CrossFit", "Swimming"]
+
+# room_type -> (capacity range, class names held there)
+ROOM_TYPES = {
+    "Studio": ((15, 30), ["Morning Yoga", "Vinyasa Flow", "Pilates Core", "Barre", "Stretch & Mobility"]),
+    "Cardio": ((20, 50), ["HIIT Blast", "Cardio Kickboxing", "Step Aerobics", "Zumba"]),
+    "Weights": ((10, 40), ["Strength Circuit", "Olympic Lifting", "Kettlebell Basics", "Bootcamp"]),
+    "Spin": ((15, 35), ["Spin Express", "Endurance Ride", "Rhythm Ride"]),
+    "Pool": ((10, 25), ["Aqua Fit", "Lap Swim Technique"]),
+}
+
+# Bookable hours (each booking starts on the hour and lasts at most 60 minutes)
+FIRST_HOUR, LAST_HOUR = 6, 21
+
+# Attendance/session status mix by whether the date has already passed
+PAST_ENROLLMENT_MIX = (("ATTENDED", 0.80), ("ABSENT", 0.12), ("CANCELLED", 0.08))
+FUTURE_ENROLLMENT_MIX = (("REGISTERED", 0.92), ("CANCELLED", 0.08))
+PAST_SESSION_MIX = (("COMPLETED", 0.85), ("NO_SHOW", 0.07), ("CANCELLED", 0.08))
+FUTURE_SESSION_MIX = (("SCHEDULED", 0.95), ("CANCELLED", 0.05))
+
+def _rng(seed: int, stream: str) -> random.Random:
+    """Independent, reproducible random stream per table."""
+    return random.Random(f"{seed}:{stream}")
+
+def _pick(rng: random.Random, mix):
+    r = rng.random()
+    for value, weight in mix:
+        r -= weight
+        if r < 0:
+            return value
+    return mix[-1][0]
+
+def _split(rng: random.Random, n: int, mix):
+    """Split n enrollments across the statuses of `mix`."""
+    counts = dict.fromkeys((value for value, _ in mix), 0)
+    for _ in range(n):
+        counts[_pick(rng, mix)] += 1
+    return counts
+
+# Bulk synthetic dataset for load and performance testing
+class SyntheticDataGenerator:
+    """
+    Generates a realistic, reproducible dataset (same seed and start date,
+    same rows) and loads it table by table with batched COPY.
+
+    Classes and PT sessions sit on an hourly grid; in any hour a room and a
+    trainer are used by at most one booking, so nothing overlaps. Member
+    activity is skewed (a few very active members, a long tail of occasional
+    ones), and statuses depend on whether the date is before `as_of` (default:
+    the middle of the range, so the output never depends on the run date).
+
+    Tables must be empty: ids are assigned here and sequences are advanced
+    afterwards. Apply create_schema_extras() after loading; if it is already
+    applied, its triggers fire for every copied row and the load is slower.
+    """
+
+    def __init__(self, seed: int = 42, members: int = 100_000, trainers: int = 300, rooms: int = 150,
+                 days: int = 365, start_date: date = None, classes_per_room_per_day: int = 6,
+                 sessions_per_trainer_per_day: int = 3, batch_size: int = 50_000, as_of: date = None):
+        self.seed = seed
+        self.members = members
+        self.trainers = trainers
+        self.rooms = rooms
+        self.days = days
+        # Half the year behind us, half ahead, unless pinned for exact reproducibility
+        self.start_date = start_date or date.today() - timedelta(days=days // 2)
+        self.classes_per_room_per_day = classes_per_room_per_day
+        self.sessions_per_trainer_per_day = sessions_per_trainer_per_day
+        self.batch_size = batch_size
+        # Days before this one are treated as past (attended, absent, completed)
+        self.as_of = as_of or self.start_date + timedelta(days=days // 2)
+        self.counts = {}
+
+    def run(self):
+        Base.metadata.create_all(bind=engine)
+        db = SessionLocal()
+        try:
+            if db.query(Room).first() or db.query(Member).first():
+                print("Database already contains data. Skipping synthetic data generation.")
+                return self.counts
+
+            started = clock.perf_counter()
+            member_weights = self._load_members(db)
+            self._load_trainers(db)
+            room_rows = self._load_rooms(db)
+            self._load_admins(db)
+            classes, sessions = self._build_schedule(room_rows, member_weights)
+            self._copy(db, "group_classes",
+                       ("class_id", "class_name", "trainer_id", "room_id", "scheduled_date",
+                        "start_time", "end_time", "capacity", "enrolled_count"),
+                       (c[:9] for c in classes))
+            self._copy(db, "personal_training_sessions",
+                       ("session_id", "member_id", "trainer_id", "room_id", "scheduled_date",
+                        "start_time", "end_time", "status", "notes"),
+                       sessions)
+            self._copy(db, "class_enrollments",
+                       ("enrollment_id", "class_id", "member_id", "enrollment_date", "attendance_status"),
+                       self._enrollments(classes, member_weights))
+            self._reset_sequences(db)
+            db.execute(text("ANALYZE"))
+            db.commit()
+            print(f"Synthetic data loaded in {clock.perf_counter() - started:.1f}s: {self.counts}")
+            return self.counts
+        except Exception as e:
+            db.rollback()
+            raise e
+        finally:
+            db.close()
+
+    # --- Reference data ---
+    def _load_members(self, db):
+        rng = _rng(self.seed, "members")
+        weights = []
+
+        def rows():
+            for member_id in range(1, self.members + 1):
+                first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+                # Skewed activity (log-normal): used to pick who enrolls and books PT
+                weights.append(rng.lognormvariate(0, 0.9))
+                yield (
+                    member_id,
+                    f"{first}.{last}.{member_id}@example.com".lower(),
+                    first,
+                    last,
+                    date(1950, 1, 1) + timedelta(days=rng.randrange(57 * 365)),
+                    _pick(rng, (("FEMALE", 0.49), ("MALE", 0.48), ("OTHER", 0.03))),
+                    self.start_date - timedelta(days=rng.randrange(5 * 365))
+                )
+
+        self._copy(db, "members",
+                   ("member_id", "email", "first_name", "last_name", "date_of_birth", "gender", "registration_date"),
+                   rows())
+        return list(accumulate(weights))
+
+    def _load_trainers(self, db):
+        rng = _rng(self.seed, "trainers")
+        rows = []
+        for trainer_id in range(1, self.trainers + 1):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            rows.append((
+                trainer_id,
+                f"{first}.{last}.{trainer_id}@fit.com".lower(),
+                first,
+                last,
+                rng.choice(SPECIALIZATIONS),
+                self.start_date - timedelta(days=rng.randrange(10 * 365))
+            ))
+        self._copy(db, "trainers", ("trainer_id", "email", "first_name", "last_name", "specialization", "hire_date"), rows)
+
+    def _load_rooms(self, db):
+        rng = _rng(self.seed, "rooms")
+        types = list(ROOM_TYPES)
+        rows = []
+        for room_id in range(1, self.rooms + 1):
+            room_type = types[(room_id - 1) % len(types)]
+            low, high = ROOM_TYPES[room_type][0]
+            rows.append((room_id, f"{room_type} {room_id}", rng.randint(low, high), room_type))
+        self._copy(db, "rooms", ("room_id", "room_name", "capacity", "room_type"), rows)
+        return rows
+
+    def _load_admins(self, db):
+        rows = [(i, f"admin{i}@fit.com", "Admin", f"User {i}", "Manager" if i == 1 else "Front Desk", self.start_date)
+                for i in range(1, 6)]
+        self._copy(db, "admin", ("admin_id", "email", "first_name", "last_name", "role", "hire_date"), rows)
+
+    # --- Schedule ---
+    def _build_schedule(self, room_rows, member_weights):
+        """
+        Classes and PT sessions for every day and hour. Returns
+        (classes, sessions); each class row carries its enrollment plan
+        (status counts) after the columns that are copied.
+        """
+        rng = _rng(self.seed, "schedule")
+        hours = list(range(FIRST_HOUR, LAST_HOUR + 1))
+        class_probability = min(1.0, self.classes_per_room_per_day / len(hours))
+        sessions_per_hour = self.trainers * self.sessions_per_trainer_per_day / len(hours)
+        trainer_ids = list(range(1, self.trainers + 1))
+        member_ids = range(1, self.members + 1)
+
+        classes, sessions = [], []
+        for day in range(self.days):
+            sched_date = self.start_date + timedelta(days=day)
+            past = sched_date < self.as_of
+            for hour in hours:
+                start = time(hour, 0)
+                used_rooms, free_rooms = [], []
+                for room in room_rows:
+                    if rng.random() < class_probability and len(used_rooms) < self.trainers:
+                        used_rooms.append(room)
+                    else:
+                        free_rooms.append(room)
+                busy_trainers = rng.sample(trainer_ids, len(used_rooms))
+
+                for (room_id, _, room_capacity, room_type), trainer_id in zip(used_rooms, busy_trainers):
+                    capacity = rng.randint(max(5, room_capacity // 2), room_capacity)
+                    # Popular slots fill up; quiet ones run half empty
+                    enrolled = min(capacity, self.members, int(capacity * rng.betavariate(4, 2) + 0.5))
+                    plan = _split(rng, enrolled, PAST_ENROLLMENT_MIX if past else FUTURE_ENROLLMENT_MIX)
+                    active = plan.get("ATTENDED", 0) + plan.get("REGISTERED", 0)
+                    classes.append((
+                        len(classes) + 1,
+                        rng.choice(ROOM_TYPES[room_type][1]),
+                        trainer_id,
+                        room_id,
+                        sched_date,
+                        start,
+                        time(hour, 45) if rng.random() < 0.4 else time(hour + 1, 0),
+                        capacity,
+                        active,
+                        plan
+                    ))
+
+                # PT sessions take trainers and rooms left free this hour
+                wanted = int(sessions_per_hour) + (rng.random() < sessions_per_hour % 1)
+                busy = set(busy_trainers)
+                free_trainers = [t for t in trainer_ids if t not in busy]
+                count = min(wanted, len(free_trainers), len(free_rooms))
+                for trainer_id, room in zip(rng.sample(free_trainers, count), rng.sample(free_rooms, count)):
+                    member_id = member_ids[bisect_left(member_weights, rng.random() * member_weights[-1])]
+                    sessions.append((
+                        len(sessions) + 1,
+                        member_id,
+                        trainer_id,
+                        room[0],
+                        sched_date,
+                        start,
+                        time(hour + 1, 0),
+                        _pick(rng, PAST_SESSION_MIX if past else FUTURE_SESSION_MIX),
+                        None
+                    ))
+        return classes, sessions
+
+    def _enrollments(self, classes, member_weights):
+        rng = _rng(self.seed, "enrollments")
+        total = member_weights[-1]
+        enrollment_id = 0
+        for class_row in classes:
+            class_id, sched_date, plan = class_row[0], class_row[4], class_row[9]
+            wanted = sum(plan.values())
+            if not wanted:
+                continue
+
+            # Weighted draw without repeats (more active members enroll more often)
+            chosen = set()
+            while len(chosen) < wanted:
+                chosen.add(bisect_left(member_weights, rng.random() * total) + 1)
+            members = sorted(chosen)
+            rng.shuffle(members)
+
+            i = 0
+            for status, n in plan.items():
+                for member_id in members[i:i + n]:
+                    enrollment_id += 1
+                    yield (enrollment_id, class_id, member_id,
+                           sched_date - timedelta(days=rng.randrange(1, 22)), status)
+                i += n
+
+    # --- Loading ---
+    def _copy(self, db, table: str, columns, rows):
+        """COPY rows into `table` in batches of batch_size, committing after each batch."""
+        copied = 0
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                copied += self._copy_batch(db, table, columns, batch)
+                batch = []
+        if batch:
+            copied += self._copy_batch(db, table, columns, batch)
+        self.counts[table] = copied
+        print(f"  {table}: {copied} rows")
+
+    def _copy_batch(self, db, table: str, columns, batch) -> int:
+        cursor = db.connection().connection.driver_connection.cursor()
+        with cursor.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+            for row in batch:
+                copy.write_row(row)
+        db.commit()
+        return len(batch)
+
+    def _reset_sequences(self, db):
+        for table, column in (("members", "member_id"), ("trainers", "trainer_id"), ("rooms", "room_id"),
+                              ("admin", "admin_id"), ("group_classes", "class_id"),
+                              ("personal_training_sessions", "session_id"), ("class_enrollments", "enrollment_id")):
+            db.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', '{column}'), "
+                f"COALESCE((SELECT MAX({column}) FROM {table}), 0) + 1, false)"
+            ))
@@ -0,0 +1,34 @@
+import argparse
+from datetime import datetime
+from database.connection import SessionLocal
+from services.export_service import ExportService, DATASETS, DEFAULT_STATE_PATH
+
+def _parse_date(value):
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+def main():
+    parser = argparse.ArgumentParser(description="Export class enrollments or PT sessions for reporting.")
+    parser.add_argument("dataset", choices=DATASETS)
+    parser.add_argument("path", help="Output file")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--start", type=_parse_date, help="First scheduled date (YYYY-MM-DD)")
+    parser.add_argument("--end", type=_parse_date, help="Last scheduled date (YYYY-MM-DD)")
+    parser.add_argument("--incremental", action="store_true", help="Only rows added or changed since the last incremental export (no --start/--end)")
+    parser.add_argument("--state", default=DEFAULT_STATE_PATH, help="Where incremental progress is kept")
+    args = parser.parse_args()
+    if args.incremental and (args.start or args.end):
+        parser.error("--incremental exports whole datasets; it cannot be combined with --start/--end")
+
+    db = SessionLocal()
+    try:
+        result = ExportService(db, state_path=args.state).export(
+            args.dataset, args.path, args.format, args.start, args.end, args.incremental
+        )
+    finally:
+        db.close()
+
+    watermark = f" (changes up to {result['watermark']:%Y-%m-%d %H:%M:%S})" if result['watermark'] else ""
+    print(f"Exported {result['rows']} {result['dataset']} rows to {result['path']}{watermark}.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import argparse
+from datetime import datetime
+from database.synthetic_data import SyntheticDataGenerator
+
+def main():
+    parser = argparse.ArgumentParser(description="Load a large, reproducible synthetic dataset for performance testing.")
+    parser.add_argument("--seed", type=int, default=42, help="Same seed (and start date) gives the same data")
+    parser.add_argument("--members", type=int, default=100_000)
+    parser.add_argument("--trainers", type=int, default=300)
+    parser.add_argument("--rooms", type=int, default=150)
+    parser.add_argument("--days", type=int, default=365, help="Length of the class/PT schedule")
+    parser.add_argument("--start-date", help="First scheduled day (YYYY-MM-DD); defaults to half the range before today")
+    parser.add_argument("--as-of", help="Days before this one (YYYY-MM-DD) get past statuses; defaults to the middle of the range")
+    parser.add_argument("--classes-per-room", type=int, default=6, help="Average group classes per room per day")
+    parser.add_argument("--sessions-per-trainer", type=int, default=3, help="Average PT sessions per trainer per day")
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Rows per COPY transaction")
+    args = parser.parse_args()
+
+    start_date = datetime.strptime(args.start_date, "%Y-%m-%d").date() if args.start_date else None
+    as_of = datetime.strptime(args.as_of, "%Y-%m-%d").date() if args.as_of else None
+    print("--- GENERATING SYNTHETIC DATA ---")
+    SyntheticDataGenerator(
+        seed=args.seed,
+        members=args.members,
+        trainers=args.trainers,
+        rooms=args.rooms,
+        days=args.days,
+        start_date=start_date,
+        classes_per_room_per_day=args.classes_per_room,
+        sessions_per_trainer_per_day=args.sessions_per_trainer,
+        batch_size=args.batch_size,
+        as_of=as_of
+    ).run()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
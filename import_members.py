@@ -0,0 +1,26 @@
+import argparse
+from database.connection import SessionLocal
+from services.member_import import MemberImportService
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import members from a CSV or JSONL file.")
+    parser.add_argument("path", help="File with email, first_name, last_name, date_of_birth (YYYY-MM-DD), gender")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="Defaults to the file extension")
+    parser.add_argument("--batch-size", type=int, default=10000, help="Rows per COPY/merge transaction")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        report = MemberImportService(db, batch_size=args.batch_size).import_file(args.path, args.format)
+    finally:
+        db.close()
+
+    print("--- MEMBER IMPORT COMPLETE ---")
+    print(f"Inserted: {report['inserted']}")
+    print(f"Skipped (already registered or duplicate): {report['skipped']}")
+    print(f"Invalid: {report['invalid']}")
+    for record_no, error in report["errors"]:
+        print(f"  Record {record_no}: {error}")
+
+if __name__ == "__main__":
+    main()
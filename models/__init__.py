@@ -4,4 +4,6 @@ from .admin_staff import AdminStaff
 from .room import Room
 from .group_class import GroupClass
 from .personal_training_session import PersonalTrainingSession
-from .class_enrollment import ClassEnrollment
\ No newline at end of file
+from .class_enrollment import ClassEnrollment
+from .class_series import ClassSeries
+from .class_waitlist import WaitlistEntry
\ No newline at end of file
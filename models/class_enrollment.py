@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Date, Enum
+from sqlalchemy import Column, Integer, ForeignKey, Date, DateTime, Enum, func
 from sqlalchemy.orm import relationship
 from database.connection import Base
 import enum
@@ -14,10 +14,12 @@ class ClassEnrollment(Base):
     
     # Attributes
     enrollment_id = Column(Integer, primary_key=True, autoincrement=True)
-    class_id = Column(Integer, ForeignKey('group_classes.class_id'), nullable=False)
+    class_id = Column(Integer, ForeignKey('group_classes.class_id', ondelete='CASCADE'), nullable=False)
     member_id = Column(Integer, ForeignKey('members.member_id'), nullable=False)
     enrollment_date = Column(Date, nullable=False)
     attendance_status = Column(Enum(AttendanceStatus), default=AttendanceStatus.REGISTERED)
+    # Change-tracking watermark for incremental exports (also set by a trigger, see schema_extras)
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
     
     # Relationships
     group_class = relationship("GroupClass", back_populates="enrollments")
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, Date, Time, ForeignKey
+from sqlalchemy.orm import relationship
+from database.connection import Base
+
+class ClassSeries(Base):
+    __tablename__ = 'class_series'
+
+    # Attributes
+    series_id = Column(Integer, primary_key=True, autoincrement=True)
+    class_name = Column(String(200), nullable=False)
+    trainer_id = Column(Integer, ForeignKey('trainers.trainer_id'), nullable=False)
+    room_id = Column(Integer, ForeignKey('rooms.room_id'), nullable=False)
+    start_time = Column(Time, nullable=False)
+    end_time = Column(Time, nullable=False)
+    capacity = Column(Integer, nullable=False)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=False)
+    # Recurrence rule: weekdays as "0,2,4" (Monday = 0) every `interval_weeks`; NULL for custom dates
+    weekdays = Column(String(20))
+    interval_weeks = Column(Integer, nullable=False, default=1)
+
+    # Relationships
+    classes = relationship("GroupClass", back_populates="series")
+
+    def __repr__(self):
+        return f"<ClassSeries(id={self.series_id}, name={self.class_name}, {self.start_date} to {self.end_date})>"
\ No newline at end of file
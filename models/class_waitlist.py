@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from database.connection import Base
+
+class WaitlistEntry(Base):
+    __tablename__ = 'class_waitlist'
+    __table_args__ = (
+        UniqueConstraint('class_id', 'member_id', name='uq_class_waitlist_member'),
+        # Next in line for a class, read in queue order
+        Index('ix_class_waitlist_queue', 'class_id', 'waitlist_id'),
+    )
+
+    # Attributes (waitlist_id gives the queue order)
+    waitlist_id = Column(Integer, primary_key=True, autoincrement=True)
+    class_id = Column(Integer, ForeignKey('group_classes.class_id', ondelete='CASCADE'), nullable=False)
+    member_id = Column(Integer, ForeignKey('members.member_id'), nullable=False)
+    joined_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    # Relationships
+    group_class = relationship("GroupClass", back_populates="waitlist")
+    member = relationship("Member")
+
+    def __repr__(self):
+        return f"<WaitlistEntry(class={self.class_id}, member={self.member_id})>"
\ No newline at end of file
@@ -1,6 +1,11 @@
-from sqlalchemy import Column, Integer, String, Date, Time, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Date, Time, DateTime, ForeignKey, Text, Enum
 from sqlalchemy.orm import relationship
 from database.connection import Base
+import enum
+
+class ClassStatus(enum.Enum):
+    SCHEDULED = "Scheduled"
+    CANCELLED = "Cancelled"
 
 class GroupClass(Base):
     __tablename__ = 'group_classes'
@@ -14,11 +19,28 @@ class GroupClass(Base):
     start_time = Column(Time, nullable=False)
     end_time = Column(Time, nullable=False)
     capacity = Column(Integer, nullable=False)
-    
+    # Active (Registered/Attended) enrollments, maintained by the services
+    enrolled_count = Column(Integer, nullable=False, default=0, server_default='0')
+    # Recurring series this class was created from (NULL for one-off classes)
+    series_id = Column(Integer, ForeignKey('class_series.series_id'), index=True)
+    # Cancelled classes are kept for the record but no longer hold their room, trainer or seats
+    status = Column(Enum(ClassStatus), nullable=False, default=ClassStatus.SCHEDULED,
+                    server_default=ClassStatus.SCHEDULED.name)
+    cancelled_at = Column(DateTime)
+    # Bumped on every edit; concurrent edits fail with StaleDataError
+    version_id = Column(Integer, nullable=False, default=1, server_default='1')
+
+    __mapper_args__ = {"version_id_col": version_id}
+
     # Relationships
     trainer = relationship("Trainer", back_populates="group_classes")
     room = relationship("Room", back_populates="group_classes")
-    enrollments = relationship("ClassEnrollment", back_populates="group_class", cascade="all, delete-orphan")
+    # Deleting a class leaves its enrollments and waitlist to ON DELETE CASCADE
+    enrollments = relationship("ClassEnrollment", back_populates="group_class", cascade="all, delete-orphan",
+                               passive_deletes=True)
+    waitlist = relationship("WaitlistEntry", back_populates="group_class", cascade="all, delete-orphan",
+                            passive_deletes=True, order_by="WaitlistEntry.waitlist_id")
+    series = relationship("ClassSeries", back_populates="classes")
     
     def __repr__(self):
         return f"<GroupClass(id={self.class_id}, name={self.class_name}, date={self.scheduled_date})>"
@@ -26,12 +48,16 @@ class GroupClass(Base):
     @property
     def current_enrollment(self):
         """Get current number of active enrollments"""
-        return len([e for e in self.enrollments if e.attendance_status.value in ["Registered", "Attended"]])
+        return self.enrolled_count or 0
     
     @property
     def is_full(self):
         """Check if class is at capacity"""
         return self.current_enrollment >= self.capacity
+
+    @property
+    def is_cancelled(self):
+        return self.status == ClassStatus.CANCELLED
     
     def get_active_enrollments(self):
         """Get all active enrollments (not cancelled)"""
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Date, Time, String, Enum
+from sqlalchemy import Column, Integer, ForeignKey, Date, Time, DateTime, String, Enum, func
 from sqlalchemy.orm import relationship
 from database.connection import Base
 import enum
@@ -22,6 +22,12 @@ class PersonalTrainingSession(Base):
     end_time = Column(Time, nullable=False)
     status = Column(Enum(SessionStatus), default=SessionStatus.SCHEDULED)
     notes = Column(String(500))
+    # Change-tracking watermark for incremental exports (also set by a trigger, see schema_extras)
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+    # Bumped on every ORM update; concurrent edits fail with StaleDataError
+    version_id = Column(Integer, nullable=False, default=1, server_default='1')
+
+    __mapper_args__ = {"version_id_col": version_id}
     
     # Relationships
     member = relationship("Member", back_populates="pt_sessions")
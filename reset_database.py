@@ -1,5 +1,6 @@
 from database.connection import engine, Base
 from database.seed_data import seed_database
+from database.schema_extras import drop_schema_extras
 
 # Import all models to ensure SQLAlchemy knows about them
 from models.member import Member
@@ -9,11 +10,15 @@ from models.admin_staff import AdminStaff
 from models.group_class import GroupClass
 from models.personal_training_session import PersonalTrainingSession
 from models.class_enrollment import ClassEnrollment
+from models.class_series import ClassSeries
+from models.class_waitlist import WaitlistEntry
 
 def reset():
     print("--- RESETTING DATABASE ---")
     print("1. Dropping all existing tables...")
     # This deletes the broken tables so we can start fresh
+    # (views and summary tables from the schema extras depend on them)
+    drop_schema_extras()
     Base.metadata.drop_all(bind=engine)
     print("   Tables dropped.")
     
@@ -0,0 +1,34 @@
+import argparse
+import csv
+from database.connection import SessionLocal
+from services.admin_service import AdminService
+from services.room_assignment import parse_class_request
+
+def main():
+    parser = argparse.ArgumentParser(description="Schedule a timetable of group classes, assigning rooms automatically.")
+    parser.add_argument("path", help="CSV with class_name, trainer_id, date (YYYY-MM-DD), start_time, end_time (HH:MM), capacity[, room_type]")
+    parser.add_argument("--dry-run", action="store_true", help="Show the room plan without creating classes")
+    args = parser.parse_args()
+
+    with open(args.path, newline="", encoding="utf-8") as f:
+        requests = []
+        for record_no, record in enumerate(csv.DictReader(f), start=1):
+            try:
+                requests.append(parse_class_request(record))
+            except ValueError as e:
+                print(f"  Record {record_no}: {e}")
+
+    db = SessionLocal()
+    try:
+        result = AdminService(db).schedule_classes(requests, dry_run=args.dry_run)
+    finally:
+        db.close()
+
+    print("--- ROOM PLAN ---" if args.dry_run else "--- CLASSES SCHEDULED ---")
+    print(f"Placed: {len(result['assignments'])} of {len(requests)} classes in {len(result['rooms_used'])} rooms")
+    for item in result["unplaced"]:
+        req = item["request"]
+        print(f"  {req.class_name} on {req.scheduled_date} {req.start_time:%H:%M}-{req.end_time:%H:%M}: {item['reason']}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
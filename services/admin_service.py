@@ -1,18 +1,99 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
-from datetime import datetime, date, time
+from sqlalchemy import and_, or_, select, insert, update, delete, func
+from datetime import datetime, date, time, timedelta
+from typing import List, Dict, Any, Iterable, Tuple
 
-from models.group_class import GroupClass
+from database.instrumentation import instrument_service
+from models.group_class import GroupClass, ClassStatus
 from models.room import Room
 from models.trainer import Trainer
 from models.member import Member 
-from models.personal_training_session import PersonalTrainingSession, SessionStatus
 from models.class_enrollment import ClassEnrollment, AttendanceStatus
+from models.class_series import ClassSeries
+from models.class_waitlist import WaitlistEntry
+from services.availability import AvailabilityEngine, is_booking_conflict
+from services.dashboard import DashboardCache, dashboard_cache
+from services.class_series import expand_weekly, occurrence_conflicts_query, conflicts_by_occurrence
+from services.room_assignment import ClassRequest, assign_rooms
+from services.waitlist import promotion_statement
+from services.concurrency import conflict
+from services.reference_data import ReferenceData, reference_data
+from services.read_models import MemberRow, ClassRow, members_query, classes_query, fetch_all, fetch_page, fetch_stream
+from services.pagination import DEFAULT_PAGE_SIZE, DEFAULT_BATCH_SIZE
+
+def reschedule_statement(class_id: int, expected_version: int, new_date: date, new_start: time, new_end: time):
+    """Compare-and-set: move the class only if it is still scheduled and at `expected_version`."""
+    return (
+        update(GroupClass)
+        .where(
+            GroupClass.class_id == class_id,
+            GroupClass.version_id == expected_version,
+            GroupClass.status == ClassStatus.SCHEDULED
+        )
+        .values(scheduled_date=new_date, start_time=new_start, end_time=new_end,
+                version_id=GroupClass.version_id + 1)
+        .returning(GroupClass)
+        .execution_options(populate_existing=True)
+    )
+
+# Set-based soft cancel: one statement per table for all classes matching `criteria`
+def cancel_classes_statement(*criteria):
+    """
+    Mark matching scheduled classes Cancelled and free their registered seats;
+    returns their ids. Attended enrollments stay active, so they stay counted.
+    """
+    attended = (
+        select(func.count())
+        .where(ClassEnrollment.class_id == GroupClass.class_id,
+               ClassEnrollment.attendance_status == AttendanceStatus.ATTENDED)
+        .scalar_subquery()
+    )
+    return (
+        update(GroupClass)
+        .where(*criteria, GroupClass.status == ClassStatus.SCHEDULED)
+        .values(status=ClassStatus.CANCELLED, cancelled_at=func.now(), enrolled_count=attended,
+                version_id=GroupClass.version_id + 1)
+        .returning(GroupClass.class_id)
+        .execution_options(synchronize_session=False)
+    )
+
+def _cancelled_classes(*criteria):
+    return select(GroupClass.class_id).where(*criteria, GroupClass.status == ClassStatus.CANCELLED)
+
+def cancel_registrations_statement(*criteria):
+    """Cancel the registrations of cancelled classes matching `criteria`; returns the member ids."""
+    return (
+        update(ClassEnrollment)
+        .where(
+            ClassEnrollment.class_id.in_(_cancelled_classes(*criteria)),
+            ClassEnrollment.attendance_status == AttendanceStatus.REGISTERED
+        )
+        .values(attendance_status=AttendanceStatus.CANCELLED)
+        .returning(ClassEnrollment.member_id)
+        .execution_options(synchronize_session=False)
+    )
+
+def clear_waitlists_statement(*criteria):
+    return (
+        delete(WaitlistEntry)
+        .where(WaitlistEntry.class_id.in_(_cancelled_classes(*criteria)))
+        .execution_options(synchronize_session=False)
+    )
+
+def cancel_statements(*criteria):
+    """The three soft-cancel statements, in the order they must run (see AdminService._cancel_where)."""
+    return (cancel_classes_statement(*criteria), cancel_registrations_statement(*criteria),
+            clear_waitlists_statement(*criteria))
 
 # All admin functionality
+@instrument_service
 class AdminService:
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, availability: AvailabilityEngine = None,
+                 dashboard: DashboardCache = None, reference: ReferenceData = None):
         self.db = db_session
+        self.availability = availability or AvailabilityEngine(db_session)
+        self.dashboard = dashboard or dashboard_cache
+        self.reference = reference or reference_data
 
     # Create new room
     def add_room(self, name: str, capacity: int, room_type: str = "General"):
@@ -24,6 +105,7 @@ class AdminService:
             new_room = Room(room_name=name, capacity=capacity, room_type=room_type)
             self.db.add(new_room)
             self.db.commit()
+            self.reference.invalidate()
             return new_room
         except Exception as e:
             self.db.rollback()
@@ -41,6 +123,7 @@ class AdminService:
             )
             self.db.add(new_trainer)
             self.db.commit()
+            self.reference.invalidate()
             return new_trainer
         except Exception as e:
             self.db.rollback()
@@ -50,7 +133,7 @@ class AdminService:
     def create_group_class(self, name: str, trainer_id: int, room_id: int, 
                            sched_date: date, start: time, end: time, capacity: int):
         try:
-            room = self.db.query(Room).get(room_id)
+            room = self.reference.room(self.db, room_id)
             if not room:
                 raise ValueError("Room not found.")
             
@@ -74,17 +157,34 @@ class AdminService:
             )
             self.db.add(new_class)
             self.db.commit()
+            self.availability.add_class(new_class)
             return new_class
         except Exception as e:
             self.db.rollback()
+            if is_booking_conflict(e):
+                self.availability.invalidate()
+                raise ValueError("The room or trainer was booked by another user for this time slot.") from e
             raise e
 
     #  Change time for a class
-    def reschedule_class(self, class_id: int, new_date: date, new_start: time, new_end: time):
+    def reschedule_class(self, class_id: int, new_date: date, new_start: time, new_end: time,
+                         expected_version: int = None):
+        """
+        Compare-and-set on `version_id`: pass the version the admin was shown
+        (default: the one read here) and the move only applies if nobody changed
+        the class since. No row lock is held while the admin picks the new time;
+        a lost race raises ConcurrentUpdateError.
+        """
         try:
-            group_class = self.db.query(GroupClass).get(class_id)
+            group_class = self.db.get(GroupClass, class_id)
             if not group_class:
                 raise ValueError("Class not found.")
+            if group_class.is_cancelled:
+                raise ValueError("Cancelled classes cannot be rescheduled.")
+            if expected_version is None:
+                expected_version = group_class.version_id
+            elif group_class.version_id != expected_version:
+                raise conflict("Class")
 
             if not self._is_room_available(group_class.room_id, new_date, new_start, new_end, exclude_class_id=class_id):
                 raise ValueError("Room is not available at the new time.")
@@ -92,94 +192,373 @@ class AdminService:
             if not self._is_trainer_available(group_class.trainer_id, new_date, new_start, new_end, exclude_class_id=class_id):
                 raise ValueError("Trainer is not available at the new time.")
 
-            group_class.scheduled_date = new_date
-            group_class.start_time = new_start
-            group_class.end_time = new_end
-            
+            member_ids = self.dashboard.class_member_ids(self.db, class_id)
+            group_class = self.db.scalars(
+                reschedule_statement(class_id, expected_version, new_date, new_start, new_end)
+            ).first()
+            if group_class is None:
+                raise conflict("Class")
+
             self.db.commit()
+            self.availability.move_class(group_class)
+            self.dashboard.invalidate(*member_ids)
             return group_class
+        except Exception as e:
+            self.db.rollback()
+            if is_booking_conflict(e):
+                self.availability.invalidate()
+                raise ValueError("The room or trainer was booked by another user for this time slot.") from e
+            raise e
+
+    # Change how many members a class takes
+    def update_class_capacity(self, class_id: int, capacity: int) -> List[int]:
+        """Set the capacity; extra seats go to the waitlist. Returns the promoted member ids."""
+        try:
+            group_class = self.db.get(GroupClass, class_id)
+            if not group_class:
+                raise ValueError("Class not found.")
+            if group_class.is_cancelled:
+                raise ValueError("Class has been cancelled.")
+            room = self.reference.room(self.db, group_class.room_id)
+            if capacity > room.capacity:
+                raise ValueError(f"Class capacity ({capacity}) cannot exceed room capacity ({room.capacity}).")
+
+            # Checked against the locked row, so a concurrent registration cannot slip under it
+            resized = self.db.execute(
+                update(GroupClass)
+                .where(GroupClass.class_id == class_id, GroupClass.enrolled_count <= capacity)
+                .values(capacity=capacity, version_id=GroupClass.version_id + 1)
+                .returning(GroupClass.class_id)
+            ).first()
+            if not resized:
+                raise ValueError("Capacity cannot be lower than the number of registered members.")
+            promoted = self.db.execute(promotion_statement(class_id)).scalars().all()
+            self.db.commit()
+            self.db.refresh(group_class)
+            self.dashboard.invalidate(*promoted)
+            return promoted
         except Exception as e:
             self.db.rollback()
             raise e
 
-    # Remove class
+    # Cancel class (kept, with its enrollments, for the record)
     def cancel_class(self, class_id: int):
         try:
-            group_class = self.db.query(GroupClass).get(class_id)
+            group_class = self.db.get(GroupClass, class_id)
             if not group_class:
                 raise ValueError("Class not found.")
-            
-            self.db.delete(group_class)
+            if group_class.is_cancelled:
+                raise ValueError("Class is already cancelled.")
+
+            cancelled, member_ids = self._cancel_where(GroupClass.class_id == class_id)
             self.db.commit()
+            self._forget_classes(cancelled, member_ids)
             return True
         except Exception as e:
             self.db.rollback()
             raise e
-    
-    # Check room availability
-    def _is_room_available(self, room_id: int, check_date: date, start: time, end: time, exclude_class_id: int = None) -> bool:
-        class_conflict_query = self.db.query(GroupClass).filter(
-            GroupClass.room_id == room_id,
-            GroupClass.scheduled_date == check_date,
-            GroupClass.start_time < end,
-            GroupClass.end_time > start
-        )
-        
-        if exclude_class_id:
-            class_conflict_query = class_conflict_query.filter(GroupClass.class_id != exclude_class_id)
 
-        if class_conflict_query.first():
-            return False
+    # Cancel every class in a date range (e.g. the gym is closed)
+    def cancel_classes(self, start_date: date, end_date: date, room_id: int = None, trainer_id: int = None) -> int:
+        """Cancel all classes between the dates (inclusive), optionally only one room's or trainer's."""
+        try:
+            if end_date < start_date:
+                raise ValueError("End date must not be before start date.")
+            criteria = [GroupClass.scheduled_date.between(start_date, end_date)]
+            if room_id is not None:
+                criteria.append(GroupClass.room_id == room_id)
+            if trainer_id is not None:
+                criteria.append(GroupClass.trainer_id == trainer_id)
+
+            cancelled, member_ids = self._cancel_where(*criteria)
+            self.db.commit()
+            self._forget_classes(cancelled, member_ids)
+            return len(cancelled)
+        except Exception as e:
+            self.db.rollback()
+            raise e
+
+    # Permanently remove cancelled classes
+    def purge_cancelled_classes(self, before: date) -> int:
+        """Delete classes cancelled and scheduled before `before`; the database cascades to enrollments and waitlists."""
+        try:
+            purged = self.db.execute(
+                delete(GroupClass)
+                .where(GroupClass.status == ClassStatus.CANCELLED, GroupClass.scheduled_date < before)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            self.db.commit()
+            return purged
+        except Exception as e:
+            self.db.rollback()
+            raise e
+
+    def _cancel_where(self, *criteria) -> Tuple[List[int], List[int]]:
+        """
+        Soft-cancel the classes matching `criteria` with three set-based statements.
+        Returns the cancelled class ids and the affected member ids, for
+        _forget_classes once the caller has committed.
+        """
+        classes, registrations, waitlists = cancel_statements(*criteria)
+        cancelled = self.db.execute(classes).scalars().all()
+        if not cancelled:
+            return [], []
+        member_ids = self.db.execute(registrations).scalars().all()
+        self.db.execute(waitlists)
+        return cancelled, member_ids
 
-        pt_conflict = self.db.query(PersonalTrainingSession).filter(
-            PersonalTrainingSession.room_id == room_id,
-            PersonalTrainingSession.scheduled_date == check_date,
-            PersonalTrainingSession.start_time < end,
-            PersonalTrainingSession.end_time > start,
-            PersonalTrainingSession.status != SessionStatus.CANCELLED 
-        ).first()
+    def _forget_classes(self, class_ids: List[int], member_ids: List[int]):
+        for class_id in class_ids:
+            self.availability.remove_class(class_id)
+        self.dashboard.invalidate(*set(member_ids))
 
-        if pt_conflict:
-            return False
-        return True
+    # Create a recurring class series
+    def create_class_series(self, name: str, trainer_id: int, room_id: int, start: time, end: time,
+                            capacity: int, start_date: date, end_date: date = None,
+                            weekdays: Iterable[int] = None, interval_weeks: int = 1,
+                            count: int = None, dates: Iterable[date] = None) -> Dict[str, Any]:
+        """
+        Expand a weekly rule (or explicit `dates`) into occurrences, check them all
+        against room and trainer bookings in one query, and insert the free ones
+        with one bulk INSERT. Returns the series, the created classes and, per
+        conflicting occurrence, why it was skipped.
+        """
+        try:
+            room = self.reference.room(self.db, room_id)
+            if not room:
+                raise ValueError("Room not found.")
+            if capacity > room.capacity:
+                raise ValueError(f"Class capacity ({capacity}) cannot exceed room capacity ({room.capacity}).")
+            if start >= end:
+                raise ValueError("End time must be after start time.")
+
+            if dates:
+                occurrences = sorted(set(dates))
+            else:
+                occurrences = expand_weekly(start_date, end_date, weekdays, interval_weeks, count)
+            if not occurrences:
+                raise ValueError("The recurrence rule produces no dates.")
+
+            reasons = conflicts_by_occurrence(self.db.execute(occurrence_conflicts_query(
+                room_id, trainer_id, [(i, d, start, end) for i, d in enumerate(occurrences)]
+            )))
+            conflicts = [{"date": d, "start_time": start, "end_time": end, "reasons": reasons[i]}
+                         for i, d in enumerate(occurrences) if i in reasons]
+            free_dates = [d for i, d in enumerate(occurrences) if i not in reasons]
+            if not free_dates:
+                return {"series": None, "created": [], "conflicts": conflicts}
+
+            series = ClassSeries(
+                class_name=name,
+                trainer_id=trainer_id,
+                room_id=room_id,
+                start_time=start,
+                end_time=end,
+                capacity=capacity,
+                start_date=occurrences[0],
+                end_date=occurrences[-1],
+                weekdays=None if dates else ",".join(str(w) for w in sorted(set(weekdays or [start_date.weekday()]))),
+                interval_weeks=interval_weeks
+            )
+            self.db.add(series)
+            self.db.flush()
+
+            created = self.db.scalars(insert(GroupClass).returning(GroupClass), [
+                {
+                    "class_name": name,
+                    "trainer_id": trainer_id,
+                    "room_id": room_id,
+                    "scheduled_date": d,
+                    "start_time": start,
+                    "end_time": end,
+                    "capacity": capacity,
+                    "series_id": series.series_id
+                }
+                for d in free_dates
+            ]).all()
+            self.db.commit()
+
+            for group_class in created:
+                self.availability.add_class(group_class)
+            return {"series": series, "created": created, "conflicts": conflicts}
+        except Exception as e:
+            self.db.rollback()
+            if is_booking_conflict(e):
+                self.availability.invalidate()
+                raise ValueError("The room or trainer was booked by another user for one of these dates.") from e
+            raise e
+
+    # Batch-schedule classes, choosing the rooms automatically
+    def schedule_classes(self, requests: Iterable[ClassRequest], dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Assign a room to every requested class (see room_assignment.partition_rooms)
+        and insert the placed ones with one bulk INSERT. Returns the created classes
+        (or the planned assignments when `dry_run`), the rooms used, and the
+        requests that could not be placed with the reason.
+        """
+        try:
+            rooms = [(r.room_id, r.capacity, r.room_type) for r in self.reference.rooms(self.db)]
+            results = assign_rooms(self.db, list(requests), rooms)
+            placed = [r for r in results if r["room_id"] is not None]
+            unplaced = [{"request": r["request"], "reason": r["reason"]} for r in results if r["room_id"] is None]
+            rooms_used = sorted({r["room_id"] for r in placed})
+            if dry_run or not placed:
+                return {"created": [], "assignments": placed, "rooms_used": rooms_used, "unplaced": unplaced}
+
+            created = self.db.scalars(insert(GroupClass).returning(GroupClass), [
+                {
+                    "class_name": r["request"].class_name,
+                    "trainer_id": r["request"].trainer_id,
+                    "room_id": r["room_id"],
+                    "scheduled_date": r["request"].scheduled_date,
+                    "start_time": r["request"].start_time,
+                    "end_time": r["request"].end_time,
+                    "capacity": r["request"].capacity
+                }
+                for r in placed
+            ]).all()
+            self.db.commit()
+
+            for group_class in created:
+                self.availability.add_class(group_class)
+            return {"created": created, "assignments": placed, "rooms_used": rooms_used, "unplaced": unplaced}
+        except Exception as e:
+            self.db.rollback()
+            if is_booking_conflict(e):
+                self.availability.invalidate()
+                raise ValueError("A room or trainer was booked by another user while scheduling. Please retry.") from e
+            raise e
+
+    # Move every upcoming class of a series
+    def reschedule_series(self, series_id: int, new_start: time, new_end: time,
+                          shift_days: int = 0, from_date: date = None) -> List[GroupClass]:
+        """
+        Give all classes of the series on or after `from_date` (default today) new
+        times, optionally moving them `shift_days`. All or nothing: if any
+        occurrence would conflict, nothing changes and the conflicts are listed.
+        """
+        try:
+            series = self.db.get(ClassSeries, series_id)
+            if not series:
+                raise ValueError("Series not found.")
+            if new_start >= new_end:
+                raise ValueError("End time must be after start time.")
+
+            from_date = from_date or date.today()
+            upcoming = and_(
+                GroupClass.series_id == series_id,
+                GroupClass.scheduled_date >= from_date,
+                GroupClass.status == ClassStatus.SCHEDULED
+            )
+            classes = self.db.execute(
+                select(GroupClass.class_id, GroupClass.scheduled_date).where(upcoming).order_by(GroupClass.scheduled_date)
+            ).all()
+            if not classes:
+                raise ValueError("The series has no upcoming classes.")
+
+            moved = [d + timedelta(days=shift_days) for _, d in classes]
+            # Only the classes being moved are ignored; earlier ones of the series still count
+            reasons = conflicts_by_occurrence(self.db.execute(occurrence_conflicts_query(
+                series.room_id, series.trainer_id, [(i, d, new_start, new_end) for i, d in enumerate(moved)],
+                exclude_class_ids=[class_id for class_id, _ in classes]
+            )))
+            if reasons:
+                details = "; ".join(f"{moved[i]}: {', '.join(r)}" for i, r in sorted(reasons.items())[:5])
+                raise ValueError(f"{len(reasons)} of {len(moved)} classes would conflict ({details}).")
+
+            member_ids = self._series_member_ids(upcoming)
+            new_values = {"start_time": new_start, "end_time": new_end, "version_id": GroupClass.version_id + 1}
+            if shift_days:
+                new_values["scheduled_date"] = GroupClass.scheduled_date + shift_days
+            changed = self.db.scalars(update(GroupClass).where(upcoming).values(**new_values).returning(GroupClass)).all()
+            series.start_time, series.end_time = new_start, new_end
+            self.db.commit()
+
+            for group_class in changed:
+                self.availability.move_class(group_class)
+            self.dashboard.invalidate(*member_ids)
+            return changed
+        except Exception as e:
+            self.db.rollback()
+            if is_booking_conflict(e):
+                self.availability.invalidate()
+                raise ValueError("The room or trainer was booked by another user for one of these dates.") from e
+            raise e
+
+    # Cancel every upcoming class of a series
+    def cancel_series(self, series_id: int, from_date: date = None) -> int:
+        """Cancel the series' classes on or after `from_date` (default today) and their registrations."""
+        try:
+            if not self.db.get(ClassSeries, series_id):
+                raise ValueError("Series not found.")
+
+            cancelled, member_ids = self._cancel_where(
+                GroupClass.series_id == series_id, GroupClass.scheduled_date >= (from_date or date.today())
+            )
+            self.db.commit()
+            self._forget_classes(cancelled, member_ids)
+            return len(cancelled)
+        except Exception as e:
+            self.db.rollback()
+            raise e
+
+    def _series_member_ids(self, classes_filter):
+        return self.db.execute(
+            select(ClassEnrollment.member_id).distinct().join(GroupClass).where(
+                classes_filter, ClassEnrollment.attendance_status == AttendanceStatus.REGISTERED
+            )
+        ).scalars().all()
+    
+    # Check room availability
+    def _is_room_available(self, room_id: int, check_date: date, start: time, end: time, exclude_class_id: int = None) -> bool:
+        return self.availability.is_room_available(room_id, check_date, start, end, exclude_class_id=exclude_class_id)
 
     # Check trainer availability
     def _is_trainer_available(self, trainer_id: int, check_date: date, start: time, end: time, exclude_class_id: int = None) -> bool:
-        class_conflict_query = self.db.query(GroupClass).filter(
-            GroupClass.trainer_id == trainer_id,
-            GroupClass.scheduled_date == check_date,
-            GroupClass.start_time < end,
-            GroupClass.end_time > start
-        )
+        return self.availability.is_trainer_available(trainer_id, check_date, start, end, exclude_class_id=exclude_class_id)
 
-        if exclude_class_id:
-            class_conflict_query = class_conflict_query.filter(GroupClass.class_id != exclude_class_id)
-            
-        if class_conflict_query.first():
-            return False
-
-        pt_conflict = self.db.query(PersonalTrainingSession).filter(
-            PersonalTrainingSession.trainer_id == trainer_id,
-            PersonalTrainingSession.scheduled_date == check_date,
-            PersonalTrainingSession.start_time < end,
-            PersonalTrainingSession.end_time > start,
-            PersonalTrainingSession.status != SessionStatus.CANCELLED
-        ).first()
-
-        if pt_conflict:
-            return False
-        return True
-
-    # Helpers
+    # Helpers (rooms and trainers come from the process-wide reference cache)
     def get_all_trainers(self):
-        return self.db.query(Trainer).all()
+        return self.reference.trainers(self.db)
     
     def get_all_rooms(self):
-        return self.db.query(Room).all()
+        return self.reference.rooms(self.db)
         
-    def get_all_classes(self):
-        return self.db.query(GroupClass).all()
+    # Listings are read-only rows (see read_models), not tracked ORM objects
+    def get_all_classes(self) -> List[ClassRow]:
+        return fetch_all(self.db, classes_query(), ClassRow)
+
+    def get_class(self, class_id: int) -> GroupClass:
+        group_class = self.db.get(GroupClass, class_id)
+        if not group_class:
+            raise ValueError("Class not found.")
+        return group_class
 
-    def get_all_members(self):
+    def get_all_members(self) -> List[MemberRow]:
         """Added for Admin listing functionality"""
-        return self.db.query(Member).all()
\ No newline at end of file
+        return fetch_all(self.db, members_query(), MemberRow)
+
+    # Paginated (keyset on primary key) and streaming listings
+    def get_members_page(self, after_id: int = None, limit: int = DEFAULT_PAGE_SIZE):
+        return fetch_page(self.db, members_query(), MemberRow, Member.member_id, after_id, limit)
+
+    def get_trainers_page(self, after_id: int = None, limit: int = DEFAULT_PAGE_SIZE):
+        return self.reference.trainers_page(self.db, after_id, limit)
+
+    def get_classes_page(self, after_id: int = None, limit: int = DEFAULT_PAGE_SIZE):
+        return fetch_page(self.db, classes_query(), ClassRow, GroupClass.class_id, after_id, limit)
+
+    def get_active_classes_page(self, after_id: int = None, limit: int = DEFAULT_PAGE_SIZE):
+        """Like get_classes_page, without cancelled classes."""
+        return fetch_page(self.db, classes_query(GroupClass.status == ClassStatus.SCHEDULED), ClassRow,
+                          GroupClass.class_id, after_id, limit)
+
+    def iter_members(self, batch_size: int = DEFAULT_BATCH_SIZE):
+        return fetch_stream(self.db, members_query(), MemberRow, Member.member_id, batch_size)
+
+    def iter_trainers(self):
+        # Trainers are already held in memory by the reference cache, so there is nothing to batch
+        return iter(self.reference.trainers(self.db))
+
+    def iter_classes(self, batch_size: int = DEFAULT_BATCH_SIZE):
+        return fetch_stream(self.db, classes_query(), ClassRow, GroupClass.class_id, batch_size)
\ No newline at end of file
@@ -0,0 +1,191 @@
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy import select
+from datetime import date, time
+
+from database.async_connection import AsyncSessionLocal
+from database.instrumentation import instrument_service
+from models.group_class import GroupClass
+from models.room import Room
+from models.trainer import Trainer
+from services.dashboard import DashboardCache, dashboard_cache, class_members_query
+from services.availability import booking_conflict_query, is_booking_conflict
+from services.admin_service import cancel_statements, reschedule_statement
+from services.concurrency import conflict
+from services.reference_data import ReferenceData, reference_data
+from services.read_models import MemberRow, ClassRow, members_query, classes_query
+
+# Async counterpart of AdminService
+@instrument_service
+class AsyncAdminService:
+    """
+    Same operations as AdminService on SQLAlchemy's asyncio API.
+    Room and trainer conflict checks run on the session that writes the booking.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker = AsyncSessionLocal,
+                 dashboard: DashboardCache = None, reference: ReferenceData = None):
+        self.session_factory = session_factory
+        self.dashboard = dashboard or dashboard_cache
+        self.reference = reference or reference_data
+
+    # Create new room
+    async def add_room(self, name: str, capacity: int, room_type: str = "General"):
+        async with self.session_factory() as db:
+            try:
+                existing_room = (await db.execute(select(Room.room_id).where(Room.room_name == name))).first()
+                if existing_room:
+                    raise ValueError(f"Room with name '{name}' already exists.")
+
+                new_room = Room(room_name=name, capacity=capacity, room_type=room_type)
+                db.add(new_room)
+                await db.commit()
+                self.reference.invalidate()
+                return new_room
+            except Exception as e:
+                await db.rollback()
+                raise e
+
+    # Create new trainer
+    async def add_trainer(self, first_name: str, last_name: str, email: str, specialization: str):
+        async with self.session_factory() as db:
+            try:
+                new_trainer = Trainer(
+                    first_name=first_name,
+                    last_name=last_name,
+                    email=email,
+                    specialization=specialization,
+                    hire_date=date.today()
+                )
+                db.add(new_trainer)
+                await db.commit()
+                self.reference.invalidate()
+                return new_trainer
+            except Exception as e:
+                await db.rollback()
+                raise e
+
+    # Creating new group class
+    async def create_group_class(self, name: str, trainer_id: int, room_id: int,
+                                 sched_date: date, start: time, end: time, capacity: int):
+        room = await self.reference.room_async(self.session_factory, room_id)
+        if not room:
+            raise ValueError("Room not found.")
+
+        if capacity > room.capacity:
+            raise ValueError(f"Class capacity ({capacity}) cannot exceed room capacity ({room.capacity}).")
+
+        async with self.session_factory() as db:
+            try:
+                # Checked in the transaction that inserts, so the answer cannot go stale in between
+                if not await self._is_available(db, "room", room_id, sched_date, start, end):
+                    raise ValueError("The selected room is already booked for this time slot.")
+
+                if not await self._is_available(db, "trainer", trainer_id, sched_date, start, end):
+                    raise ValueError("The trainer is already scheduled for a class or PT session at this time.")
+
+                new_class = GroupClass(
+                    class_name=name,
+                    trainer_id=trainer_id,
+                    room_id=room_id,
+                    scheduled_date=sched_date,
+                    start_time=start,
+                    end_time=end,
+                    capacity=capacity
+                )
+                db.add(new_class)
+                await db.commit()
+                return new_class
+            except Exception as e:
+                await db.rollback()
+                if is_booking_conflict(e):
+                    raise ValueError("The room or trainer was booked by another user for this time slot.") from e
+                raise e
+
+    #  Change time for a class
+    async def reschedule_class(self, class_id: int, new_date: date, new_start: time, new_end: time,
+                               expected_version: int = None):
+        async with self.session_factory() as db:
+            try:
+                group_class = await db.get(GroupClass, class_id)
+                if not group_class:
+                    raise ValueError("Class not found.")
+                if group_class.is_cancelled:
+                    raise ValueError("Cancelled classes cannot be rescheduled.")
+                if expected_version is None:
+                    expected_version = group_class.version_id
+                elif group_class.version_id != expected_version:
+                    raise conflict("Class")
+
+                if not await self._is_available(db, "room", group_class.room_id, new_date, new_start, new_end, class_id):
+                    raise ValueError("Room is not available at the new time.")
+
+                if not await self._is_available(db, "trainer", group_class.trainer_id, new_date, new_start, new_end, class_id):
+                    raise ValueError("Trainer is not available at the new time.")
+
+                member_ids = (await db.execute(class_members_query(class_id))).scalars().all()
+                group_class = (await db.scalars(
+                    reschedule_statement(class_id, expected_version, new_date, new_start, new_end)
+                )).first()
+                if group_class is None:
+                    raise conflict("Class")
+
+                await db.commit()
+                self.dashboard.invalidate(*member_ids)
+                return group_class
+            except Exception as e:
+                await db.rollback()
+                if is_booking_conflict(e):
+                    raise ValueError("The room or trainer was booked by another user for this time slot.") from e
+                raise e
+
+    # Cancel class (kept for the record)
+    async def cancel_class(self, class_id: int):
+        async with self.session_factory() as db:
+            try:
+                group_class = await db.get(GroupClass, class_id)
+                if not group_class:
+                    raise ValueError("Class not found.")
+                if group_class.is_cancelled:
+                    raise ValueError("Class is already cancelled.")
+
+                _, member_ids = await self._cancel_where(db, GroupClass.class_id == class_id)
+                await db.commit()
+                self.dashboard.invalidate(*member_ids)
+                return True
+            except Exception as e:
+                await db.rollback()
+                raise e
+
+    async def _cancel_where(self, db, *criteria):
+        """Async AdminService._cancel_where: returns (cancelled class ids, affected member ids)."""
+        classes, registrations, waitlists = cancel_statements(*criteria)
+        cancelled = (await db.execute(classes)).scalars().all()
+        if not cancelled:
+            return [], []
+        member_ids = (await db.execute(registrations)).scalars().all()
+        await db.execute(waitlists)
+        return cancelled, member_ids
+
+    # Helpers
+    async def get_all_trainers(self):
+        return list((await self.reference.get_async(self.session_factory)).trainers.values())
+
+    async def get_all_rooms(self):
+        return list((await self.reference.get_async(self.session_factory)).rooms.values())
+
+    async def get_all_classes(self):
+        return await self._rows(classes_query(), ClassRow)
+
+    async def get_all_members(self):
+        return await self._rows(members_query(), MemberRow)
+
+    async def _is_available(self, db, resource: str, resource_id: int, check_date: date, start: time, end: time,
+                            exclude_class_id: int = None) -> bool:
+        conflict = (await db.execute(booking_conflict_query(
+            resource, resource_id, check_date, start, end, exclude_class_id=exclude_class_id
+        ))).first()
+        return conflict is None
+
+    async def _rows(self, stmt, record):
+        async with self.session_factory() as db:
+            return list(map(record._make, await db.execute(stmt)))
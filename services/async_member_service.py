@@ -0,0 +1,231 @@
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy import select, delete
+from datetime import date, time
+from typing import List, Optional
+
+from database.async_connection import AsyncSessionLocal
+from database.instrumentation import instrument_service
+from models.member import Member
+from models.group_class import GroupClass
+from models.class_enrollment import ClassEnrollment, AttendanceStatus
+from models.class_waitlist import WaitlistEntry
+from models.personal_training_session import PersonalTrainingSession, SessionStatus
+from services.availability import booking_conflict_query, is_booking_conflict
+from services.dashboard import DashboardCache, dashboard_cache, dashboard_query, build_dashboard
+from services.reference_data import ReferenceData, reference_data
+from services.slot_finder import busy_intervals_query, candidate_rooms, available_slots, validate_slot_search
+from services.member_service import parse_gender, seat_claim_statement, is_duplicate_registration
+from services.waitlist import promotion_statement, cancel_enrollment_statement, seat_release_statement, waitlist_position_query
+from services.member_search import member_search_cache
+from services.read_models import MemberRow, ClassRow, members_query, upcoming_classes_query
+
+# Async counterpart of MemberService
+@instrument_service
+class AsyncMemberService:
+    """
+    Same operations as MemberService on SQLAlchemy's asyncio API.
+    Each call opens its own AsyncSession; conflict checks run on the session
+    that writes the booking.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker = AsyncSessionLocal,
+                 dashboard: DashboardCache = None, reference: ReferenceData = None):
+        self.session_factory = session_factory
+        self.dashboard = dashboard or dashboard_cache
+        self.reference = reference or reference_data
+
+    async def register_member(self, first_name: str, last_name: str, email: str,
+                              dob: date, gender: str) -> Member:
+        gender_enum = parse_gender(gender)
+        async with self.session_factory() as db:
+            try:
+                existing = (await db.execute(select(Member.member_id).where(Member.email == email))).first()
+                if existing:
+                    raise ValueError(f"Member with email {email} already exists.")
+
+                new_member = Member(
+                    first_name=first_name,
+                    last_name=last_name,
+                    email=email,
+                    date_of_birth=dob,
+                    gender=gender_enum,
+                    registration_date=date.today()
+                )
+                db.add(new_member)
+                await db.commit()
+                member_search_cache.clear()
+                return new_member
+            except Exception as e:
+                await db.rollback()
+                raise e
+
+    async def register_for_group_class(self, member_id: int, class_id: int) -> ClassEnrollment:
+        async with self.session_factory() as db:
+            try:
+                if not await db.get(Member, member_id):
+                    raise ValueError("Member not found.")
+
+                existing = (await db.execute(select(ClassEnrollment.enrollment_id).where(
+                    ClassEnrollment.member_id == member_id,
+                    ClassEnrollment.class_id == class_id,
+                    ClassEnrollment.attendance_status.in_([AttendanceStatus.REGISTERED, AttendanceStatus.ATTENDED])
+                ))).first()
+                if existing:
+                    raise ValueError("Member is already registered.")
+
+                if not (await db.execute(seat_claim_statement(class_id))).first():
+                    group_class = await db.get(GroupClass, class_id)
+                    if not group_class:
+                        raise ValueError("Class not found.")
+                    if group_class.is_cancelled:
+                        raise ValueError("Class has been cancelled.")
+                    raise ValueError("Class is fully booked.")
+
+                new_enrollment = ClassEnrollment(
+                    member_id=member_id,
+                    class_id=class_id,
+                    enrollment_date=date.today(),
+                    attendance_status=AttendanceStatus.REGISTERED
+                )
+                db.add(new_enrollment)
+                await db.execute(delete(WaitlistEntry).where(
+                    WaitlistEntry.member_id == member_id, WaitlistEntry.class_id == class_id
+                ))
+                await db.commit()
+                self.dashboard.invalidate(member_id)
+                return new_enrollment
+            except Exception as e:
+                await db.rollback()
+                if is_duplicate_registration(e):
+                    raise ValueError("Member is already registered.") from e
+                raise e
+
+    async def cancel_class_registration(self, member_id: int, class_id: int) -> List[int]:
+        async with self.session_factory() as db:
+            try:
+                if not (await db.execute(cancel_enrollment_statement(member_id, class_id))).first():
+                    raise ValueError("Member is not registered for this class.")
+                await db.execute(seat_release_statement(class_id))
+                promoted = (await db.execute(promotion_statement(class_id))).scalars().all()
+                await db.commit()
+                self.dashboard.invalidate(member_id, *promoted)
+                return promoted
+            except Exception as e:
+                await db.rollback()
+                raise e
+
+    async def join_waitlist(self, member_id: int, class_id: int) -> Optional[int]:
+        async with self.session_factory() as db:
+            try:
+                if not await db.get(Member, member_id):
+                    raise ValueError("Member not found.")
+                group_class = await db.get(GroupClass, class_id)
+                if not group_class:
+                    raise ValueError("Class not found.")
+                if group_class.is_cancelled:
+                    raise ValueError("Class has been cancelled.")
+                if not group_class.is_full:
+                    raise ValueError("Class has free seats. Register instead.")
+
+                registered = (await db.execute(select(ClassEnrollment.enrollment_id).where(
+                    ClassEnrollment.member_id == member_id,
+                    ClassEnrollment.class_id == class_id,
+                    ClassEnrollment.attendance_status.in_([AttendanceStatus.REGISTERED, AttendanceStatus.ATTENDED])
+                ))).first()
+                if registered:
+                    raise ValueError("Member is already registered.")
+                if (await db.execute(waitlist_position_query(member_id, class_id))).scalar():
+                    raise ValueError("Member is already on the waitlist.")
+
+                db.add(WaitlistEntry(class_id=class_id, member_id=member_id))
+                await db.flush()
+                promoted = (await db.execute(promotion_statement(class_id))).scalars().all()
+                position = (await db.execute(waitlist_position_query(member_id, class_id))).scalar()
+                await db.commit()
+                self.dashboard.invalidate(*promoted)
+                return position
+            except Exception as e:
+                await db.rollback()
+                raise e
+
+    async def leave_waitlist(self, member_id: int, class_id: int):
+        async with self.session_factory() as db:
+            try:
+                left = (await db.execute(delete(WaitlistEntry).where(
+                    WaitlistEntry.member_id == member_id, WaitlistEntry.class_id == class_id
+                ))).rowcount
+                if not left:
+                    raise ValueError("Member is not on the waitlist for this class.")
+                await db.commit()
+                return True
+            except Exception as e:
+                await db.rollback()
+                raise e
+
+    async def schedule_pt_session(self, member_id: int, trainer_id: int, room_id: int,
+                                  sched_date: date, start: time, end: time, notes: str = None) -> PersonalTrainingSession:
+        async with self.session_factory() as db:
+            try:
+                # Checked in the transaction that inserts, so the answer cannot go stale in between
+                if not await self._is_available(db, "trainer", trainer_id, sched_date, start, end):
+                    raise ValueError("Trainer is not available.")
+                if not await self._is_available(db, "room", room_id, sched_date, start, end):
+                    raise ValueError("Room is not available.")
+
+                new_session = PersonalTrainingSession(
+                    member_id=member_id,
+                    trainer_id=trainer_id,
+                    room_id=room_id,
+                    scheduled_date=sched_date,
+                    start_time=start,
+                    end_time=end,
+                    status=SessionStatus.SCHEDULED,
+                    notes=notes
+                )
+                db.add(new_session)
+                await db.commit()
+                self.dashboard.invalidate(member_id)
+                return new_session
+            except Exception as e:
+                await db.rollback()
+                if is_booking_conflict(e):
+                    raise ValueError("The trainer or room was booked by another user for this time slot.") from e
+                raise e
+
+    async def get_member_dashboard_data(self, member_id: int):
+        data = self.dashboard.cached(member_id)
+        if data is None:
+            async with self.session_factory() as db:
+                rows = await db.execute(dashboard_query(member_id, date.today()))
+                data = self.dashboard.store(member_id, build_dashboard(rows))
+        return data
+
+    async def find_available_slots(self, trainer_id: int, start_date: date, end_date: date, duration_minutes: int = 60,
+                                   room_id: int = None, room_type: str = None, limit: int = 20):
+        validate_slot_search(start_date, end_date, duration_minutes)
+        async with self.session_factory() as db:
+            rows = (await db.execute(busy_intervals_query(
+                trainer_id, candidate_rooms(room_id, room_type), start_date, end_date
+            ))).all()
+        return available_slots(rows, trainer_id, start_date, end_date, duration_minutes, limit=limit)
+
+    # Helpers
+    async def get_all_members(self) -> List[MemberRow]:
+        return await self._rows(members_query(), MemberRow)
+
+    async def get_all_trainers(self):
+        return list((await self.reference.get_async(self.session_factory)).trainers.values())
+
+    async def get_all_rooms(self):
+        return list((await self.reference.get_async(self.session_factory)).rooms.values())
+
+    async def get_all_classes(self) -> List[ClassRow]:
+        return await self._rows(upcoming_classes_query(), ClassRow)
+
+    async def _is_available(self, db, resource: str, resource_id: int, check_date: date, start: time, end: time) -> bool:
+        conflict = (await db.execute(booking_conflict_query(resource, resource_id, check_date, start, end))).first()
+        return conflict is None
+
+    async def _rows(self, stmt, record):
+        async with self.session_factory() as db:
+            return list(map(record._make, await db.execute(stmt)))
@@ -0,0 +1,119 @@
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import selectinload
+from sqlalchemy import select
+from datetime import date
+from typing import List, Dict, Any, AsyncIterator
+import asyncio
+
+from database.async_connection import AsyncSessionLocal
+from database.instrumentation import instrument_service
+from models.member import Member
+from models.personal_training_session import PersonalTrainingSession
+from models.class_enrollment import ClassEnrollment
+from services.dashboard import DashboardCache, dashboard_cache
+from services.reference_data import ReferenceData, reference_data
+from services.member_search import ranked_member_ids_query, member_search_cache
+from services.trainer_service import ScheduleItem, schedule_query, schedule_item, parse_session_status
+from services.read_models import MemberRow, members_query
+from services.concurrency import update_versioned_async
+
+# Async counterpart of TrainerService
+@instrument_service
+class AsyncTrainerService:
+    """
+    Same operations as TrainerService on SQLAlchemy's asyncio API.
+    Each call opens its own AsyncSession from `session_factory`.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker = AsyncSessionLocal,
+                 dashboard: DashboardCache = None, reference: ReferenceData = None):
+        self.session_factory = session_factory
+        self.dashboard = dashboard or dashboard_cache
+        self.reference = reference or reference_data
+
+    async def get_trainer_schedule(self, trainer_id: int, start_date: date, end_date: date) -> List[ScheduleItem]:
+        return [item async for item in self.iter_trainer_schedule(trainer_id, start_date, end_date)]
+
+    async def iter_trainer_schedule(self, trainer_id: int, start_date: date, end_date: date,
+                                    batch_size: int = 500) -> AsyncIterator[ScheduleItem]:
+        async with self.session_factory() as db:
+            stmt = schedule_query(trainer_id, start_date, end_date).execution_options(yield_per=batch_size)
+            async for row in await db.stream(stmt):
+                yield schedule_item(row)
+
+    async def search_members(self, query_name: str, limit: int = 20) -> List[MemberRow]:
+        query_name = query_name.strip()
+        if not query_name:
+            return []
+        # Same cache and key as MemberSearch, so member writes clear both
+        key = (query_name.lower(), limit)
+        async with self.session_factory() as db:
+            member_ids = member_search_cache.get(key)
+            if member_ids is None:
+                member_ids = list((await db.execute(ranked_member_ids_query(query_name, limit))).scalars())
+                member_search_cache.put(key, member_ids)
+            if not member_ids:
+                return []
+            members = {m.member_id: m for m in map(MemberRow._make, await db.execute(
+                members_query(Member.member_id.in_(member_ids))
+            ))}
+            return [members[mid] for mid in member_ids if mid in members]
+
+    async def view_member_profile(self, member_id: int) -> Dict[str, Any]:
+        member, recent_classes = await asyncio.gather(
+            self._get(Member, member_id),
+            self._all(
+                select(ClassEnrollment).options(selectinload(ClassEnrollment.group_class)).where(
+                    ClassEnrollment.member_id == member_id
+                ).limit(5)
+            )
+        )
+        if not member:
+            raise ValueError("Member not found.")
+
+        return {
+            "full_name": f"{member.first_name} {member.last_name}",
+            "email": member.email,
+            "gender": member.gender.value if member.gender else "N/A",
+            "recent_activity": [
+                f"Class: {e.group_class.class_name} ({e.attendance_status.value})"
+                for e in recent_classes if e.group_class
+            ]
+        }
+
+    async def update_session_notes(self, session_id: int, notes: str, expected_version: int = None):
+        async with self.session_factory() as db:
+            session = await update_versioned_async(db, PersonalTrainingSession, session_id,
+                                                   lambda s: setattr(s, "notes", notes), "Session", expected_version)
+            self.dashboard.invalidate(session.member_id)
+            return session
+
+    async def update_session_status(self, session_id: int, new_status: str, expected_version: int = None):
+        """
+        Updates the status of a PT session (e.g. to 'Completed' or 'No Show').
+        """
+        status_enum = parse_session_status(new_status)
+        async with self.session_factory() as db:
+            session = await update_versioned_async(db, PersonalTrainingSession, session_id,
+                                                   lambda s: setattr(s, "status", status_enum), "Session",
+                                                   expected_version)
+            self.dashboard.invalidate(session.member_id)
+            return session
+
+    async def get_all_trainers(self):
+        return list((await self.reference.get_async(self.session_factory)).trainers.values())
+
+    async def get_all_members(self) -> List[MemberRow]:
+        return await self._rows(members_query(), MemberRow)
+
+    async def _get(self, model, pk):
+        async with self.session_factory() as db:
+            return await db.get(model, pk)
+
+    async def _all(self, stmt):
+        async with self.session_factory() as db:
+            return list((await db.execute(stmt)).scalars())
+
+    async def _rows(self, stmt, record):
+        async with self.session_factory() as db:
+            return list(map(record._make, await db.execute(stmt)))
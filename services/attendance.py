@@ -0,0 +1,213 @@
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import select, update, bindparam, and_, or_, not_
+from datetime import datetime, time, timedelta
+from typing import List, Dict, Any, Iterable
+
+from database.instrumentation import instrument_service
+from models.group_class import GroupClass
+from models.class_enrollment import ClassEnrollment, AttendanceStatus
+from models.personal_training_session import PersonalTrainingSession, SessionStatus
+from services.dashboard import DashboardCache, dashboard_cache
+from services.member_service import seat_claim_statement
+from services.waitlist import promotion_statement
+
+# Statuses that hold a seat (counted in GroupClass.enrolled_count)
+ACTIVE_STATUSES = (AttendanceStatus.REGISTERED, AttendanceStatus.ATTENDED)
+
+# A scan this many minutes before a class starts counts as arriving for it
+CHECK_IN_GRACE_MINUTES = 15
+
+def parse_attendance_status(new_status: str) -> AttendanceStatus:
+    if new_status not in (AttendanceStatus.ATTENDED.value, AttendanceStatus.ABSENT.value):
+        raise ValueError(f"Invalid status '{new_status}'. Valid options: ['Attended', 'Absent']")
+    return AttendanceStatus(new_status)
+
+def attendance_update_statement(status: AttendanceStatus, *criteria):
+    """
+    One UPDATE setting matching, not yet cancelled enrollments to `status`.
+    Joined to itself so RETURNING also gives each row's previous status
+    (class_id, member_id, previous), which is what enrolled_count needs.
+    """
+    previous = aliased(ClassEnrollment)
+    return (
+        update(ClassEnrollment)
+        .where(
+            previous.enrollment_id == ClassEnrollment.enrollment_id,
+            ClassEnrollment.attendance_status != status,
+            ClassEnrollment.attendance_status != AttendanceStatus.CANCELLED,
+            *criteria
+        )
+        .values(attendance_status=status)
+        .returning(ClassEnrollment.class_id, ClassEnrollment.member_id,
+                   previous.attendance_status.label("previous"))
+        .execution_options(synchronize_session=False)
+    )
+
+def ended_before(model, cutoff: datetime):
+    """Bookings of `model` that ended at or before `cutoff`."""
+    return or_(
+        model.scheduled_date < cutoff.date(),
+        and_(model.scheduled_date == cutoff.date(), model.end_time <= cutoff.time())
+    )
+
+def running_class_criteria(at: datetime):
+    """Enrollments whose class is running at `at` or starts within the check-in grace period."""
+    latest = at + timedelta(minutes=CHECK_IN_GRACE_MINUTES)
+    latest_start = latest.time() if latest.date() == at.date() else time.max
+    return (
+        GroupClass.class_id == ClassEnrollment.class_id,
+        GroupClass.scheduled_date == at.date(),
+        GroupClass.start_time <= latest_start,
+        GroupClass.end_time >= at.time()
+    )
+
+# Bulk attendance and end-of-day status changes
+@instrument_service
+class AttendanceService:
+    def __init__(self, db_session: Session, dashboard: DashboardCache = None):
+        self.db = db_session
+        self.dashboard = dashboard or dashboard_cache
+
+    def mark_class_attendance(self, class_id: int, new_status: str = "Attended",
+                              member_ids: Iterable[int] = None) -> int:
+        """Mark every (or the given members') enrollment of a class Attended or Absent; returns rows changed."""
+        try:
+            status = parse_attendance_status(new_status)
+            criteria = [ClassEnrollment.class_id == class_id]
+            if member_ids is not None:
+                criteria.append(ClassEnrollment.member_id.in_(list(member_ids)))
+            changed, promoted = self._apply(status, *criteria)
+            self.db.commit()
+            self.dashboard.invalidate(*{row.member_id for row in changed}, *promoted)
+            return len(changed)
+        except Exception as e:
+            self.db.rollback()
+            raise e
+
+    def check_in(self, member_ids: Iterable[int], at: datetime = None) -> List[int]:
+        """
+        Mark one batch of scanned members Attended for the classes they are
+        registered for that are running at `at` (or start within the grace
+        period). Returns the members that matched a class.
+        """
+        at = at or datetime.now()
+        try:
+            changed, promoted = self._apply(
+                AttendanceStatus.ATTENDED,
+                ClassEnrollment.member_id.in_(list(member_ids)),
+                *running_class_criteria(at)
+            )
+            self.db.commit()
+            checked_in = sorted({row.member_id for row in changed})
+            self.dashboard.invalidate(*checked_in, *promoted)
+            return checked_in
+        except Exception as e:
+            self.db.rollback()
+            raise e
+
+    def check_in_stream(self, scans: Iterable[int], batch_size: int = 200) -> Dict[str, Any]:
+        """
+        Consume a stream of scanned member ids (e.g. from a door scanner),
+        checking them in `batch_size` at a time with one UPDATE per batch.
+        Repeated scans of members already Attended are counted as such, not
+        as unmatched.
+        """
+        report = {"scanned": 0, "checked_in": 0, "already_checked_in": 0, "unmatched": []}
+        batch = set()
+
+        def flush():
+            at = datetime.now()
+            matched = set(self.check_in(batch, at))
+            rest = batch - matched
+            already = set(self._attended_now(rest, at)) if rest else set()
+            report["checked_in"] += len(matched)
+            report["already_checked_in"] += len(already)
+            report["unmatched"].extend(sorted(rest - already))
+            batch.clear()
+
+        for member_id in scans:
+            report["scanned"] += 1
+            batch.add(member_id)
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+        return report
+
+    def close_day(self, cutoff: datetime = None) -> Dict[str, int]:
+        """
+        Nightly job: enrollments still Registered for classes that ended by
+        `cutoff` (default now) become Absent, and PT sessions still Scheduled
+        become No Show. One UPDATE per table.
+        """
+        cutoff = cutoff or datetime.now()
+        try:
+            # Seats freed here belong to classes that are over, so nobody is promoted
+            absent, _ = self._apply(
+                AttendanceStatus.ABSENT,
+                ClassEnrollment.attendance_status == AttendanceStatus.REGISTERED,
+                GroupClass.class_id == ClassEnrollment.class_id,
+                ended_before(GroupClass, cutoff)
+            )
+            no_show = self.db.execute(
+                update(PersonalTrainingSession)
+                .where(
+                    PersonalTrainingSession.status == SessionStatus.SCHEDULED,
+                    ended_before(PersonalTrainingSession, cutoff)
+                )
+                .values(status=SessionStatus.NO_SHOW, version_id=PersonalTrainingSession.version_id + 1)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            self.db.commit()
+            # Today's finished bookings may still be on cached dashboards
+            self.dashboard.clear()
+            return {"absent": len(absent), "no_show": no_show}
+        except Exception as e:
+            self.db.rollback()
+            raise e
+
+    def _attended_now(self, member_ids: Iterable[int], at: datetime) -> List[int]:
+        """Members of `member_ids` already marked Attended for a class running at `at`."""
+        return self.db.execute(
+            select(ClassEnrollment.member_id).distinct().where(
+                ClassEnrollment.member_id.in_(list(member_ids)),
+                ClassEnrollment.attendance_status == AttendanceStatus.ATTENDED,
+                *running_class_criteria(at)
+            )
+        ).scalars().all()
+
+    def _apply(self, status: AttendanceStatus, *criteria):
+        """
+        Run attendance_update_statement and move enrolled_count by the seats taken
+        or released. Re-taken seats (Absent -> Attended) must fit under capacity,
+        and seats released in classes that have not ended yet go to the waitlist.
+        Returns the changed rows and the promoted member ids.
+        """
+        changed = self.db.execute(attendance_update_statement(status, *criteria)).all()
+
+        deltas: Dict[int, int] = {}
+        for row in changed:
+            delta = (status in ACTIVE_STATUSES) - (row.previous in ACTIVE_STATUSES)
+            if delta:
+                deltas[row.class_id] = deltas.get(row.class_id, 0) + delta
+
+        for class_id, delta in deltas.items():
+            if delta > 0 and self.db.execute(seat_claim_statement(class_id, delta)).first() is None:
+                raise ValueError("Class is fully booked.")
+
+        released = {class_id: -delta for class_id, delta in deltas.items() if delta < 0}
+        promoted: List[int] = []
+        if released:
+            table = GroupClass.__table__
+            self.db.execute(
+                update(table)
+                .where(table.c.class_id == bindparam("cid"))
+                .values(enrolled_count=table.c.enrolled_count - bindparam("seats")),
+                [{"cid": class_id, "seats": seats} for class_id, seats in released.items()]
+            )
+            upcoming = self.db.execute(select(GroupClass.class_id).where(
+                GroupClass.class_id.in_(list(released)), not_(ended_before(GroupClass, datetime.now()))
+            )).scalars().all()
+            for class_id in upcoming:
+                promoted.extend(self.db.execute(promotion_statement(class_id)).scalars().all())
+        return changed, promoted
\ No newline at end of file
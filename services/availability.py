@@ -0,0 +1,220 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, union_all
+from bisect import bisect_left, insort
+from threading import RLock
+import time as clock
+from datetime import date, time, timedelta
+from typing import Dict, List, Tuple, Optional
+
+from models.group_class import GroupClass, ClassStatus
+from models.personal_training_session import PersonalTrainingSession, SessionStatus
+
+# Owners of a booked interval
+CLASS = "class"
+SESSION = "session"
+
+# SQLSTATE raised by the GiST exclusion constraints in schema_extras
+EXCLUSION_VIOLATION = "23P01"
+
+def is_booking_conflict(exc: Exception) -> bool:
+    """True if the database rejected a write because of an overlapping booking."""
+    return getattr(getattr(exc, "orig", None), "sqlstate", None) == EXCLUSION_VIOLATION
+
+def booking_conflict_query(resource: str, resource_id: int, check_date: date, start: time, end: time,
+                           exclude_class_id: int = None, exclude_session_id: int = None):
+    """
+    Select one overlapping class or PT session for a room or trainer (`resource` is
+    "room" or "trainer"). Both tables are checked in a single round trip.
+    """
+    class_column = GroupClass.room_id if resource == "room" else GroupClass.trainer_id
+    session_column = PersonalTrainingSession.room_id if resource == "room" else PersonalTrainingSession.trainer_id
+
+    classes = select(GroupClass.class_id).where(
+        class_column == resource_id,
+        GroupClass.scheduled_date == check_date,
+        GroupClass.start_time < end,
+        GroupClass.end_time > start,
+        GroupClass.status != ClassStatus.CANCELLED
+    )
+    if exclude_class_id:
+        classes = classes.where(GroupClass.class_id != exclude_class_id)
+
+    sessions = select(PersonalTrainingSession.session_id).where(
+        session_column == resource_id,
+        PersonalTrainingSession.scheduled_date == check_date,
+        PersonalTrainingSession.start_time < end,
+        PersonalTrainingSession.end_time > start,
+        PersonalTrainingSession.status != SessionStatus.CANCELLED
+    )
+    if exclude_session_id:
+        sessions = sessions.where(PersonalTrainingSession.session_id != exclude_session_id)
+
+    return union_all(classes, sessions).limit(1)
+
+# Shared availability engine for rooms and trainers
+class AvailabilityEngine:
+    """
+    Keeps a sorted interval list per (room, day) and (trainer, day) and answers
+    availability checks from it; the database is only read when a day is not
+    cached (a miss loads a block of `window_days` days in two queries).
+
+    Bookings made through the services are recorded with add/remove calls after
+    each successful commit. Other processes (and the async services) book
+    without telling this cache, so a loaded block is reloaded once it is older
+    than `max_age` seconds. Inside that window the database has the final say:
+    the room trigger or the exclusion constraints reject a conflicting write,
+    and the services then call `invalidate()` (see is_booking_conflict). Only
+    the exclusion constraints also protect trainers across processes.
+
+    One instance can be shared by services in several threads: pass a
+    ScopedSession so each thread loads through its own session.
+    """
+
+    def __init__(self, db_session: Session, window_days: int = 7, max_age: float = 60.0):
+        self.db = db_session
+        self.window_days = window_days
+        self.max_age = max_age
+        self._intervals: Dict[Tuple[str, int, date], List[Tuple[time, time, Tuple[str, int]]]] = {}
+        self._owners: Dict[Tuple[str, int], List[Tuple[str, int, date]]] = {}
+        self._loaded_days: Dict[date, float] = {}
+        self._lock = RLock()
+
+    # Public checks
+    def is_room_available(self, room_id: int, check_date: date, start: time, end: time,
+                          exclude_class_id: int = None, exclude_session_id: int = None) -> bool:
+        with self._lock:
+            return self._is_free(("room", room_id, check_date), start, end,
+                                 self._excluded(exclude_class_id, exclude_session_id))
+
+    def is_trainer_available(self, trainer_id: int, check_date: date, start: time, end: time,
+                             exclude_class_id: int = None, exclude_session_id: int = None) -> bool:
+        with self._lock:
+            return self._is_free(("trainer", trainer_id, check_date), start, end,
+                                 self._excluded(exclude_class_id, exclude_session_id))
+
+    # Updates (call after commit)
+    def add_class(self, group_class: GroupClass):
+        with self._lock:
+            self._add((CLASS, group_class.class_id), group_class.room_id, group_class.trainer_id,
+                      group_class.scheduled_date, group_class.start_time, group_class.end_time)
+
+    def remove_class(self, class_id: int):
+        with self._lock:
+            self._remove((CLASS, class_id))
+
+    def move_class(self, group_class: GroupClass):
+        with self._lock:
+            self.remove_class(group_class.class_id)
+            self.add_class(group_class)
+
+    def add_session(self, session: PersonalTrainingSession):
+        if session.status == SessionStatus.CANCELLED:
+            return
+        with self._lock:
+            self._add((SESSION, session.session_id), session.room_id, session.trainer_id,
+                      session.scheduled_date, session.start_time, session.end_time)
+
+    def remove_session(self, session_id: int):
+        with self._lock:
+            self._remove((SESSION, session_id))
+
+    def invalidate(self):
+        """Forget all cached intervals; they are reloaded on the next check."""
+        with self._lock:
+            self._intervals.clear()
+            self._owners.clear()
+            self._loaded_days.clear()
+
+    def ensure_loaded(self, start_date: date, end_date: date):
+        """Load every booking between the two dates (inclusive) not already cached."""
+        with self._lock:
+            self._ensure_loaded(start_date, end_date)
+
+    # Internals
+    def _ensure_loaded(self, start_date: date, end_date: date):
+        missing = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+        missing = [d for d in missing if d not in self._loaded_days]
+        if not missing:
+            return
+
+        first, last = min(missing), max(missing)
+        classes = self.db.query(
+            GroupClass.class_id, GroupClass.room_id, GroupClass.trainer_id,
+            GroupClass.scheduled_date, GroupClass.start_time, GroupClass.end_time
+        ).filter(
+            GroupClass.scheduled_date >= first,
+            GroupClass.scheduled_date <= last,
+            GroupClass.status != ClassStatus.CANCELLED
+        ).all()
+
+        sessions = self.db.query(
+            PersonalTrainingSession.session_id, PersonalTrainingSession.room_id, PersonalTrainingSession.trainer_id,
+            PersonalTrainingSession.scheduled_date, PersonalTrainingSession.start_time, PersonalTrainingSession.end_time
+        ).filter(
+            PersonalTrainingSession.scheduled_date >= first,
+            PersonalTrainingSession.scheduled_date <= last,
+            PersonalTrainingSession.status != SessionStatus.CANCELLED
+        ).all()
+
+        # Mark days first so _add does not recurse into another load
+        loaded_at = clock.monotonic()
+        self._loaded_days.update((first + timedelta(days=i), loaded_at) for i in range((last - first).days + 1))
+
+        for row in classes:
+            if (CLASS, row[0]) not in self._owners:
+                self._add((CLASS, row[0]), *row[1:])
+        for row in sessions:
+            if (SESSION, row[0]) not in self._owners:
+                self._add((SESSION, row[0]), *row[1:])
+
+    def _load_window(self, check_date: date):
+        loaded_at = self._loaded_days.get(check_date)
+        if loaded_at is not None:
+            if clock.monotonic() - loaded_at <= self.max_age:
+                return
+            self._forget_days({d for d, t in self._loaded_days.items() if t == loaded_at})
+        offset = (check_date - date.min).days % self.window_days
+        block_start = check_date - timedelta(days=offset)
+        self._ensure_loaded(block_start, block_start + timedelta(days=self.window_days - 1))
+
+    @staticmethod
+    def _excluded(exclude_class_id: Optional[int], exclude_session_id: Optional[int]):
+        excluded = set()
+        if exclude_class_id:
+            excluded.add((CLASS, exclude_class_id))
+        if exclude_session_id:
+            excluded.add((SESSION, exclude_session_id))
+        return excluded
+
+    def _is_free(self, key, start: time, end: time, excluded) -> bool:
+        self._load_window(key[2])
+        slots = self._intervals.get(key)
+        if not slots:
+            return True
+
+        # Only bookings starting before `end` can overlap. Without the exclusion
+        # constraints stored intervals may overlap each other, so check them all
+        # (one resource's bookings on one day, so the list stays short).
+        i = bisect_left(slots, (end,))
+        return all(slot_end <= start or owner in excluded for _, slot_end, owner in slots[:i])
+
+    def _add(self, owner, room_id: int, trainer_id: int, sched_date: date, start: time, end: time):
+        self._load_window(sched_date)
+        # The lazy load may already have picked up a freshly committed row
+        self._remove(owner)
+        keys = [("room", room_id, sched_date), ("trainer", trainer_id, sched_date)]
+        for key in keys:
+            insort(self._intervals.setdefault(key, []), (start, end, owner))
+        self._owners[owner] = keys
+
+    def _forget_days(self, days):
+        """Drop the cached intervals of `days` so the next check reloads them."""
+        owners = {owner for key, slots in self._intervals.items() if key[2] in days for _, _, owner in slots}
+        for owner in owners:
+            self._remove(owner)
+        for day in days:
+            self._loaded_days.pop(day, None)
+
+    def _remove(self, owner):
+        for key in self._owners.pop(owner, []):
+            self._intervals[key] = [slot for slot in self._intervals[key] if slot[2] != owner]
@@ -0,0 +1,50 @@
+from collections import OrderedDict
+from threading import Lock
+import time
+
+# Thread-safe LRU cache with a per-entry time-to-live
+class LRUCache:
+    """
+    Holds at most `max_size` entries, evicting the least recently used one.
+    Entries older than `ttl` seconds are treated as missing. max_size=0 disables caching.
+    """
+
+    def __init__(self, max_size: int = 128, ttl: float = 60.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        if not self.max_size:
+            return default
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        if not self.max_size:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,103 @@
+from sqlalchemy import select, union_all, values, column, literal, case, and_, or_, Integer, Date, Time
+from datetime import date, time, timedelta
+from typing import List, Tuple, Iterable, Dict
+
+from models.group_class import GroupClass, ClassStatus
+from models.personal_training_session import PersonalTrainingSession, SessionStatus
+
+# Upper bound on occurrences per series (about ten years of a weekly class)
+MAX_OCCURRENCES = 520
+
+WEEKDAY_NAMES = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+def parse_weekdays(text: str) -> List[int]:
+    """'Mon,Wed,Fri' (or '0,2,4') -> [0, 2, 4]."""
+    weekdays = set()
+    for part in text.split(","):
+        part = part.strip().lower()
+        if not part:
+            continue
+        if part.isdigit() and int(part) < 7:
+            weekdays.add(int(part))
+        elif part[:3] in WEEKDAY_NAMES:
+            weekdays.add(WEEKDAY_NAMES.index(part[:3]))
+        else:
+            raise ValueError(f"Invalid weekday '{part}'. Use Mon..Sun or 0..6.")
+    if not weekdays:
+        raise ValueError("At least one weekday is required.")
+    return sorted(weekdays)
+
+def expand_weekly(start_date: date, end_date: date = None, weekdays: Iterable[int] = None,
+                  interval_weeks: int = 1, count: int = None) -> List[date]:
+    """
+    Dates of a weekly rule: the given weekdays (default: start_date's) of every
+    `interval_weeks`-th week from start_date, until end_date or `count` dates.
+    """
+    if end_date is None and count is None:
+        raise ValueError("A series needs an end date or an occurrence count.")
+    if interval_weeks < 1:
+        raise ValueError("Interval must be at least one week.")
+    weekdays = sorted(set(weekdays)) if weekdays else [start_date.weekday()]
+    limit = min(count or MAX_OCCURRENCES, MAX_OCCURRENCES)
+
+    occurrences = []
+    week_start = start_date - timedelta(days=start_date.weekday())
+    while len(occurrences) < limit:
+        for weekday in weekdays:
+            day = week_start + timedelta(days=weekday)
+            if day < start_date:
+                continue
+            if (end_date and day > end_date) or len(occurrences) >= limit:
+                return occurrences
+            occurrences.append(day)
+        week_start += timedelta(weeks=interval_weeks)
+    return occurrences
+
+def occurrence_conflicts_query(room_id: int, trainer_id: int, occurrences: List[Tuple[int, date, time, time]],
+                               exclude_class_ids: Iterable[int] = None):
+    """
+    Every booking that overlaps an occurrence, checked for all occurrences in one
+    query. `occurrences` are (index, date, start, end); rows are (idx, kind,
+    booking_id, resource) where resource is "room", "trainer" or "room and trainer".
+    `exclude_class_ids` are the classes being moved, which cannot block themselves.
+    """
+    occ = values(
+        column("idx", Integer), column("sched_date", Date), column("start_time", Time), column("end_time", Time),
+        name="occ_values"
+    ).data(occurrences)
+    # Written once as a CTE and joined by both branches
+    occ = select(occ).cte("occ")
+
+    def branch(kind, model, key, *criteria):
+        resource = case(
+            (and_(model.room_id == room_id, model.trainer_id == trainer_id), "room and trainer"),
+            (model.room_id == room_id, "room"),
+            else_="trainer"
+        )
+        return select(occ.c.idx, literal(kind).label("kind"), key.label("booking_id"), resource.label("resource")).join(
+            model, and_(
+                model.scheduled_date == occ.c.sched_date,
+                model.start_time < occ.c.end_time,
+                model.end_time > occ.c.start_time,
+                or_(model.room_id == room_id, model.trainer_id == trainer_id),
+                *criteria
+            )
+        )
+
+    class_criteria = [GroupClass.status != ClassStatus.CANCELLED]
+    if exclude_class_ids:
+        class_criteria.append(GroupClass.class_id.not_in(list(exclude_class_ids)))
+
+    return union_all(
+        branch("class", GroupClass, GroupClass.class_id, *class_criteria),
+        branch("session", PersonalTrainingSession, PersonalTrainingSession.session_id,
+               PersonalTrainingSession.status != SessionStatus.CANCELLED)
+    ).order_by("idx")
+
+def conflicts_by_occurrence(rows) -> Dict[int, List[str]]:
+    """Group occurrence_conflicts_query rows into readable reasons per occurrence index."""
+    reasons: Dict[int, List[str]] = {}
+    for row in rows:
+        what = "group class" if row.kind == "class" else "PT session"
+        reasons.setdefault(row.idx, []).append(f"{row.resource.capitalize()} booked by {what} {row.booking_id}")
+    return reasons
@@ -0,0 +1,55 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+# Blind updates (no expected version) are re-read and re-applied this many times
+MAX_ATTEMPTS = 3
+
+class ConcurrentUpdateError(ValueError):
+    """The row was changed by someone else since it was read."""
+
+def conflict(what: str) -> ConcurrentUpdateError:
+    return ConcurrentUpdateError(f"{what} was changed by another user. Reload and try again.")
+
+def update_versioned(db: Session, model, pk, apply: Callable[[T], None], what: str,
+                     expected_version: int = None, attempts: int = MAX_ATTEMPTS) -> T:
+    """
+    Load a versioned row (mapper `version_id_col`), apply(row) and commit; the
+    UPDATE only matches if nobody committed a newer version in between, else
+    StaleDataError. With `expected_version` (the version the user was shown) any
+    change since is a conflict straight away; without it the change is simply
+    re-applied to the fresh row, up to `attempts` times.
+    """
+    for _ in range(1 if expected_version is not None else attempts):
+        row = db.get(model, pk, populate_existing=True)
+        if row is None:
+            raise ValueError(f"{what} not found.")
+        if expected_version is not None and row.version_id != expected_version:
+            raise conflict(what)
+        apply(row)
+        try:
+            db.commit()
+            return row
+        except StaleDataError:
+            db.rollback()
+    raise conflict(what)
+
+async def update_versioned_async(db: AsyncSession, model, pk, apply: Callable[[T], None], what: str,
+                                 expected_version: int = None, attempts: int = MAX_ATTEMPTS) -> T:
+    """AsyncSession version of update_versioned."""
+    for _ in range(1 if expected_version is not None else attempts):
+        row = await db.get(model, pk, populate_existing=True)
+        if row is None:
+            raise ValueError(f"{what} not found.")
+        if expected_version is not None and row.version_id != expected_version:
+            raise conflict(what)
+        apply(row)
+        try:
+            await db.commit()
+            return row
+        except StaleDataError:
+            await db.rollback()
+    raise conflict(what)
\ No newline at end of file
@@ -0,0 +1,128 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, union_all, literal_column, null, type_coerce, String, Date, Time
+from collections import namedtuple
+from datetime import date
+from typing import Dict, Any, Iterable
+
+from models.member import Member
+from models.group_class import GroupClass
+from models.class_enrollment import ClassEnrollment, AttendanceStatus
+from models.personal_training_session import PersonalTrainingSession, SessionStatus
+from services.cache import LRUCache
+
+# Read-only dashboard records (safe to share between sessions and threads)
+DashboardMember = namedtuple("DashboardMember", "member_id first_name last_name email")
+DashboardSession = namedtuple("DashboardSession", "session_id scheduled_date start_time end_time room_id notes")
+DashboardClass = namedtuple("DashboardClass", "class_id class_name scheduled_date start_time end_time room_id")
+
+def dashboard_query(member_id: int, today: date):
+    """Member, upcoming PT sessions and upcoming classes as one UNION ALL, in display order."""
+    member = select(
+        literal_column("'member'", String).label("kind"),
+        Member.member_id.label("id"),
+        Member.first_name.label("name"),
+        Member.last_name.label("last_name"),
+        Member.email.label("email"),
+        type_coerce(null(), Date).label("scheduled_date"),
+        type_coerce(null(), Time).label("start_time"),
+        type_coerce(null(), Time).label("end_time"),
+        type_coerce(null(), Member.member_id.type).label("room_id"),
+        type_coerce(null(), String).label("notes")
+    ).where(Member.member_id == member_id)
+
+    sessions = select(
+        literal_column("'session'", String),
+        PersonalTrainingSession.session_id,
+        null(),
+        null(),
+        null(),
+        PersonalTrainingSession.scheduled_date,
+        PersonalTrainingSession.start_time,
+        PersonalTrainingSession.end_time,
+        PersonalTrainingSession.room_id,
+        PersonalTrainingSession.notes
+    ).where(
+        PersonalTrainingSession.member_id == member_id,
+        PersonalTrainingSession.status == SessionStatus.SCHEDULED,
+        PersonalTrainingSession.scheduled_date >= today
+    )
+
+    classes = select(
+        literal_column("'class'", String),
+        GroupClass.class_id,
+        GroupClass.class_name,
+        null(),
+        null(),
+        GroupClass.scheduled_date,
+        GroupClass.start_time,
+        GroupClass.end_time,
+        GroupClass.room_id,
+        null()
+    ).join(ClassEnrollment, ClassEnrollment.class_id == GroupClass.class_id).where(
+        ClassEnrollment.member_id == member_id,
+        ClassEnrollment.attendance_status == AttendanceStatus.REGISTERED,
+        GroupClass.scheduled_date >= today
+    )
+
+    return union_all(member, sessions, classes).order_by("scheduled_date", "start_time")
+
+def build_dashboard(rows: Iterable) -> Dict[str, Any]:
+    data = {"member": None, "upcoming_sessions": [], "upcoming_classes": []}
+    for row in rows:
+        if row.kind == "member":
+            data["member"] = DashboardMember(row.id, row.name, row.last_name, row.email)
+        elif row.kind == "session":
+            data["upcoming_sessions"].append(DashboardSession(
+                row.id, row.scheduled_date, row.start_time, row.end_time, row.room_id, row.notes
+            ))
+        else:
+            data["upcoming_classes"].append(DashboardClass(
+                row.id, row.name, row.scheduled_date, row.start_time, row.end_time, row.room_id
+            ))
+    return data
+
+def class_members_query(class_id: int):
+    """Members whose dashboards show this class; read before changing it, invalidate after commit."""
+    return select(ClassEnrollment.member_id).where(
+        ClassEnrollment.class_id == class_id,
+        ClassEnrollment.attendance_status == AttendanceStatus.REGISTERED
+    )
+
+# Process-wide member dashboard cache
+class DashboardCache:
+    """
+    Caches each member's dashboard payload (TTL + LRU). Services invalidate the
+    affected members whenever they change an enrollment, PT session or class.
+    """
+
+    def __init__(self, max_size: int = 4096, ttl: float = 300.0):
+        self._cache = LRUCache(max_size, ttl)
+
+    def get(self, db: Session, member_id: int) -> Dict[str, Any]:
+        data = self.cached(member_id)
+        if data is None:
+            data = self.store(member_id, build_dashboard(db.execute(dashboard_query(member_id, date.today()))))
+        return data
+
+    def cached(self, member_id: int):
+        return self._cache.get((member_id, date.today()))
+
+    def store(self, member_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        if data["member"] is None:
+            raise ValueError("Member not found.")
+        self._cache.put((member_id, date.today()), data)
+        return data
+
+    def invalidate(self, *member_ids: int):
+        today = date.today()
+        for member_id in member_ids:
+            self._cache.pop((member_id, today))
+
+    @staticmethod
+    def class_member_ids(db: Session, class_id: int):
+        return db.execute(class_members_query(class_id)).scalars().all()
+
+    def clear(self):
+        self._cache.clear()
+
+dashboard_cache = DashboardCache()
@@ -0,0 +1,173 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, cast, String
+from sqlalchemy.dialects import postgresql
+from datetime import date, time, datetime, timedelta
+from typing import Dict, Any
+import json
+import os
+
+from models.member import Member
+from models.trainer import Trainer
+from models.room import Room
+from models.group_class import GroupClass
+from models.class_enrollment import ClassEnrollment
+from models.personal_training_session import PersonalTrainingSession
+
+DATASETS = ("enrollments", "sessions")
+DEFAULT_STATE_PATH = "exports/.export_state.json"
+# Incremental exports stop this far behind now(), so rows written by transactions
+# that were still open when the export started are picked up by the next run
+WATERMARK_LAG = timedelta(minutes=5)
+
+def _full_name(model):
+    return model.first_name + " " + model.last_name
+
+def _dataset(name: str):
+    """(select, primary key column, date column, updated_at column) for an export dataset."""
+    if name == "enrollments":
+        stmt = select(
+            ClassEnrollment.enrollment_id,
+            ClassEnrollment.enrollment_date,
+            cast(ClassEnrollment.attendance_status, String).label("attendance_status"),
+            Member.member_id,
+            _full_name(Member).label("member_name"),
+            GroupClass.class_id,
+            GroupClass.class_name,
+            GroupClass.scheduled_date.label("class_date"),
+            GroupClass.start_time,
+            GroupClass.end_time,
+            Trainer.trainer_id,
+            _full_name(Trainer).label("trainer_name"),
+            Room.room_id,
+            Room.room_name
+        ).join(Member, Member.member_id == ClassEnrollment.member_id).join(
+            GroupClass, GroupClass.class_id == ClassEnrollment.class_id
+        ).join(Trainer, Trainer.trainer_id == GroupClass.trainer_id).join(
+            Room, Room.room_id == GroupClass.room_id
+        )
+        return stmt, ClassEnrollment.enrollment_id, GroupClass.scheduled_date, ClassEnrollment.updated_at
+
+    if name == "sessions":
+        stmt = select(
+            PersonalTrainingSession.session_id,
+            PersonalTrainingSession.scheduled_date,
+            PersonalTrainingSession.start_time,
+            PersonalTrainingSession.end_time,
+            cast(PersonalTrainingSession.status, String).label("status"),
+            Member.member_id,
+            _full_name(Member).label("member_name"),
+            Trainer.trainer_id,
+            _full_name(Trainer).label("trainer_name"),
+            Room.room_id,
+            Room.room_name,
+            PersonalTrainingSession.notes
+        ).join(Member, Member.member_id == PersonalTrainingSession.member_id).join(
+            Trainer, Trainer.trainer_id == PersonalTrainingSession.trainer_id
+        ).join(Room, Room.room_id == PersonalTrainingSession.room_id)
+        return stmt, PersonalTrainingSession.session_id, PersonalTrainingSession.scheduled_date, PersonalTrainingSession.updated_at
+
+    raise ValueError(f"Unknown dataset '{name}'. Choose from {list(DATASETS)}.")
+
+# Nightly reporting export
+class ExportService:
+    """
+    Streams enrollments or PT sessions (joined with member, trainer, room and
+    class names) to CSV via COPY TO STDOUT, or to Parquet via a server-side
+    cursor, one batch at a time.
+
+    Incremental mode keeps a per-dataset `updated_at` watermark in a small JSON
+    state file and exports every row inserted or changed (e.g. a new attendance
+    status) since. It exports whole datasets, so it cannot take a date range.
+    """
+
+    def __init__(self, db_session: Session, state_path: str = DEFAULT_STATE_PATH, batch_size: int = 50000):
+        self.db = db_session
+        self.state_path = state_path
+        self.batch_size = batch_size
+
+    def export(self, dataset: str, path: str, fmt: str = "csv", start_date: date = None,
+               end_date: date = None, incremental: bool = False) -> Dict[str, Any]:
+        stmt, pk, date_column, updated_at = _dataset(dataset)
+        if incremental and (start_date or end_date):
+            # Rows outside the window would fall behind the watermark and never be exported
+            raise ValueError("Incremental exports cannot be combined with a date range.")
+        if start_date:
+            stmt = stmt.where(date_column >= start_date)
+        if end_date:
+            stmt = stmt.where(date_column <= end_date)
+
+        state = self._load_state()
+        watermark = None
+        if incremental:
+            # Pin the upper bound first so rows changed mid-export wait for the next run
+            watermark = self.db.execute(select(func.now())).scalar().replace(tzinfo=None) - WATERMARK_LAG
+            last = state.get(dataset)
+            # Older state files hold an id, not a timestamp: export everything once
+            if isinstance(last, str):
+                stmt = stmt.where(updated_at > datetime.fromisoformat(last))
+            stmt = stmt.where(updated_at <= watermark)
+        stmt = stmt.order_by(pk)
+
+        try:
+            if fmt == "csv":
+                rows = self._write_csv(stmt, path)
+            elif fmt == "parquet":
+                rows = self._write_parquet(stmt, path)
+            else:
+                raise ValueError(f"Unsupported format '{fmt}'. Use 'csv' or 'parquet'.")
+        finally:
+            self.db.rollback()
+
+        if incremental:
+            state[dataset] = watermark.isoformat()
+            self._save_state(state)
+        return {"dataset": dataset, "path": path, "rows": rows, "watermark": watermark}
+
+    def _write_csv(self, stmt, path: str) -> int:
+        sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+        cursor = self.db.connection().connection.driver_connection.cursor()
+        with open(path, "wb") as f:
+            with cursor.copy(f"COPY ({sql}) TO STDOUT WITH (FORMAT csv, HEADER true)") as copy:
+                for block in copy:
+                    f.write(block)
+        return cursor.rowcount
+
+    def _write_parquet(self, stmt, path: str) -> int:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow).")
+
+        result = self.db.execute(stmt.execution_options(yield_per=self.batch_size))
+        columns = list(result.keys())
+        schema = pa.schema([(c.key, _arrow_type(pa, c.type)) for c in stmt.selected_columns])
+
+        rows = 0
+        with pq.ParquetWriter(path, schema) as writer:
+            for batch in result.partitions():
+                data = {name: [row[i] for row in batch] for i, name in enumerate(columns)}
+                writer.write_table(pa.Table.from_pydict(data, schema=schema))
+                rows += len(batch)
+        return rows
+
+    def _load_state(self) -> Dict[str, Any]:
+        if not os.path.exists(self.state_path):
+            return {}
+        with open(self.state_path) as f:
+            return json.load(f)
+
+    def _save_state(self, state: Dict[str, Any]):
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        with open(self.state_path, "w") as f:
+            json.dump(state, f, indent=2)
+
+def _arrow_type(pa, sql_type):
+    python_type = sql_type.python_type
+    if python_type is int:
+        return pa.int64()
+    if python_type is date:
+        return pa.date32()
+    if python_type is time:
+        return pa.time64("us")
+    return pa.string()
@@ -0,0 +1,139 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+from sqlalchemy.exc import DataError
+from datetime import date, datetime
+from typing import Iterable, Dict, Any
+import csv
+import json
+import psycopg
+
+from models.member import Member
+from services.member_service import parse_gender
+from services.member_search import member_search_cache
+
+REQUIRED_FIELDS = ("email", "first_name", "last_name", "date_of_birth")
+STAGING_COLUMNS = ("email", "first_name", "last_name", "date_of_birth", "gender", "registration_date")
+MAX_REPORTED_ERRORS = 100
+# Checked per record so one oversized value cannot fail a whole COPY batch
+MAX_LENGTHS = {name: Member.__table__.c[name].type.length for name in ("email", "first_name", "last_name")}
+
+# Bulk member onboarding (e.g. a partner gym's member list)
+class MemberImportService:
+    """
+    Streams member records into a temporary staging table with COPY and merges
+    them into `members` with INSERT ... ON CONFLICT (email) DO NOTHING.
+    Each batch is its own transaction, so memory and lock time stay bounded.
+    A batch the database still rejects as bad data is counted invalid and the
+    import carries on with the next one.
+    """
+
+    def __init__(self, db_session: Session, batch_size: int = 10000):
+        self.db = db_session
+        self.batch_size = batch_size
+
+    def import_file(self, path: str, fmt: str = None) -> Dict[str, Any]:
+        """Import a .csv or .jsonl file (header/keys: email, first_name, last_name, date_of_birth, gender)."""
+        fmt = fmt or ("jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv")
+        with open(path, newline="", encoding="utf-8") as f:
+            if fmt == "jsonl":
+                records = (json.loads(line) for line in f if line.strip())
+            elif fmt == "csv":
+                records = csv.DictReader(f)
+            else:
+                raise ValueError(f"Unsupported format '{fmt}'. Use 'csv' or 'jsonl'.")
+            return self.import_members(records)
+
+    def import_members(self, records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        report = {"inserted": 0, "skipped": 0, "invalid": 0, "errors": []}
+        seen_emails = set()
+        batch = []
+        first_record = None
+
+        for record_no, record in enumerate(records, start=1):
+            try:
+                row = self._normalize(record)
+            except ValueError as e:
+                report["invalid"] += 1
+                if len(report["errors"]) < MAX_REPORTED_ERRORS:
+                    report["errors"].append((record_no, str(e)))
+                continue
+
+            # Duplicates inside the file count as skipped, like existing emails
+            if row[0] in seen_emails:
+                report["skipped"] += 1
+                continue
+            seen_emails.add(row[0])
+
+            if not batch:
+                first_record = record_no
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                self._load_batch(batch, report, first_record, record_no)
+                batch = []
+
+        if batch:
+            self._load_batch(batch, report, first_record, record_no)
+        return report
+
+    def _normalize(self, record: Dict[str, Any]) -> tuple:
+        values = {k: (str(record.get(k) or "")).strip() for k in REQUIRED_FIELDS}
+        missing = [k for k in REQUIRED_FIELDS if not values[k]]
+        if missing:
+            raise ValueError(f"Missing field(s): {', '.join(missing)}")
+
+        too_long = [f"{k} (max {limit})" for k, limit in MAX_LENGTHS.items() if len(values[k]) > limit]
+        if too_long:
+            raise ValueError(f"Field(s) too long: {', '.join(too_long)}")
+
+        email = values["email"]
+        if "@" not in email:
+            raise ValueError(f"Invalid email '{email}'.")
+
+        try:
+            dob = datetime.strptime(values["date_of_birth"], "%Y-%m-%d").date()
+        except ValueError:
+            raise ValueError(f"Invalid date_of_birth '{values['date_of_birth']}'. Use YYYY-MM-DD.")
+
+        gender = (str(record.get("gender") or "")).strip()
+        # Stored by enum name, matching how the ORM persists GenderEnum
+        gender_name = parse_gender(gender).name if gender else None
+
+        return (email, values["first_name"], values["last_name"], dob, gender_name, date.today())
+
+    def _load_batch(self, batch, report, first_record: int, last_record: int):
+        try:
+            self.db.execute(text(
+                "CREATE TEMP TABLE IF NOT EXISTS member_import_staging ("
+                " email VARCHAR(255), first_name VARCHAR(100), last_name VARCHAR(100),"
+                " date_of_birth DATE, gender TEXT, registration_date DATE"
+                ") ON COMMIT DELETE ROWS"
+            ))
+
+            # COPY through the underlying psycopg connection
+            cursor = self.db.connection().connection.driver_connection.cursor()
+            with cursor.copy(f"COPY member_import_staging ({', '.join(STAGING_COLUMNS)}) FROM STDIN") as copy:
+                for row in batch:
+                    copy.write_row(row)
+
+            gender_type = Member.__table__.c.gender.type.name
+            inserted = self.db.execute(text(f"""
+                INSERT INTO members (email, first_name, last_name, date_of_birth, gender, registration_date)
+                SELECT email, first_name, last_name, date_of_birth, gender::{gender_type}, registration_date
+                FROM member_import_staging
+                ON CONFLICT (email) DO NOTHING
+            """)).rowcount
+            self.db.commit()
+        except (DataError, psycopg.DataError) as e:
+            self.db.rollback()
+            report["invalid"] += len(batch)
+            if len(report["errors"]) < MAX_REPORTED_ERRORS:
+                report["errors"].append((first_record, f"Records {first_record}-{last_record} rejected: {getattr(e, 'orig', e)}"))
+            return
+        except Exception as e:
+            self.db.rollback()
+            raise e
+
+        report["inserted"] += inserted
+        report["skipped"] += len(batch) - inserted
+        if inserted:
+            member_search_cache.clear()
@@ -0,0 +1,62 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import or_, func, literal_column, select
+from typing import List
+
+from models.member import Member
+from services.cache import LRUCache
+from services.read_models import MemberRow, members_query, fetch_all
+
+# Must match the expression indexed by idx_member_full_name_trgm in schema_extras
+FULL_NAME = Member.first_name.op("||")(literal_column("' '")).op("||")(Member.last_name)
+
+def ranked_member_ids_query(term: str, limit: int):
+    """Select the ids of the `limit` best matches for `term`, best first."""
+    pattern = f"%{term}%"
+    rank = func.greatest(func.similarity(FULL_NAME, term), func.similarity(Member.email, term))
+    return select(Member.member_id).where(
+        or_(
+            FULL_NAME.op("%")(term),
+            Member.email.op("%")(term),
+            FULL_NAME.ilike(pattern),
+            Member.email.ilike(pattern)
+        )
+    ).order_by(rank.desc(), Member.member_id).limit(limit)
+
+# Process-wide cache of ranked ids per (term, limit); cleared by every member write
+member_search_cache = LRUCache(128, 60.0)
+
+# Fuzzy member search backed by pg_trgm GIN indexes
+class MemberSearch:
+    """
+    Ranked search over full name and email. Candidates come from the trigram
+    indexes (`%` similarity or ILIKE substring), ordered by best similarity.
+
+    Repeated terms are served from an LRU cache of member ids, shared by default
+    so member writes can clear it; pass LRUCache(0) to disable it.
+    """
+
+    def __init__(self, db_session: Session, cache: LRUCache = None):
+        self.db = db_session
+        self._cache = cache if cache is not None else member_search_cache
+
+    def search(self, term: str, limit: int = 20) -> List[MemberRow]:
+        term = term.strip()
+        if not term:
+            return []
+
+        key = (term.lower(), limit)
+        member_ids = self._cache.get(key)
+        if member_ids is None:
+            member_ids = self._ranked_ids(term, limit)
+            self._cache.put(key, member_ids)
+
+        if not member_ids:
+            return []
+        members = {m.member_id: m for m in fetch_all(self.db, members_query(Member.member_id.in_(member_ids)), MemberRow)}
+        return [members[mid] for mid in member_ids if mid in members]
+
+    def invalidate(self):
+        self._cache.clear()
+
+    def _ranked_ids(self, term: str, limit: int) -> List[int]:
+        return list(self.db.execute(ranked_member_ids_query(term, limit)).scalars())
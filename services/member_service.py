@@ -1,17 +1,63 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, update, delete
 from datetime import date, time, datetime
+from typing import List, Optional
 
+from database.instrumentation import instrument_service
 from models.member import Member, GenderEnum
-from models.group_class import GroupClass
+from models.group_class import GroupClass, ClassStatus
 from models.class_enrollment import ClassEnrollment, AttendanceStatus
 from models.personal_training_session import PersonalTrainingSession, SessionStatus
-from models.trainer import Trainer
-from models.room import Room
+from models.class_waitlist import WaitlistEntry
+from services.availability import AvailabilityEngine, is_booking_conflict
+from services.dashboard import DashboardCache, dashboard_cache
+from services.reference_data import ReferenceData, reference_data
+from services.slot_finder import find_available_slots
+from services.member_search import member_search_cache
+from services.waitlist import promotion_statement, cancel_enrollment_statement, seat_release_statement, waitlist_position_query
+from services.read_models import (MemberRow, ClassRow, members_query, upcoming_classes_query,
+                                  fetch_all, fetch_page, fetch_stream)
+from services.pagination import DEFAULT_PAGE_SIZE, DEFAULT_BATCH_SIZE
 
+def parse_gender(gender: str) -> GenderEnum:
+    """Accept 'Male'/'male'/... and return the GenderEnum, or raise ValueError."""
+    try:
+        return GenderEnum(gender)
+    except ValueError:
+        try:
+            return GenderEnum(gender.capitalize())
+        except ValueError:
+            raise ValueError(f"Invalid gender '{gender}'. Must be 'Male', 'Female', or 'Other'.")
+
+# Must match the partial unique index on active enrollments in schema_extras
+ACTIVE_ENROLLMENT_INDEX = "uq_enrollment_active_member_class"
+
+def is_duplicate_registration(exc: Exception) -> bool:
+    """True if the database rejected an enrollment because the member already holds an active one."""
+    diag = getattr(getattr(exc, "orig", None), "diag", None)
+    return getattr(diag, "constraint_name", None) == ACTIVE_ENROLLMENT_INDEX
+
+def seat_claim_statement(class_id: int, seats: int = 1):
+    """UPDATE that takes `seats` seats only if they fit under capacity; returns the class id if it did."""
+    return (
+        update(GroupClass)
+        .where(
+            GroupClass.class_id == class_id,
+            GroupClass.enrolled_count + seats <= GroupClass.capacity,
+            GroupClass.status == ClassStatus.SCHEDULED
+        )
+        .values(enrolled_count=GroupClass.enrolled_count + seats)
+        .returning(GroupClass.class_id)
+    )
+
+@instrument_service
 class MemberService:
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, availability: AvailabilityEngine = None,
+                 dashboard: DashboardCache = None, reference: ReferenceData = None):
         self.db = db_session
+        self.availability = availability or AvailabilityEngine(db_session)
+        self.dashboard = dashboard or dashboard_cache
+        self.reference = reference or reference_data
 
     def register_member(self, first_name: str, last_name: str, email: str, 
                         dob: date, gender: str) -> Member:
@@ -20,13 +66,7 @@ class MemberService:
             if existing:
                 raise ValueError(f"Member with email {email} already exists.")
 
-            try:
-                gender_enum = GenderEnum(gender)
-            except ValueError:
-                try:
-                    gender_enum = GenderEnum(gender.capitalize())
-                except ValueError:
-                    raise ValueError(f"Invalid gender '{gender}'. Must be 'Male', 'Female', or 'Other'.")
+            gender_enum = parse_gender(gender)
 
             new_member = Member(
                 first_name=first_name,
@@ -38,6 +78,7 @@ class MemberService:
             )
             self.db.add(new_member)
             self.db.commit()
+            member_search_cache.clear()
             return new_member
         except Exception as e:
             self.db.rollback()
@@ -48,11 +89,6 @@ class MemberService:
             member = self.db.query(Member).get(member_id)
             if not member: raise ValueError("Member not found.")
 
-            group_class = self.db.query(GroupClass).get(class_id)
-            if not group_class: raise ValueError("Class not found.")
-            
-            if group_class.is_full: raise ValueError("Class is fully booked.")
-
             existing = self.db.query(ClassEnrollment).filter(
                 ClassEnrollment.member_id == member_id,
                 ClassEnrollment.class_id == class_id,
@@ -61,6 +97,15 @@ class MemberService:
 
             if existing: raise ValueError("Member is already registered.")
 
+            # Claim the seat before inserting; the row lock serializes concurrent claims
+            if not self._reserve_seat(class_id):
+                status = self.db.query(GroupClass.status).filter(GroupClass.class_id == class_id).scalar()
+                if status is None:
+                    raise ValueError("Class not found.")
+                if status == ClassStatus.CANCELLED:
+                    raise ValueError("Class has been cancelled.")
+                raise ValueError("Class is fully booked.")
+
             new_enrollment = ClassEnrollment(
                 member_id=member_id,
                 class_id=class_id,
@@ -68,12 +113,84 @@ class MemberService:
                 attendance_status=AttendanceStatus.REGISTERED
             )
             self.db.add(new_enrollment)
+            # A member who got in directly no longer needs their place in the queue
+            self.db.execute(delete(WaitlistEntry).where(
+                WaitlistEntry.member_id == member_id, WaitlistEntry.class_id == class_id
+            ))
             self.db.commit()
+            self.dashboard.invalidate(member_id)
             return new_enrollment
         except Exception as e:
             self.db.rollback()
+            # Two concurrent registrations both passed the check above
+            if is_duplicate_registration(e):
+                raise ValueError("Member is already registered.") from e
             raise e
 
+    def cancel_class_registration(self, member_id: int, class_id: int) -> List[int]:
+        """Cancel a registration and hand the seat to the waitlist; returns the promoted member ids."""
+        try:
+            if not self.db.execute(cancel_enrollment_statement(member_id, class_id)).first():
+                raise ValueError("Member is not registered for this class.")
+            self.db.execute(seat_release_statement(class_id))
+            promoted = self.db.execute(promotion_statement(class_id)).scalars().all()
+            self.db.commit()
+            self.dashboard.invalidate(member_id, *promoted)
+            return promoted
+        except Exception as e:
+            self.db.rollback()
+            raise e
+
+    def join_waitlist(self, member_id: int, class_id: int) -> Optional[int]:
+        """Queue for a full class. Returns the place in the queue, or None if a seat was free and the member got it."""
+        try:
+            if not self.db.get(Member, member_id):
+                raise ValueError("Member not found.")
+            group_class = self.db.get(GroupClass, class_id)
+            if not group_class:
+                raise ValueError("Class not found.")
+            if group_class.is_cancelled:
+                raise ValueError("Class has been cancelled.")
+            if not group_class.is_full:
+                raise ValueError("Class has free seats. Register instead.")
+
+            registered = self.db.query(ClassEnrollment.enrollment_id).filter(
+                ClassEnrollment.member_id == member_id,
+                ClassEnrollment.class_id == class_id,
+                ClassEnrollment.attendance_status.in_([AttendanceStatus.REGISTERED, AttendanceStatus.ATTENDED])
+            ).first()
+            if registered: raise ValueError("Member is already registered.")
+            if self.get_waitlist_position(member_id, class_id):
+                raise ValueError("Member is already on the waitlist.")
+
+            self.db.add(WaitlistEntry(class_id=class_id, member_id=member_id))
+            self.db.flush()
+            # A seat may have been freed since the check above
+            promoted = self.db.execute(promotion_statement(class_id)).scalars().all()
+            position = self.get_waitlist_position(member_id, class_id)
+            self.db.commit()
+            self.dashboard.invalidate(*promoted)
+            return position
+        except Exception as e:
+            self.db.rollback()
+            raise e
+
+    def leave_waitlist(self, member_id: int, class_id: int):
+        try:
+            left = self.db.execute(delete(WaitlistEntry).where(
+                WaitlistEntry.member_id == member_id, WaitlistEntry.class_id == class_id
+            )).rowcount
+            if not left:
+                raise ValueError("Member is not on the waitlist for this class.")
+            self.db.commit()
+            return True
+        except Exception as e:
+            self.db.rollback()
+            raise e
+
+    def get_waitlist_position(self, member_id: int, class_id: int) -> Optional[int]:
+        return self.db.execute(waitlist_position_query(member_id, class_id)).scalar()
+
     def schedule_pt_session(self, member_id: int, trainer_id: int, room_id: int, 
                             sched_date: date, start: time, end: time, notes: str = None) -> PersonalTrainingSession:
         try:
@@ -95,76 +212,62 @@ class MemberService:
             )
             self.db.add(new_session)
             self.db.commit()
+            self.availability.add_session(new_session)
+            self.dashboard.invalidate(member_id)
             return new_session
         except Exception as e:
             self.db.rollback()
+            if is_booking_conflict(e):
+                self.availability.invalidate()
+                raise ValueError("The trainer or room was booked by another user for this time slot.") from e
             raise e
 
     def get_member_dashboard_data(self, member_id: int):
-        member = self.db.query(Member).get(member_id)
-        if not member: raise ValueError("Member not found.")
-
-        upcoming_sessions = self.db.query(PersonalTrainingSession).filter(
-            PersonalTrainingSession.member_id == member_id,
-            PersonalTrainingSession.status == SessionStatus.SCHEDULED,
-            PersonalTrainingSession.scheduled_date >= date.today()
-        ).order_by(PersonalTrainingSession.scheduled_date).all()
+        """Member, upcoming PT sessions and upcoming classes; cached until one of them changes."""
+        return self.dashboard.get(self.db, member_id)
 
-        upcoming_classes = self.db.query(ClassEnrollment).join(GroupClass).filter(
-            ClassEnrollment.member_id == member_id,
-            ClassEnrollment.attendance_status == AttendanceStatus.REGISTERED,
-            GroupClass.scheduled_date >= date.today()
-        ).order_by(GroupClass.scheduled_date).all()
-
-        return {"member": member, "upcoming_sessions": upcoming_sessions, "upcoming_classes": upcoming_classes}
+    def find_available_slots(self, trainer_id: int, start_date: date, end_date: date, duration_minutes: int = 60,
+                             room_id: int = None, room_type: str = None, limit: int = 20):
+        """Free PT slots for a trainer and a room (or any room of a type), earliest first."""
+        return find_available_slots(self.db, trainer_id, start_date, end_date, duration_minutes,
+                                    room_id=room_id, room_type=room_type, limit=limit)
 
     def _is_trainer_available(self, trainer_id: int, check_date: date, start: time, end: time) -> bool:
-        pt_conflict = self.db.query(PersonalTrainingSession).filter(
-            PersonalTrainingSession.trainer_id == trainer_id,
-            PersonalTrainingSession.scheduled_date == check_date,
-            PersonalTrainingSession.start_time < end,
-            PersonalTrainingSession.end_time > start,
-            PersonalTrainingSession.status != SessionStatus.CANCELLED
-        ).first()
-        if pt_conflict: return False
-
-        class_conflict = self.db.query(GroupClass).filter(
-            GroupClass.trainer_id == trainer_id,
-            GroupClass.scheduled_date == check_date,
-            GroupClass.start_time < end,
-            GroupClass.end_time > start
-        ).first()
-        if class_conflict: return False
-        return True
+        return self.availability.is_trainer_available(trainer_id, check_date, start, end)
 
     def _is_room_available(self, room_id: int, check_date: date, start: time, end: time) -> bool:
-        pt_conflict = self.db.query(PersonalTrainingSession).filter(
-            PersonalTrainingSession.room_id == room_id,
-            PersonalTrainingSession.scheduled_date == check_date,
-            PersonalTrainingSession.start_time < end,
-            PersonalTrainingSession.end_time > start,
-            PersonalTrainingSession.status != SessionStatus.CANCELLED
-        ).first()
-        if pt_conflict: return False
-
-        class_conflict = self.db.query(GroupClass).filter(
-            GroupClass.room_id == room_id,
-            GroupClass.scheduled_date == check_date,
-            GroupClass.start_time < end,
-            GroupClass.end_time > start
-        ).first()
-        if class_conflict: return False
-        return True
+        return self.availability.is_room_available(room_id, check_date, start, end)
+
+    def _reserve_seat(self, class_id: int) -> bool:
+        """Atomically take one seat; False if the class is full or does not exist."""
+        claimed = self.db.execute(seat_claim_statement(class_id)).first()
+        return claimed is not None
 
     # Helpers
-    def get_all_members(self):
-        return self.db.query(Member).all()
+    def get_all_members(self) -> List[MemberRow]:
+        return fetch_all(self.db, members_query(), MemberRow)
     
     def get_all_trainers(self):
-        return self.db.query(Trainer).all()
+        return self.reference.trainers(self.db)
         
     def get_all_rooms(self):
-        return self.db.query(Room).all()
+        return self.reference.rooms(self.db)
         
-    def get_all_classes(self):
-        return self.db.query(GroupClass).filter(GroupClass.scheduled_date >= date.today()).all()
\ No newline at end of file
+    def get_all_classes(self) -> List[ClassRow]:
+        return fetch_all(self.db, upcoming_classes_query(), ClassRow)
+
+    # Paginated (keyset on primary key) and streaming listings, as read-only rows
+    def get_members_page(self, after_id: int = None, limit: int = DEFAULT_PAGE_SIZE):
+        return fetch_page(self.db, members_query(), MemberRow, Member.member_id, after_id, limit)
+
+    def get_trainers_page(self, after_id: int = None, limit: int = DEFAULT_PAGE_SIZE):
+        return self.reference.trainers_page(self.db, after_id, limit)
+
+    def get_classes_page(self, after_id: int = None, limit: int = DEFAULT_PAGE_SIZE):
+        return fetch_page(self.db, upcoming_classes_query(), ClassRow, GroupClass.class_id, after_id, limit)
+
+    def iter_members(self, batch_size: int = DEFAULT_BATCH_SIZE):
+        return fetch_stream(self.db, members_query(), MemberRow, Member.member_id, batch_size)
+
+    def iter_classes(self, batch_size: int = DEFAULT_BATCH_SIZE):
+        return fetch_stream(self.db, upcoming_classes_query(), ClassRow, GroupClass.class_id, batch_size)
\ No newline at end of file
@@ -0,0 +1,3 @@
+# Defaults for keyset pages and streamed listings (see read_models)
+DEFAULT_PAGE_SIZE = 50
+DEFAULT_BATCH_SIZE = 1000
\ No newline at end of file
@@ -0,0 +1,54 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select
+from collections import namedtuple
+from datetime import date
+from typing import Iterator, List
+
+from models.member import Member
+from models.group_class import GroupClass, ClassStatus
+from services.pagination import DEFAULT_PAGE_SIZE, DEFAULT_BATCH_SIZE
+
+# Read-only listing records: only the listed columns, never in the identity map
+MemberRow = namedtuple("MemberRow", "member_id first_name last_name email")
+
+class ClassRow(namedtuple("ClassRow", "class_id class_name trainer_id room_id scheduled_date start_time end_time "
+                                      "capacity enrolled_count status")):
+    __slots__ = ()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.status == ClassStatus.CANCELLED
+
+def members_query(*criteria):
+    return select(Member.member_id, Member.first_name, Member.last_name, Member.email).where(*criteria)
+
+def classes_query(*criteria):
+    return select(
+        GroupClass.class_id, GroupClass.class_name, GroupClass.trainer_id, GroupClass.room_id,
+        GroupClass.scheduled_date, GroupClass.start_time, GroupClass.end_time,
+        GroupClass.capacity, GroupClass.enrolled_count, GroupClass.status
+    ).where(*criteria)
+
+def upcoming_classes_query():
+    """Scheduled classes from today on (the ones members can book)."""
+    return classes_query(GroupClass.scheduled_date >= date.today(), GroupClass.status == ClassStatus.SCHEDULED)
+
+def fetch_all(db: Session, stmt, record) -> List:
+    return list(map(record._make, db.execute(stmt)))
+
+def fetch_page(db: Session, stmt, record, key_column, after=None, limit: int = DEFAULT_PAGE_SIZE) -> List:
+    """
+    The next `limit` rows after `after` in `key_column` order, as `record` tuples.
+    Uses WHERE key > after instead of OFFSET, so every page costs the same index range scan.
+    """
+    if after is not None:
+        stmt = stmt.where(key_column > after)
+    return fetch_all(db, stmt.order_by(key_column).limit(limit), record)
+
+def fetch_stream(db: Session, stmt, record, key_column, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator:
+    """
+    Iterate over `stmt` in `key_column` order through a server-side cursor, `batch_size`
+    rows at a time. The session's connection stays busy until the iterator is exhausted.
+    """
+    rows = db.execute(stmt.order_by(key_column).execution_options(yield_per=batch_size))
+    return map(record._make, rows)
\ No newline at end of file
@@ -0,0 +1,115 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy import select
+from collections import namedtuple
+from itertools import islice
+from threading import Lock
+from types import MappingProxyType
+from typing import List, Optional
+import time
+
+from models.room import Room
+from models.trainer import Trainer
+from services.pagination import DEFAULT_PAGE_SIZE
+
+# Read-only reference records (safe to share between sessions and threads)
+RoomRecord = namedtuple("RoomRecord", "room_id room_name capacity room_type")
+TrainerRecord = namedtuple("TrainerRecord", "trainer_id first_name last_name email specialization hire_date")
+ReferenceSnapshot = namedtuple("ReferenceSnapshot", "version rooms trainers loaded_at")
+
+# Process-wide cache of the rooms and trainers tables
+class ReferenceData:
+    """
+    Keeps every room and trainer as an immutable record keyed by id, so lookups
+    are a dict hit instead of a query. add_room/add_trainer call invalidate(),
+    which bumps `version` and drops the snapshot; rows added by another process
+    show up after `ttl` seconds, or on the first lookup of an id not seen yet.
+    """
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        self.version = 0
+        self._snapshot = None
+        self._lock = Lock()
+
+    def current(self) -> Optional[ReferenceSnapshot]:
+        """The loaded snapshot, or None if there is none or it is stale (never queries)."""
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.version != self.version:
+            return None
+        if time.monotonic() - snapshot.loaded_at > self.ttl:
+            return None
+        return snapshot
+
+    def load(self, db: Session) -> ReferenceSnapshot:
+        version = self.version
+        rooms = db.execute(
+            select(Room.room_id, Room.room_name, Room.capacity, Room.room_type).order_by(Room.room_id)
+        )
+        trainers = db.execute(
+            select(Trainer.trainer_id, Trainer.first_name, Trainer.last_name, Trainer.email,
+                   Trainer.specialization, Trainer.hire_date).order_by(Trainer.trainer_id)
+        )
+        snapshot = ReferenceSnapshot(
+            version,
+            MappingProxyType({row.room_id: RoomRecord(*row) for row in rooms}),
+            MappingProxyType({row.trainer_id: TrainerRecord(*row) for row in trainers}),
+            time.monotonic()
+        )
+        with self._lock:
+            # Invalidated while loading: hand these rows out once but do not keep them
+            if version == self.version:
+                self._snapshot = snapshot
+        return snapshot
+
+    def get(self, db: Session) -> ReferenceSnapshot:
+        return self.current() or self.load(db)
+
+    def rooms(self, db: Session) -> List[RoomRecord]:
+        return list(self.get(db).rooms.values())
+
+    def trainers(self, db: Session) -> List[TrainerRecord]:
+        return list(self.get(db).trainers.values())
+
+    def trainers_page(self, db: Session, after_id: int = None, limit: int = DEFAULT_PAGE_SIZE) -> List[TrainerRecord]:
+        """Same contract as read_models.fetch_page, served from the snapshot."""
+        trainers = self.get(db).trainers.values()
+        return list(islice((t for t in trainers if after_id is None or t.trainer_id > after_id), limit))
+
+    def room(self, db: Session, room_id: int) -> Optional[RoomRecord]:
+        return self._lookup(db, "rooms", room_id)
+
+    def trainer(self, db: Session, trainer_id: int) -> Optional[TrainerRecord]:
+        return self._lookup(db, "trainers", trainer_id)
+
+    def _lookup(self, db: Session, table: str, key: int):
+        snapshot = self.current()
+        if snapshot is not None:
+            record = getattr(snapshot, table).get(key)
+            if record is not None:
+                return record
+        # Unknown id: reload once in case another process added it
+        return getattr(self.load(db), table).get(key)
+
+    # Async services load through a short-lived AsyncSession (run_sync), only on a miss
+    async def get_async(self, session_factory: async_sessionmaker) -> ReferenceSnapshot:
+        snapshot = self.current()
+        if snapshot is None:
+            async with session_factory() as db:
+                snapshot = await db.run_sync(self.load)
+        return snapshot
+
+    async def room_async(self, session_factory: async_sessionmaker, room_id: int) -> Optional[RoomRecord]:
+        snapshot = self.current()
+        record = snapshot.rooms.get(room_id) if snapshot is not None else None
+        if record is None:
+            async with session_factory() as db:
+                record = (await db.run_sync(self.load)).rooms.get(room_id)
+        return record
+
+    def invalidate(self):
+        with self._lock:
+            self.version += 1
+            self._snapshot = None
+
+reference_data = ReferenceData()
\ No newline at end of file
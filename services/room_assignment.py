@@ -0,0 +1,126 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, union_all
+from bisect import bisect_left, insort
+from collections import namedtuple
+from datetime import date, time, datetime
+from typing import List, Dict, Any, Tuple
+
+from models.group_class import GroupClass, ClassStatus
+from models.personal_training_session import PersonalTrainingSession, SessionStatus
+from models.room import Room
+
+# One class to place; room_type is optional
+ClassRequest = namedtuple("ClassRequest", "class_name trainer_id scheduled_date start_time end_time capacity room_type",
+                          defaults=(None,))
+
+def bookings_query(dates):
+    """Room, trainer and time of every class and active PT session on the given dates."""
+    columns = lambda model: (model.room_id, model.trainer_id, model.scheduled_date, model.start_time, model.end_time)
+    return union_all(
+        select(*columns(GroupClass)).where(
+            GroupClass.scheduled_date.in_(dates),
+            GroupClass.status != ClassStatus.CANCELLED
+        ),
+        select(*columns(PersonalTrainingSession)).where(
+            PersonalTrainingSession.scheduled_date.in_(dates),
+            PersonalTrainingSession.status != SessionStatus.CANCELLED
+        )
+    )
+
+def _is_free(slots: List[Tuple[time, time]], start: time, end: time) -> bool:
+    # Only bookings starting before `end` can overlap. Existing bookings may overlap
+    # each other (trainers are not DB-protected without the exclusion constraints),
+    # so check them all rather than just the last one.
+    i = bisect_left(slots, (end,))
+    return all(slot_end <= start for _, slot_end in slots[:i])
+
+def partition_rooms(requests: List[ClassRequest], rooms, bookings) -> List[Dict[str, Any]]:
+    """
+    Greedy interval partitioning. Requests are placed in start-time order (larger
+    classes first on ties); each goes to a room already used by this batch if one
+    is free and big enough, choosing the one that became free most recently, then
+    the smallest. Only otherwise is another room opened, again the smallest that
+    fits. Existing bookings block rooms and trainers, as do earlier placements.
+
+    `rooms` are (room_id, capacity, room_type); `bookings` are (room_id,
+    trainer_id, date, start, end). Returns one result per request, in input order.
+    """
+    room_busy: Dict[Tuple[int, date], List[Tuple[time, time]]] = {}
+    trainer_busy: Dict[Tuple[int, date], List[Tuple[time, time]]] = {}
+    for room_id, trainer_id, sched_date, start, end in bookings:
+        insort(room_busy.setdefault((room_id, sched_date), []), (start, end))
+        insort(trainer_busy.setdefault((trainer_id, sched_date), []), (start, end))
+
+    # Smallest rooms first, so the first fit is also the tightest fit
+    rooms = sorted(rooms, key=lambda r: (r[1], r[0]))
+    eligible: Dict[Tuple[int, str], List[int]] = {}
+    used = {}  # room_id -> (date, end) of its latest placement
+    results: List[Dict[str, Any]] = [None] * len(requests)
+
+    order = sorted(range(len(requests)), key=lambda i: (
+        requests[i].scheduled_date, requests[i].start_time, -requests[i].capacity
+    ))
+    for i in order:
+        req = requests[i]
+        if req.start_time >= req.end_time:
+            results[i] = {"request": req, "room_id": None, "reason": "End time must be after start time."}
+            continue
+
+        trainer_key = (req.trainer_id, req.scheduled_date)
+        if not _is_free(trainer_busy.get(trainer_key, []), req.start_time, req.end_time):
+            results[i] = {"request": req, "room_id": None, "reason": "Trainer is already booked at this time."}
+            continue
+
+        fits = eligible.get((req.capacity, req.room_type))
+        if fits is None:
+            fits = eligible[(req.capacity, req.room_type)] = [
+                room_id for room_id, capacity, room_type in rooms
+                if capacity >= req.capacity and (not req.room_type or room_type == req.room_type)
+            ]
+        candidates = [
+            room_id for room_id in fits
+            if _is_free(room_busy.get((room_id, req.scheduled_date), ()), req.start_time, req.end_time)
+        ]
+        if not candidates:
+            results[i] = {"request": req, "room_id": None, "reason": "No room with enough capacity is free."}
+            continue
+
+        # Reuse a room from this batch when possible (fewest rooms overall);
+        # candidates are smallest first, so ties keep the smaller room
+        room_id = candidates[0]
+        reused = [r for r in candidates if r in used]
+        if reused:
+            room_id = max(reused, key=lambda r: used[r])
+
+        used[room_id] = (req.scheduled_date, req.end_time)
+        insort(room_busy.setdefault((room_id, req.scheduled_date), []), (req.start_time, req.end_time))
+        insort(trainer_busy.setdefault(trainer_key, []), (req.start_time, req.end_time))
+        results[i] = {"request": req, "room_id": room_id, "reason": None}
+    return results
+
+def assign_rooms(db: Session, requests: List[ClassRequest], rooms=None) -> List[Dict[str, Any]]:
+    """Load rooms (unless given) and the existing bookings on the requested dates and partition."""
+    if not requests:
+        return []
+    if rooms is None:
+        rooms = db.execute(select(Room.room_id, Room.capacity, Room.room_type)).all()
+    dates = sorted({req.scheduled_date for req in requests})
+    bookings = db.execute(bookings_query(dates)).all()
+    return partition_rooms(requests, rooms, bookings)
+
+def parse_class_request(record: Dict[str, Any]) -> ClassRequest:
+    """CSV/JSON record (class_name, trainer_id, date, start_time, end_time, capacity[, room_type]) -> ClassRequest."""
+    try:
+        return ClassRequest(
+            class_name=record["class_name"].strip(),
+            trainer_id=int(record["trainer_id"]),
+            scheduled_date=datetime.strptime(record["date"].strip(), "%Y-%m-%d").date(),
+            start_time=datetime.strptime(record["start_time"].strip(), "%H:%M").time(),
+            end_time=datetime.strptime(record["end_time"].strip(), "%H:%M").time(),
+            capacity=int(record["capacity"]),
+            room_type=(record.get("room_type") or "").strip() or None
+        )
+    except KeyError as e:
+        raise ValueError(f"Missing field {e}.")
+    except (TypeError, AttributeError, ValueError) as e:
+        raise ValueError(f"Invalid record: {e}")
\ No newline at end of file
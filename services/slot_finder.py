@@ -0,0 +1,149 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, union_all, literal, null, type_coerce, Date, Time
+from heapq import merge
+from datetime import date, time, datetime, timedelta
+from typing import List, Dict, Any, Tuple, Iterable
+
+from models.group_class import GroupClass, ClassStatus
+from models.personal_training_session import PersonalTrainingSession, SessionStatus
+from models.room import Room
+
+# Bookable hours for PT sessions
+OPENING_TIME = time(6, 0)
+CLOSING_TIME = time(22, 0)
+
+def _minutes(t: time) -> int:
+    return t.hour * 60 + t.minute
+
+def _time(minutes: int) -> time:
+    return time(minutes // 60, minutes % 60)
+
+def busy_intervals_query(trainer_id: int, rooms, start_date: date, end_date: date):
+    """
+    One UNION ALL returning (resource, resource_id, scheduled_date, start_time,
+    end_time) for every class and active PT session of the trainer and of the
+    candidate rooms, plus one row with a NULL date per candidate room so rooms
+    with no bookings are still seen. `rooms` is a select of room ids.
+    """
+    in_range = lambda column: column.between(start_date, end_date)
+    active = PersonalTrainingSession.status != SessionStatus.CANCELLED
+    scheduled = GroupClass.status != ClassStatus.CANCELLED
+
+    def branch(resource, model, column, *criteria):
+        return select(
+            literal(resource).label("resource"),
+            column.label("resource_id"),
+            model.scheduled_date,
+            model.start_time,
+            model.end_time
+        ).where(in_range(model.scheduled_date), *criteria)
+
+    return union_all(
+        branch("trainer", GroupClass, GroupClass.trainer_id, GroupClass.trainer_id == trainer_id, scheduled),
+        branch("trainer", PersonalTrainingSession, PersonalTrainingSession.trainer_id,
+               PersonalTrainingSession.trainer_id == trainer_id, active),
+        branch("room", GroupClass, GroupClass.room_id, GroupClass.room_id.in_(rooms), scheduled),
+        branch("room", PersonalTrainingSession, PersonalTrainingSession.room_id,
+               PersonalTrainingSession.room_id.in_(rooms), active),
+        select(
+            literal("room"),
+            Room.room_id,
+            type_coerce(null(), Date),
+            type_coerce(null(), Time),
+            type_coerce(null(), Time)
+        ).where(Room.room_id.in_(rooms))
+    ).order_by("resource", "resource_id", "scheduled_date", "start_time")
+
+def free_gaps(trainer_busy: Iterable[Tuple[int, int]], room_busy: Iterable[Tuple[int, int]],
+              opening: int, closing: int) -> List[Tuple[int, int]]:
+    """
+    Sweep line over two start-sorted busy lists (minutes since midnight):
+    merge them, coalesce overlaps and return the free gaps between opening and closing.
+    """
+    gaps = []
+    cursor = opening
+    for start, end in merge(trainer_busy, room_busy):
+        if start > cursor:
+            gaps.append((cursor, min(start, closing)))
+        cursor = max(cursor, end)
+        if cursor >= closing:
+            break
+    if cursor < closing:
+        gaps.append((cursor, closing))
+    return [(start, end) for start, end in gaps if end > start]
+
+def candidate_rooms(room_id: int = None, room_type: str = None):
+    """Select of candidate room ids: `room_id`, else every room of `room_type`, else all rooms."""
+    rooms = select(Room.room_id)
+    if room_id is not None:
+        return rooms.where(Room.room_id == room_id)
+    if room_type:
+        return rooms.where(Room.room_type == room_type)
+    return rooms
+
+def find_available_slots(db: Session, trainer_id: int, start_date: date, end_date: date,
+                         duration_minutes: int = 60, room_id: int = None, room_type: str = None,
+                         step_minutes: int = 30, limit: int = 20, now: datetime = None) -> List[Dict[str, Any]]:
+    """
+    Free PT slots where both the trainer and a candidate room are free, earliest
+    first, from a single query (see available_slots).
+    """
+    validate_slot_search(start_date, end_date, duration_minutes)
+    rows = db.execute(busy_intervals_query(trainer_id, candidate_rooms(room_id, room_type), start_date, end_date))
+    return available_slots(rows, trainer_id, start_date, end_date, duration_minutes, step_minutes, limit, now)
+
+def validate_slot_search(start_date: date, end_date: date, duration_minutes: int):
+    if duration_minutes <= 0:
+        raise ValueError("Duration must be positive.")
+    if end_date < start_date:
+        raise ValueError("End date must not be before start date.")
+
+def available_slots(rows, trainer_id: int, start_date: date, end_date: date, duration_minutes: int = 60,
+                    step_minutes: int = 30, limit: int = 20, now: datetime = None) -> List[Dict[str, Any]]:
+    """
+    Turn busy_intervals_query rows into ranked free slots. Starts are aligned to
+    `step_minutes`; for each start the best-fitting room is offered (the one
+    whose free gap is smallest, which keeps long gaps open for longer bookings).
+    """
+    trainer_busy: Dict[date, List[Tuple[int, int]]] = {}
+    room_busy: Dict[int, Dict[date, List[Tuple[int, int]]]] = {}
+    for row in rows:
+        if row.resource == "room":
+            days = room_busy.setdefault(row.resource_id, {})
+            if row.scheduled_date is None:
+                continue
+        else:
+            days = trainer_busy
+        days.setdefault(row.scheduled_date, []).append((_minutes(row.start_time), _minutes(row.end_time)))
+
+    now = now or datetime.now()
+    opening, closing = _minutes(OPENING_TIME), _minutes(CLOSING_TIME)
+    best: Dict[Tuple[date, int], Tuple[int, int]] = {}
+
+    # Nothing can be booked in the past
+    day = max(start_date, now.date())
+    while day <= end_date:
+        earliest = max(opening, now.hour * 60 + now.minute) if day == now.date() else opening
+        for rid, days in room_busy.items():
+            for gap_start, gap_end in free_gaps(trainer_busy.get(day, []), days.get(day, []), opening, closing):
+                start = max(gap_start, earliest)
+                start += -start % step_minutes
+                while start + duration_minutes <= gap_end:
+                    key = (day, start)
+                    candidate = (gap_end - gap_start, rid)
+                    if key not in best or candidate < best[key]:
+                        best[key] = candidate
+                    start += step_minutes
+        day += timedelta(days=1)
+
+    slots = []
+    for (slot_date, start) in sorted(best)[:limit]:
+        rid = best[(slot_date, start)][1]
+        slots.append({
+            "date": slot_date,
+            "start_time": _time(start),
+            "end_time": _time(start + duration_minutes),
+            "trainer_id": trainer_id,
+            "room_id": rid,
+        })
+    return slots
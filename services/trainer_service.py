@@ -1,70 +1,115 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from sqlalchemy import or_, and_, select, union_all, func, null, literal_column, type_coerce, String
+from collections import namedtuple
 from datetime import date, datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 
-from models.trainer import Trainer
+from database.instrumentation import instrument_service
 from models.member import Member
 from models.personal_training_session import PersonalTrainingSession, SessionStatus
-from models.group_class import GroupClass
+from models.group_class import GroupClass, ClassStatus
 from models.class_enrollment import ClassEnrollment
+from models.room import Room
+from services.availability import AvailabilityEngine
+from services.member_search import MemberSearch
+from services.attendance import AttendanceService
+from services.concurrency import update_versioned
+from services.dashboard import DashboardCache, dashboard_cache
+from services.reference_data import ReferenceData, reference_data
+from services.read_models import MemberRow, members_query, fetch_all, fetch_page, fetch_stream
+from services.pagination import DEFAULT_PAGE_SIZE, DEFAULT_BATCH_SIZE
 
+# One line of a trainer's schedule; classes fill capacity_status, PT sessions status
+ScheduleItem = namedtuple("ScheduleItem", "type id name date start_time end_time room capacity_status status")
+
+def schedule_query(trainer_id: int, start_date: date, end_date: date):
+    """One UNION ALL select of a trainer's classes and PT sessions, ordered by date and time."""
+    classes = select(
+        literal_column("'Group Class'", String).label("type"),
+        GroupClass.class_id.label("id"),
+        GroupClass.class_name.label("name"),
+        GroupClass.scheduled_date.label("date"),
+        GroupClass.start_time.label("start_time"),
+        GroupClass.end_time.label("end_time"),
+        func.coalesce(Room.room_name, "Unassigned").label("room"),
+        GroupClass.enrolled_count.label("enrolled"),
+        GroupClass.capacity.label("capacity"),
+        type_coerce(null(), PersonalTrainingSession.status.type).label("status")
+    ).outerjoin(Room, Room.room_id == GroupClass.room_id).where(
+        GroupClass.trainer_id == trainer_id,
+        GroupClass.scheduled_date >= start_date,
+        GroupClass.scheduled_date <= end_date,
+        GroupClass.status != ClassStatus.CANCELLED
+    )
+
+    member_name = func.coalesce(Member.first_name + " " + Member.last_name, "Unknown")
+    pt_sessions = select(
+        literal_column("'PT Session'", String),
+        PersonalTrainingSession.session_id,
+        literal_column("'Session with '", String) + member_name,
+        PersonalTrainingSession.scheduled_date,
+        PersonalTrainingSession.start_time,
+        PersonalTrainingSession.end_time,
+        func.coalesce(Room.room_name, "Unassigned"),
+        null(),
+        null(),
+        PersonalTrainingSession.status
+    ).outerjoin(Member, Member.member_id == PersonalTrainingSession.member_id).outerjoin(
+        Room, Room.room_id == PersonalTrainingSession.room_id
+    ).where(
+        PersonalTrainingSession.trainer_id == trainer_id,
+        PersonalTrainingSession.scheduled_date >= start_date,
+        PersonalTrainingSession.scheduled_date <= end_date
+    )
+
+    return union_all(classes, pt_sessions).order_by("date", "start_time")
+
+def schedule_item(row) -> ScheduleItem:
+    """Turn a schedule_query row into the record shown by the trainer menu."""
+    if row.type == "Group Class":
+        capacity_status, status = f"{row.enrolled}/{row.capacity}", None
+    else:
+        capacity_status, status = None, row.status.value
+    return ScheduleItem(row.type, row.id, row.name, row.date, row.start_time, row.end_time, row.room,
+                        capacity_status, status)
+
+def parse_session_status(new_status: str) -> SessionStatus:
+    try:
+        # Convert string input to Enum
+        return SessionStatus(new_status)
+    except ValueError:
+        valid_options = [s.value for s in SessionStatus]
+        raise ValueError(f"Invalid status '{new_status}'. Valid options: {valid_options}")
+
+@instrument_service
 class TrainerService:
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, availability: AvailabilityEngine = None,
+                 dashboard: DashboardCache = None, reference: ReferenceData = None):
         self.db = db_session
+        self.availability = availability or AvailabilityEngine(db_session)
+        self.dashboard = dashboard or dashboard_cache
+        self.reference = reference or reference_data
+        self.member_search = MemberSearch(db_session)
+        self.attendance = AttendanceService(db_session, self.dashboard)
+
+    def get_trainer_schedule(self, trainer_id: int, start_date: date, end_date: date) -> List[ScheduleItem]:
+        return list(self.iter_trainer_schedule(trainer_id, start_date, end_date))
+
+    def iter_trainer_schedule(self, trainer_id: int, start_date: date, end_date: date,
+                              batch_size: int = 500) -> Iterator[ScheduleItem]:
+        """
+        Stream a trainer's classes and PT sessions in date/time order.
+        Everything (room, member name, enrollment count) comes from one UNION ALL query.
+        """
+        stmt = schedule_query(trainer_id, start_date, end_date)
+        rows = self.db.execute(stmt.execution_options(yield_per=batch_size))
 
-    def get_trainer_schedule(self, trainer_id: int, start_date: date, end_date: date) -> List[Dict[str, Any]]:
-        classes = self.db.query(GroupClass).filter(
-            GroupClass.trainer_id == trainer_id,
-            GroupClass.scheduled_date >= start_date,
-            GroupClass.scheduled_date <= end_date
-        ).all()
-
-        pt_sessions = self.db.query(PersonalTrainingSession).filter(
-            PersonalTrainingSession.trainer_id == trainer_id,
-            PersonalTrainingSession.scheduled_date >= start_date,
-            PersonalTrainingSession.scheduled_date <= end_date,
-        ).all()
-
-        schedule = []
-        
-        for c in classes:
-            schedule.append({
-                "type": "Group Class",
-                "id": c.class_id,
-                "name": c.class_name,
-                "date": c.scheduled_date,
-                "start_time": c.start_time,
-                "end_time": c.end_time,
-                "room": c.room.room_name if c.room else "Unassigned",
-                "capacity_status": f"{c.current_enrollment}/{c.capacity}"
-            })
-
-        for s in pt_sessions:
-            member_name = f"{s.member.first_name} {s.member.last_name}" if s.member else "Unknown"
-            schedule.append({
-                "type": "PT Session",
-                "id": s.session_id,
-                "name": f"Session with {member_name}",
-                "date": s.scheduled_date,
-                "start_time": s.start_time,
-                "end_time": s.end_time,
-                "room": s.room.room_name if s.room else "Unassigned",
-                "status": s.status.value
-            })
-
-        schedule.sort(key=lambda x: (x['date'], x['start_time']))
-        return schedule
-
-    def search_members(self, query_name: str) -> List[Member]:
-        search_term = f"%{query_name}%"
-        members = self.db.query(Member).filter(
-            or_(
-                Member.first_name.ilike(search_term),
-                Member.last_name.ilike(search_term)
-            )
-        ).all()
-        return members
+        for row in rows:
+            yield schedule_item(row)
+
+    def search_members(self, query_name: str, limit: int = 20) -> List[MemberRow]:
+        """Top `limit` members by name/email similarity (see MemberSearch)."""
+        return self.member_search.search(query_name, limit)
 
     def view_member_profile(self, member_id: int) -> Dict[str, Any]:
         member = self.db.query(Member).get(member_id)
@@ -85,36 +130,52 @@ class TrainerService:
             ]
         }
 
-    def update_session_notes(self, session_id: int, notes: str):
-        session = self.db.query(PersonalTrainingSession).get(session_id)
-        if not session:
-            raise ValueError("Session not found.")
-        
-        session.notes = notes
-        self.db.commit()
+    def update_session_notes(self, session_id: int, notes: str, expected_version: int = None):
+        """Pass the `version_id` the trainer saw as `expected_version` to refuse overwriting newer edits."""
+        try:
+            session = update_versioned(self.db, PersonalTrainingSession, session_id,
+                                       lambda s: setattr(s, "notes", notes), "Session", expected_version)
+        except Exception as e:
+            self.db.rollback()
+            raise e
+        self.dashboard.invalidate(session.member_id)
         return session
 
-    def update_session_status(self, session_id: int, new_status: str):
+    def update_session_status(self, session_id: int, new_status: str, expected_version: int = None):
         """
         Updates the status of a PT session (e.g. to 'Completed' or 'No Show').
+        Raises ConcurrentUpdateError if someone else changed it first (see update_versioned).
         """
-        session = self.db.query(PersonalTrainingSession).get(session_id)
-        if not session:
-            raise ValueError("Session not found.")
-        
+        status_enum = parse_session_status(new_status)
         try:
-            # Convert string input to Enum
-            status_enum = SessionStatus(new_status)
-        except ValueError:
-            valid_options = [s.value for s in SessionStatus]
-            raise ValueError(f"Invalid status '{new_status}'. Valid options: {valid_options}")
-
-        session.status = status_enum
-        self.db.commit()
+            session = update_versioned(self.db, PersonalTrainingSession, session_id,
+                                       lambda s: setattr(s, "status", status_enum), "Session", expected_version)
+        except Exception as e:
+            self.db.rollback()
+            raise e
+        if status_enum == SessionStatus.CANCELLED:
+            self.availability.remove_session(session.session_id)
+        else:
+            self.availability.add_session(session)
+        self.dashboard.invalidate(session.member_id)
         return session
     
+    def mark_class_attendance(self, class_id: int, new_status: str = "Attended", member_ids: List[int] = None) -> int:
+        """Mark all (or the given) members of a class Attended/Absent in one UPDATE (see AttendanceService)."""
+        return self.attendance.mark_class_attendance(class_id, new_status, member_ids)
+
     def get_all_trainers(self):
-        return self.db.query(Trainer).all()
+        return self.reference.trainers(self.db)
+
+    def get_all_members(self) -> List[MemberRow]:
+        return fetch_all(self.db, members_query(), MemberRow)
+
+    # Paginated (keyset on primary key) and streaming listings, as read-only rows
+    def get_members_page(self, after_id: int = None, limit: int = DEFAULT_PAGE_SIZE):
+        return fetch_page(self.db, members_query(), MemberRow, Member.member_id, after_id, limit)
+
+    def get_trainers_page(self, after_id: int = None, limit: int = DEFAULT_PAGE_SIZE):
+        return self.reference.trainers_page(self.db, after_id, limit)
 
-    def get_all_members(self):
-        return self.db.query(Member).all()
\ No newline at end of file
+    def iter_members(self, batch_size: int = DEFAULT_BATCH_SIZE):
+        return fetch_stream(self.db, members_query(), MemberRow, Member.member_id, batch_size)
\ No newline at end of file
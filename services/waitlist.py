@@ -0,0 +1,92 @@
+from sqlalchemy import select, insert, update, delete, func, literal, cast
+
+from models.group_class import GroupClass, ClassStatus
+from models.class_enrollment import ClassEnrollment, AttendanceStatus
+from models.class_waitlist import WaitlistEntry
+
+def promotion_statement(class_id: int):
+    """
+    One statement that fills a class's free seats from the front of its waitlist:
+    lock the class row, take that many waiting members in queue order, delete
+    them from the waitlist, enroll them and add them to enrolled_count. Returns
+    the promoted member ids.
+
+    The class row lock serializes promotions of one class, so concurrent
+    cancellations cannot promote the same member twice or overfill the class;
+    entries a concurrent leave_waitlist is removing are skipped, not waited on.
+    """
+    seats = (
+        select((GroupClass.capacity - GroupClass.enrolled_count).label("free"))
+        .where(GroupClass.class_id == class_id, GroupClass.status == ClassStatus.SCHEDULED)
+        .with_for_update()
+        .cte("seats")
+    )
+    next_up = (
+        select(WaitlistEntry.waitlist_id)
+        .where(WaitlistEntry.class_id == class_id)
+        .order_by(WaitlistEntry.waitlist_id)
+        # No seats row (unknown or cancelled class) must mean LIMIT 0, not LIMIT NULL (= ALL)
+        .limit(func.coalesce(select(func.greatest(seats.c.free, 0)).scalar_subquery(), 0))
+        .with_for_update(skip_locked=True)
+        .cte("next_up")
+    )
+    promoted = (
+        delete(WaitlistEntry)
+        .where(WaitlistEntry.waitlist_id.in_(select(next_up.c.waitlist_id)))
+        .returning(WaitlistEntry.waitlist_id, WaitlistEntry.member_id)
+        .cte("promoted")
+    )
+    enrolled = (
+        insert(ClassEnrollment)
+        .from_select(
+            ["class_id", "member_id", "enrollment_date", "attendance_status"],
+            select(
+                literal(class_id),
+                promoted.c.member_id,
+                func.current_date(),
+                cast(AttendanceStatus.REGISTERED, ClassEnrollment.attendance_status.type)
+            ).order_by(promoted.c.waitlist_id)
+        )
+        .returning(ClassEnrollment.member_id)
+        .cte("enrolled")
+    )
+    counted = (
+        update(GroupClass)
+        .where(GroupClass.class_id == class_id, GroupClass.status == ClassStatus.SCHEDULED)
+        .values(enrolled_count=GroupClass.enrolled_count + select(func.count()).select_from(promoted).scalar_subquery())
+        .cte("counted")
+    )
+    # `counted` is not selected from, so attach it explicitly
+    return select(enrolled.c.member_id).add_cte(counted)
+
+def cancel_enrollment_statement(member_id: int, class_id: int):
+    """Cancel a member's registration (not past attendance); returns the enrollment id if there was one."""
+    return (
+        update(ClassEnrollment)
+        .where(
+            ClassEnrollment.member_id == member_id,
+            ClassEnrollment.class_id == class_id,
+            ClassEnrollment.attendance_status == AttendanceStatus.REGISTERED
+        )
+        .values(attendance_status=AttendanceStatus.CANCELLED)
+        .returning(ClassEnrollment.enrollment_id)
+    )
+
+def seat_release_statement(class_id: int, seats: int = 1):
+    """Give back seats; locks the class row until commit."""
+    return (
+        update(GroupClass)
+        .where(GroupClass.class_id == class_id)
+        .values(enrolled_count=GroupClass.enrolled_count - seats)
+    )
+
+def waitlist_position_query(member_id: int, class_id: int):
+    """1-based place of the member in the class's queue (no row if not waiting)."""
+    entry = (
+        select(WaitlistEntry.waitlist_id)
+        .where(WaitlistEntry.class_id == class_id, WaitlistEntry.member_id == member_id)
+        .scalar_subquery()
+    )
+    return select(func.count()).where(
+        WaitlistEntry.class_id == class_id, WaitlistEntry.waitlist_id <= entry
+    ).having(func.count() > 0)
\ No newline at end of file
@@ -0,0 +1,54 @@
+import argparse
+import json
+import sys
+from benchmarks.load_simulator import BookingLoadSimulator
+
+def main():
+    parser = argparse.ArgumentParser(description="Hammer class registration and PT booking from many processes at once.")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent simulated members (one process each)")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds each worker keeps booking")
+    parser.add_argument("--max-ops", type=int, default=10_000, help="Upper bound on calls per worker")
+    parser.add_argument("--hot-classes", type=int, default=5, help="Classes everyone competes for")
+    parser.add_argument("--class-capacity", type=int, default=20)
+    parser.add_argument("--hot-trainers", type=int, default=3, help="Trainers (and rooms) taking PT bookings")
+    parser.add_argument("--pt-ratio", type=float, default=0.3, help="Share of calls that book PT sessions")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="Random pause of up to this long between calls")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Also write the report as JSON")
+    args = parser.parse_args()
+
+    report = BookingLoadSimulator(
+        workers=args.workers,
+        duration=args.duration,
+        max_ops_per_worker=args.max_ops,
+        hot_classes=args.hot_classes,
+        class_capacity=args.class_capacity,
+        hot_trainers=args.hot_trainers,
+        pt_ratio=args.pt_ratio,
+        think_ms=args.think_ms,
+        seed=args.seed
+    ).run()
+
+    print("--- LOAD TEST COMPLETE ---")
+    print(f"Calls: {report['total_calls']} in {report['elapsed_s']}s ({report['throughput_per_s']}/s)")
+    for name, op in report["operations"].items():
+        print(f"{name}: {op['calls']} calls, {op['ok']} ok, {op['rejected']} rejected, {op['conflict']} conflicts, "
+              f"p50 {op['p50_ms']}ms, p99 {op['p99_ms']}ms")
+    print(f"Deadlocks: {report['deadlocks']}  Serialization failures: {report['serialization_failures']}  "
+          f"Errors: {report['errors']}")
+    for name, rows in report["invariant_violations"].items():
+        if rows:
+            print(f"INVARIANT VIOLATED - {name}: {len(rows)}")
+            for row in rows[:10]:
+                print(f"  {row}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+
+    if not report["ok"]:
+        sys.exit(1)
+    print("All booking invariants hold.")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,17 @@
+import os
+import sys
+
+from sqlalchemy.sql import visitors
+from sqlalchemy.sql.selectable import CTE
+
+# Run from anywhere: the services import their siblings from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Helpers for asserting on statement objects rather than rendered SQL
+def set_clause(stmt) -> dict:
+    """Column name -> value of an INSERT/UPDATE's SET clause."""
+    return {column.key: value for column, value in stmt._values.items()}
+
+def ctes(stmt) -> dict:
+    """Every CTE reachable from `stmt`, by name."""
+    return {element.name: element for element in visitors.iterate(stmt) if isinstance(element, CTE)}
\ No newline at end of file
@@ -0,0 +1,23 @@
+from datetime import date, time
+
+from sqlalchemy import and_
+
+from conftest import set_clause
+from models.group_class import GroupClass, ClassStatus
+from services.admin_service import reschedule_statement
+
+def test_reschedule_is_a_compare_and_set_on_the_version():
+    stmt = reschedule_statement(7, 3, date(2030, 1, 7), time(9), time(10))
+    assert stmt.table.name == GroupClass.__tablename__
+    assert stmt.whereclause.compare(and_(
+        GroupClass.class_id == 7,
+        GroupClass.version_id == 3,
+        GroupClass.status == ClassStatus.SCHEDULED
+    ))
+
+    values = set_clause(stmt)
+    assert values["scheduled_date"].value == date(2030, 1, 7)
+    assert values["start_time"].value == time(9)
+    assert values["end_time"].value == time(10)
+    assert values["version_id"].compare(GroupClass.version_id + 1)
+    assert "class_id" in stmt.exported_columns
\ No newline at end of file
@@ -0,0 +1,13 @@
+import pytest
+
+from models.class_enrollment import AttendanceStatus
+from services.attendance import parse_attendance_status
+
+def test_parse_attendance_status():
+    assert parse_attendance_status("Attended") is AttendanceStatus.ATTENDED
+    assert parse_attendance_status("Absent") is AttendanceStatus.ABSENT
+
+@pytest.mark.parametrize("status", ["Registered", "Cancelled", "attended", ""])
+def test_parse_attendance_status_rejects_other_values(status):
+    with pytest.raises(ValueError, match="Valid options"):
+        parse_attendance_status(status)
\ No newline at end of file
@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+
+from services import cache
+from services.cache import LRUCache
+
+def test_evicts_least_recently_used():
+    lru = LRUCache(max_size=2)
+    lru.put("a", 1)
+    lru.put("b", 2)
+    assert lru.get("a") == 1  # "b" is now the oldest
+    lru.put("c", 3)
+    assert lru.get("b") is None
+    assert lru.get("a") == 1 and lru.get("c") == 3
+    assert len(lru) == 2
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    lru = LRUCache(max_size=4, ttl=10)
+    lru.put("a", 1)
+    now[0] += 10
+    assert lru.get("a") == 1
+    now[0] += 0.5
+    assert lru.get("a", "missing") == "missing"
+    assert len(lru) == 0
+
+def test_pop_and_clear():
+    lru = LRUCache()
+    lru.put("a", 1)
+    lru.put("b", 2)
+    lru.pop("a")
+    lru.pop("unknown")
+    assert lru.get("a") is None and lru.get("b") == 2
+    lru.clear()
+    assert len(lru) == 0
+
+def test_zero_size_disables_caching():
+    lru = LRUCache(max_size=0)
+    lru.put("a", 1)
+    assert lru.get("a") is None
+    assert len(lru) == 0
\ No newline at end of file
@@ -0,0 +1,42 @@
+from datetime import date, timedelta
+
+import pytest
+
+from services.class_series import parse_weekdays, expand_weekly, MAX_OCCURRENCES
+
+MONDAY = date(2030, 1, 7)
+
+def days(*offsets):
+    return [MONDAY + timedelta(days=d) for d in offsets]
+
+def test_parse_weekdays_accepts_names_and_numbers():
+    assert parse_weekdays("Mon, wed,FRI") == [0, 2, 4]
+    assert parse_weekdays("6,0,0") == [0, 6]
+    assert parse_weekdays("Tuesday,") == [1]
+
+@pytest.mark.parametrize("text", ["", " , ", "7", "xyz"])
+def test_parse_weekdays_rejects_bad_input(text):
+    with pytest.raises(ValueError):
+        parse_weekdays(text)
+
+def test_expand_weekly_defaults_to_the_start_weekday():
+    assert expand_weekly(MONDAY, count=3) == days(0, 7, 14)
+
+def test_expand_weekly_until_end_date():
+    assert expand_weekly(MONDAY, end_date=MONDAY + timedelta(days=13), weekdays=[2, 0]) == days(0, 2, 7, 9)
+
+def test_expand_weekly_skips_days_before_the_start():
+    wednesday = MONDAY + timedelta(days=2)
+    assert expand_weekly(wednesday, weekdays=[0, 2], count=3) == days(2, 7, 9)
+
+def test_expand_weekly_every_other_week():
+    assert expand_weekly(MONDAY, count=3, interval_weeks=2) == days(0, 14, 28)
+
+def test_expand_weekly_is_capped():
+    assert len(expand_weekly(MONDAY, count=MAX_OCCURRENCES * 2)) == MAX_OCCURRENCES
+
+def test_expand_weekly_needs_an_end_and_a_valid_interval():
+    with pytest.raises(ValueError):
+        expand_weekly(MONDAY)
+    with pytest.raises(ValueError):
+        expand_weekly(MONDAY, count=2, interval_weeks=0)
\ No newline at end of file
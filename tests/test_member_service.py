@@ -0,0 +1,22 @@
+from sqlalchemy import and_
+
+from conftest import set_clause
+from models.group_class import GroupClass, ClassStatus
+from services.member_service import seat_claim_statement
+
+def test_seat_claim_only_fits_under_capacity():
+    stmt = seat_claim_statement(7)
+    assert stmt.table.name == GroupClass.__tablename__
+    assert stmt.whereclause.compare(and_(
+        GroupClass.class_id == 7,
+        GroupClass.enrolled_count + 1 <= GroupClass.capacity,
+        GroupClass.status == ClassStatus.SCHEDULED
+    ))
+    assert list(stmt.exported_columns.keys()) == ["class_id"]
+
+def test_seat_claim_takes_several_seats():
+    stmt = seat_claim_statement(7, seats=3)
+    values = set_clause(stmt)
+    assert list(values) == ["enrolled_count"]
+    assert values["enrolled_count"].compare(GroupClass.enrolled_count + 3)
+    assert stmt.whereclause.clauses[1].compare(GroupClass.enrolled_count + 3 <= GroupClass.capacity)
\ No newline at end of file
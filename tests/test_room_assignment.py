@@ -0,0 +1,53 @@
+from datetime import date, time
+
+from services.room_assignment import ClassRequest, partition_rooms, parse_class_request
+
+DAY = date(2030, 1, 7)
+ROOMS = [(3, 30, "Spin"), (2, 20, "Studio"), (1, 10, "Studio")]
+
+def request(trainer_id, start, end, capacity=10, room_type=None, name="Yoga"):
+    return ClassRequest(name, trainer_id, DAY, time(start), time(end), capacity, room_type)
+
+def rooms_of(results):
+    return [r["room_id"] for r in results]
+
+def test_back_to_back_classes_share_the_smallest_room():
+    assert rooms_of(partition_rooms([request(1, 9, 10), request(2, 10, 11)], ROOMS, [])) == [1, 1]
+
+def test_overlapping_classes_open_the_next_smallest_room():
+    results = partition_rooms([request(1, 9, 10), request(2, 9, 11)], ROOMS, [])
+    assert rooms_of(results) == [1, 2]
+
+def test_results_keep_input_order():
+    late, early = request(1, 11, 12, name="Late"), request(2, 9, 10, name="Early")
+    results = partition_rooms([late, early], ROOMS, [])
+    assert [r["request"] for r in results] == [late, early]
+
+def test_capacity_and_room_type_limit_the_choice():
+    results = partition_rooms([request(1, 9, 10, capacity=25), request(2, 9, 10, capacity=25, room_type="Studio")],
+                              ROOMS, [])
+    assert rooms_of(results) == [3, None]
+    assert results[1]["reason"] == "No room with enough capacity is free."
+
+def test_existing_bookings_block_rooms_and_trainers():
+    bookings = [(1, 99, DAY, time(9), time(10)), (3, 5, DAY, time(12), time(13))]
+    results = partition_rooms([request(1, 9, 10), request(5, 12, 14)], ROOMS, bookings)
+    assert rooms_of(results) == [2, None]
+    assert results[1]["reason"] == "Trainer is already booked at this time."
+
+def test_overlapping_existing_bookings_still_block():
+    # The short booking starts last but the long one is still running at 11:00
+    bookings = [(1, 7, DAY, time(9), time(12)), (1, 8, DAY, time(10), time(10, 30)),
+                (2, 5, DAY, time(9), time(12)), (2, 5, DAY, time(10), time(10, 30))]
+    results = partition_rooms([request(1, 11, 12), request(5, 11, 12, capacity=15)], ROOMS, bookings)
+    assert rooms_of(results) == [3, None]
+    assert results[1]["reason"] == "Trainer is already booked at this time."
+
+def test_invalid_times_are_rejected():
+    result = partition_rooms([request(1, 10, 9)], ROOMS, [])[0]
+    assert result["room_id"] is None and result["reason"] == "End time must be after start time."
+
+def test_parse_class_request():
+    req = parse_class_request({"class_name": " Spin ", "trainer_id": "3", "date": "2030-01-07",
+                               "start_time": "09:00", "end_time": "10:00", "capacity": "12", "room_type": ""})
+    assert req == ClassRequest("Spin", 3, DAY, time(9), time(10), 12, None)
\ No newline at end of file
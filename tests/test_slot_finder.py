@@ -0,0 +1,40 @@
+from collections import namedtuple
+from datetime import date, time, datetime
+
+from services.slot_finder import free_gaps, available_slots
+
+Busy = namedtuple("Busy", "resource resource_id scheduled_date start_time end_time")
+
+DAY = date(2030, 1, 7)
+OPEN, CLOSE = 6 * 60, 22 * 60
+
+def test_free_gaps_without_bookings_is_the_whole_day():
+    assert free_gaps([], [], OPEN, CLOSE) == [(OPEN, CLOSE)]
+
+def test_free_gaps_merges_overlapping_trainer_and_room_bookings():
+    assert free_gaps([(480, 540)], [(510, 600)], OPEN, CLOSE) == [(OPEN, 480), (600, CLOSE)]
+
+def test_free_gaps_clips_to_opening_hours():
+    assert free_gaps([(OPEN, 420)], [(1300, 1400)], OPEN, CLOSE) == [(420, 1300)]
+    assert free_gaps([(300, 1400)], [], OPEN, CLOSE) == []
+
+def _rows():
+    return [
+        Busy("room", 1, None, None, None),
+        Busy("room", 2, None, None, None),
+        Busy("trainer", 5, DAY, time(6), time(20)),
+        Busy("room", 1, DAY, time(20), time(21)),
+    ]
+
+def _summary(slots):
+    return [(s["date"], s["start_time"], s["room_id"]) for s in slots]
+
+def test_available_slots_offer_the_tightest_room():
+    slots = available_slots(_rows(), 5, DAY, DAY, now=datetime(2030, 1, 1))
+    assert _summary(slots) == [(DAY, time(20), 2), (DAY, time(20, 30), 2), (DAY, time(21), 1)]
+    assert slots[0]["end_time"] == time(21) and slots[0]["trainer_id"] == 5
+
+def test_available_slots_skip_the_past_and_respect_limit():
+    slots = available_slots(_rows(), 5, DAY, DAY, now=datetime(2030, 1, 7, 20, 10))
+    assert _summary(slots) == [(DAY, time(20, 30), 2), (DAY, time(21), 1)]
+    assert len(available_slots(_rows(), 5, DAY, DAY, limit=1, now=datetime(2030, 1, 1))) == 1
\ No newline at end of file
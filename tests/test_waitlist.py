@@ -0,0 +1,32 @@
+from sqlalchemy import and_, func, select
+
+from conftest import ctes
+from models.group_class import GroupClass, ClassStatus
+from models.class_waitlist import WaitlistEntry
+from services.waitlist import promotion_statement
+
+def test_promotion_is_a_single_statement_over_all_steps():
+    stmt = promotion_statement(7)
+    assert set(ctes(stmt)) == {"seats", "next_up", "promoted", "enrolled", "counted"}
+    assert [from_.name for from_ in stmt.get_final_froms()] == ["enrolled"]
+    assert list(stmt.selected_columns.keys()) == ["member_id"]
+
+def test_promotion_takes_no_more_than_the_free_seats():
+    found = ctes(promotion_statement(7))
+    next_up = found["next_up"].element
+    assert next_up.whereclause.compare(WaitlistEntry.class_id == 7)
+    # A missing or cancelled class yields no seats row: LIMIT 0, never LIMIT NULL
+    assert next_up._limit_clause.compare(
+        func.coalesce(select(func.greatest(found["seats"].c.free, 0)).scalar_subquery(), 0)
+    )
+    assert next_up._for_update_arg.skip_locked
+
+def test_promotion_only_touches_scheduled_classes():
+    found = ctes(promotion_statement(7))
+    scheduled = and_(GroupClass.class_id == 7, GroupClass.status == ClassStatus.SCHEDULED)
+    seats = found["seats"].element
+    assert seats.whereclause.compare(scheduled)
+    assert seats._for_update_arg is not None
+    counted = found["counted"].element
+    assert counted.table.name == GroupClass.__tablename__
+    assert counted.whereclause.compare(scheduled)
\ No newline at end of file